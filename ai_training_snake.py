@@ -2,9 +2,9 @@ import pygame
 import random
 import sys
 import os
+from collections import OrderedDict, deque
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, NamedTuple, Tuple
 
 # Initialize Pygame
 pygame.init()
@@ -14,6 +14,13 @@ WINDOW_SIZE = 800
 GRID_SIZE = 20
 GRID_WIDTH = WINDOW_SIZE // GRID_SIZE
 GRID_HEIGHT = WINDOW_SIZE // GRID_SIZE
+
+# Fast-forward time scales (None = as fast as possible)
+TIME_SCALES = (1, 2, 10, None)
+MAX_FRAME_TIME = 250      # ms of real time banked per frame at most
+FAST_FRAME_BUDGET = 12    # ms of simulation per frame at max speed
+FAST_DRAW_INTERVAL = 100  # ms between drawn frames at max speed
+TEXT_CACHE_SIZE = 128     # rendered text surfaces kept for reuse
 FPS = 60
 
 # Colors
@@ -32,44 +39,84 @@ class DataType(Enum):
     QUALITY = ("Quality Data", YELLOW, 3, 0.2)
     PREMIUM = ("Premium Data", RED, 10, 0.1)
 
-@dataclass
-class Position:
+class Position(NamedTuple):
+    """Immutable grid cell, hashes and compares like an (x, y) tuple"""
     x: int
     y: int
-    
-    def __iter__(self):
-        return iter((self.x, self.y))
-    
-    def __eq__(self, other):
-        if isinstance(other, tuple):
-            return (self.x, self.y) == other
-        return self.x == other.x and self.y == other.y
+
+# Directions (shared instances, so steering never allocates)
+UP = Position(0, -1)
+DOWN = Position(0, 1)
+LEFT = Position(-1, 0)
+RIGHT = Position(1, 0)
 
 class GameState(Enum):
     PLAYING = "playing"
     GAME_OVER = "game_over"
     PAUSED = "paused"
 
+class FreeCells:
+    """Empty grid cells with O(1) add, remove and uniform random pick"""
+    
+    def __init__(self, width, height):
+        self.cells = [Position(x, y) for x in range(width) for y in range(height)]
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+    
+    def __len__(self):
+        return len(self.cells)
+    
+    def add(self, cell):
+        """Mark a cell as empty"""
+        if cell not in self.index:
+            self.index[cell] = len(self.cells)
+            self.cells.append(cell)
+    
+    def remove(self, cell):
+        """Mark a cell as taken (off-board cells are ignored)"""
+        i = self.index.pop(cell, None)
+        if i is None:
+            return
+        # Swap the last cell into the hole so removal stays O(1)
+        last = self.cells.pop()
+        if i < len(self.cells):
+            self.cells[i] = last
+            self.index[last] = i
+    
+    def choice(self, rng=random):
+        """Uniformly random empty cell"""
+        return self.cells[rng.randrange(len(self.cells))]
+
 class AISnake:
     def __init__(self):
         self.reset()
     
     def reset(self):
         center_x, center_y = GRID_WIDTH // 2, GRID_HEIGHT // 2
-        self.body = [Position(center_x, center_y)]
-        self.direction = Position(1, 0)
+        self.body = deque([Position(center_x, center_y)])
+        self.occupied = set(self.body)
+        self.hit_self = False
+        self.free_cells = FreeCells(GRID_WIDTH, GRID_HEIGHT)
+        self.free_cells.remove(self.body[0])
+        self.direction = RIGHT
         self.iq = 0
         self.growth_pending = 0
         
     def move(self):
         head = self.body[0]
         new_head = Position(head.x + self.direction.x, head.y + self.direction.y)
-        self.body.insert(0, new_head)
         
         if self.growth_pending > 0:
             self.growth_pending -= 1
         else:
-            self.body.pop()
+            tail = self.body.pop()
+            self.occupied.discard(tail)
+            self.free_cells.add(tail)
+        
+        # Tail moves out first, so following it is not a collision
+        self.hit_self = new_head in self.occupied
+        self.occupied.add(new_head)
+        self.free_cells.remove(new_head)
+        self.body.appendleft(new_head)
     
     def grow(self, amount: int = 1):
         self.growth_pending += amount
@@ -89,7 +136,7 @@ class AISnake:
             return True
             
         # Check self collision (AI confusion)
-        return head in self.body[1:]
+        return self.hit_self
     
     def get_brightness(self) -> int:
         return min(255, 50 + self.iq * 2)
@@ -98,23 +145,21 @@ class DataPoint:
     def __init__(self):
         self.respawn()
         
-    def respawn(self, avoid_positions: List[Position] = None):
-        if avoid_positions is None:
-            avoid_positions = []
-            
+    def respawn(self, free_cells: FreeCells = None, rng: random.Random = random) -> bool:
         # Find valid position
-        attempts = 0
-        while attempts < 100:  # Prevent infinite loop
+        if free_cells is None:
             self.position = Position(
-                random.randint(0, GRID_WIDTH - 1),
-                random.randint(0, GRID_HEIGHT - 1)
+                rng.randint(0, GRID_WIDTH - 1),
+                rng.randint(0, GRID_HEIGHT - 1)
             )
-            if self.position not in avoid_positions:
-                break
-            attempts += 1
+        elif free_cells:
+            self.position = free_cells.choice(rng)
+        else:
+            # Snake fills the board - nowhere left to spawn
+            return False
         
         # Choose data type based on probability
-        rand = random.random()
+        rand = rng.random()
         cumulative_prob = 0
         
         for data_type in DataType:
@@ -124,6 +169,8 @@ class DataPoint:
                 break
         else:
             self.type = DataType.BASIC
+        
+        return True
     
     @property
     def color(self):
@@ -138,7 +185,7 @@ class DataPoint:
         return self.type.value[0]
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed: int = None):
         self.screen = pygame.display.set_mode((WINDOW_SIZE, WINDOW_SIZE))
         pygame.display.set_caption("AI Training Snake - Grow Your Neural Network!")
         self.clock = pygame.time.Clock()
@@ -149,16 +196,42 @@ class Game:
         self.state = GameState.PLAYING
         self.high_score = self.load_high_score()
         self.flash_timer = 0
-        
+        self.time_scale = TIME_SCALES[0]
+        self.last_draw_time = 0
+        self.autopilot = None
+        self.background = None
+        self.background_size = None
+        self.text_cache = OrderedDict()
+        self.gradient = []
+        self.gradient_key = None
+        self.drawn = None
+        
+        self.seed_game(seed)
         self.reset_game()
     
     def reset_game(self):
         self.ai_snake = AISnake()
         self.data_point = DataPoint()
-        self.data_point.respawn(self.ai_snake.body)
+        self.data_point.respawn(self.ai_snake.free_cells, self.rng)
         self.state = GameState.PLAYING
+        self.board_full = False
         self.move_timer = 0
-        self.last_move_time = pygame.time.get_ticks()
+        self.last_update_time = pygame.time.get_ticks()
+        self.move_accumulator = 0
+    
+    def seed_game(self, seed: int = None):
+        """Give this run its own gameplay RNG stream"""
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        # Gameplay stream only, so seed + input log replay the run exactly
+        seeder = random.Random(self.seed)
+        self.rng = random.Random(seeder.getrandbits(64))
+        self.input_log: List[Tuple[int, Tuple[int, int]]] = []
+        self.moves = 0
+    
+    def steer(self, direction: Position):
+        """Change direction, logging it against the move count for replays"""
+        self.input_log.append((self.moves, direction))
+        self.ai_snake.change_direction(direction)
     
     def load_high_score(self) -> int:
         try:
@@ -182,24 +255,30 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if self.state == GameState.PLAYING:
                     if event.key == pygame.K_UP:
-                        self.ai_snake.change_direction(Position(0, -1))
+                        self.steer(UP)
                     elif event.key == pygame.K_DOWN:
-                        self.ai_snake.change_direction(Position(0, 1))
+                        self.steer(DOWN)
                     elif event.key == pygame.K_LEFT:
-                        self.ai_snake.change_direction(Position(-1, 0))
+                        self.steer(LEFT)
                     elif event.key == pygame.K_RIGHT:
-                        self.ai_snake.change_direction(Position(1, 0))
+                        self.steer(RIGHT)
                     elif event.key == pygame.K_SPACE:
                         self.state = GameState.PAUSED
+                    elif event.key == pygame.K_f:
+                        self.cycle_time_scale()
+                    elif event.key == pygame.K_p:
+                        self.toggle_autopilot()
                 
                 elif self.state == GameState.GAME_OVER:
                     if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
+                        self.seed_game(self.seed + 1)
                         self.reset_game()
                 
                 elif self.state == GameState.PAUSED:
                     if event.key == pygame.K_SPACE:
                         self.state = GameState.PLAYING
-                        self.last_move_time = pygame.time.get_ticks()
+                        self.last_update_time = pygame.time.get_ticks()
+                        self.move_accumulator = 0
         
         return True
     
@@ -208,25 +287,74 @@ class Game:
             return
         
         current_time = pygame.time.get_ticks()
+        frame_time = min(current_time - self.last_update_time, MAX_FRAME_TIME)
+        self.last_update_time = current_time
+        
+        # Fixed timestep: bank scaled real time and spend it in whole moves,
+        # so game speed no longer depends on the frame rate
+        if self.time_scale is None:
+            # As fast as possible: simulate for a slice of every frame
+            deadline = current_time + FAST_FRAME_BUDGET
+            while self.state == GameState.PLAYING and pygame.time.get_ticks() < deadline:
+                self.tick()
+        else:
+            self.move_accumulator += frame_time * self.time_scale
+            while self.state == GameState.PLAYING and self.move_accumulator >= self.move_interval():
+                self.move_accumulator -= self.move_interval()
+                self.tick()
         
+        self.flash_timer += 1
+    
+    def move_interval(self):
         # Calculate move speed based on IQ (gets faster as AI gets smarter)
         base_speed = 150  # milliseconds between moves
         speed_bonus = min(self.ai_snake.iq * 5, 100)  # max 100ms faster
-        move_interval = max(50, base_speed - speed_bonus)
-        
-        if current_time - self.last_move_time >= move_interval:
-            self.ai_snake.move()
-            self.last_move_time = current_time
-            
-            # Check data consumption
-            if self.ai_snake.body[0] == self.data_point.position:
-                self.consume_data()
-            
-            # Check death
-            if self.ai_snake.is_dead():
-                self.game_over()
-        
-        self.flash_timer += 1
+        return max(50, base_speed - speed_bonus)
+    
+    def tick(self):
+        if self.autopilot:
+            direction = self.autopilot.next_direction(self.ai_snake, self.data_point.position)
+            if direction and direction != self.ai_snake.direction:
+                self.steer(Position(*direction))
+        
+        self.ai_snake.move()
+        self.moves += 1
+        
+        # Check data consumption
+        if self.ai_snake.body[0] == self.data_point.position:
+            self.consume_data()
+        
+        # Check death
+        if self.ai_snake.is_dead():
+            self.game_over()
+    
+    def toggle_autopilot(self):
+        # Imported on first use: the autopilots need NumPy, playing by hand does not
+        from snake_autopilot import Autopilot, HamiltonianAutopilot
+        
+        if self.autopilot is None:
+            self.autopilot = Autopilot(GRID_WIDTH, GRID_HEIGHT)
+        elif isinstance(self.autopilot, Autopilot):
+            # Perfect play - the cycle is cached on disk after the first run
+            self.autopilot = HamiltonianAutopilot(GRID_WIDTH, GRID_HEIGHT)
+        else:
+            self.autopilot = None
+    
+    def cycle_time_scale(self):
+        """Fast-forward: x1 -> x2 -> x10 -> as fast as possible"""
+        i = TIME_SCALES.index(self.time_scale)
+        self.time_scale = TIME_SCALES[(i + 1) % len(TIME_SCALES)]
+        self.move_accumulator = 0
+    
+    def frame_due(self):
+        """Draw every frame, but throttle drawing while running flat out"""
+        if self.time_scale is not None or self.state != GameState.PLAYING:
+            return True
+        current_time = pygame.time.get_ticks()
+        if current_time - self.last_draw_time >= FAST_DRAW_INTERVAL:
+            self.last_draw_time = current_time
+            return True
+        return False
     
     def consume_data(self):
         points = self.data_point.points
@@ -234,7 +362,10 @@ class Game:
         self.ai_snake.grow(1 if points <= 3 else 2)  # Premium data grows more
         
         # Respawn data away from snake
-        self.data_point.respawn(self.ai_snake.body)
+        if not self.data_point.respawn(self.ai_snake.free_cells, self.rng):
+            # Neural network fills the whole board - training mastered!
+            self.board_full = True
+            self.game_over()
     
     def game_over(self):
         if self.ai_snake.iq > self.high_score:
@@ -244,37 +375,77 @@ class Game:
         self.state = GameState.GAME_OVER
     
     def draw(self):
-        self.screen.fill(BLACK)
-        
-        if self.state == GameState.PLAYING or self.state == GameState.PAUSED:
-            self.draw_game()
+        if self.state != GameState.PLAYING:
+            # Pause and game over cover the board: redraw the whole screen
+            self.screen.fill(BLACK)
+            
             if self.state == GameState.PAUSED:
+                self.draw_game()
                 self.draw_pause_overlay()
-        elif self.state == GameState.GAME_OVER:
-            self.draw_game_over()
+            else:
+                self.draw_game_over()
+            
+            pygame.display.flip()
+            self.drawn = None
+            return
         
-        pygame.display.flip()
+        # Otherwise repaint and update only the regions that changed
+        scene = self.build_scene()
+        dirty = self.dirty_rects(scene)
+        items = list(scene.values())
+        rects = [rect for rect, _ in items]
+        for area in dirty:
+            self.screen.set_clip(area)
+            self.screen.blit(self.get_background(), (0, 0))
+            for i in area.collidelistall(rects):
+                self.draw_item(*items[i])
+        self.screen.set_clip(None)
+        pygame.display.update(dirty)
+        self.drawn = scene
+    
+    def dirty_rects(self, scene):
+        """Rects of items that appeared, changed or disappeared since the last frame"""
+        if self.drawn is None:
+            return [self.screen.get_rect()]
+        dirty = []
+        for key, item in scene.items():
+            old = self.drawn.get(key)
+            if old != item:
+                dirty.append(item[0])
+                if old is not None and old[0] != item[0]:
+                    dirty.append(old[0])
+        dirty += [rect for key, (rect, _) in self.drawn.items() if key not in scene]
+        return dirty
+    
+    def get_background(self):
+        """Grid prerendered once, rebuilt only if the window size changes"""
+        size = self.screen.get_size()
+        if self.background is None or self.background_size != size:
+            self.background = pygame.Surface(size).convert()
+            self.background.fill(BLACK)
+            for x in range(0, WINDOW_SIZE, GRID_SIZE):
+                pygame.draw.line(self.background, (20, 20, 20), (x, 0), (x, WINDOW_SIZE))
+            for y in range(0, WINDOW_SIZE, GRID_SIZE):
+                pygame.draw.line(self.background, (20, 20, 20), (0, y), (WINDOW_SIZE, y))
+            self.background_size = size
+        return self.background
     
     def draw_game(self):
         # Draw grid (subtle)
-        for x in range(0, WINDOW_SIZE, GRID_SIZE):
-            pygame.draw.line(self.screen, (20, 20, 20), (x, 0), (x, WINDOW_SIZE))
-        for y in range(0, WINDOW_SIZE, GRID_SIZE):
-            pygame.draw.line(self.screen, (20, 20, 20), (0, y), (WINDOW_SIZE, y))
+        self.screen.blit(self.get_background(), (0, 0))
         
-        # Draw snake with gradient effect
-        brightness = self.ai_snake.get_brightness()
+        for rect, look in self.build_scene().values():
+            self.draw_item(rect, look)
+    
+    def build_scene(self):
+        """Everything on the board and HUD as {key: (rect, look)}, in drawing order"""
+        scene = {}
+        
+        # Snake with gradient effect
+        gradient = self.get_gradient(len(self.ai_snake.body))
         
         for i, segment in enumerate(self.ai_snake.body):
-            # Head is brightest, tail is darkest
-            segment_brightness = brightness - (i * 5)
-            segment_brightness = max(30, segment_brightness)
-            
-            color = (
-                segment_brightness // 4,
-                segment_brightness // 2,
-                min(255, segment_brightness)
-            )
+            color = gradient[i]
             
             rect = pygame.Rect(
                 segment.x * GRID_SIZE + 1,
@@ -283,13 +454,9 @@ class Game:
                 GRID_SIZE - 2
             )
             
-            pygame.draw.rect(self.screen, color, rect)
-            
-            # Add glow effect to head
-            if i == 0:
-                pygame.draw.rect(self.screen, WHITE, rect, 2)
+            scene[segment] = (rect, ("segment", color, i == 0))
         
-        # Draw data point with flash effect for premium data
+        # Data point with flash effect for premium data
         data_rect = pygame.Rect(
             self.data_point.position.x * GRID_SIZE + 1,
             self.data_point.position.y * GRID_SIZE + 1,
@@ -297,40 +464,107 @@ class Game:
             GRID_SIZE - 2
         )
         
-        pygame.draw.rect(self.screen, self.data_point.color, data_rect)
-        
         # Flash effect for high-value data
-        if (self.data_point.points >= 10 and 
-            self.flash_timer % 30 < 15):
-            pygame.draw.rect(self.screen, WHITE, data_rect, 3)
+        flashing = self.data_point.points >= 10 and self.flash_timer % 30 < 15
+        scene["data"] = (data_rect, ("data", self.data_point.color, flashing))
         
-        # Draw UI
-        self.draw_ui()
+        self.add_ui(scene)
+        return scene
+    
+    def get_gradient(self, length):
+        """Segment colors from head to tail, rebuilt only when the IQ brightness changes"""
+        key = self.ai_snake.get_brightness()
+        if self.gradient_key != key:
+            brightness = key
+            self.gradient = []
+            segment_brightness = None
+            # Head is brightest, tail is darkest
+            while segment_brightness != 30:
+                segment_brightness = max(30, brightness - (len(self.gradient) * 5))
+                self.gradient.append((
+                    segment_brightness // 4,
+                    segment_brightness // 2,
+                    min(255, segment_brightness)
+                ))
+            self.gradient_key = key
+        # Past the darkest step every segment shares the tail color
+        if len(self.gradient) < length:
+            self.gradient += [self.gradient[-1]] * (length - len(self.gradient))
+        return self.gradient
+    
+    def add_text(self, scene, key, font, text, color, **position):
+        """Add a HUD string to the scene, placed like Surface.get_rect(**position)"""
+        rect = pygame.Rect((0, 0), font.size(text))
+        for name, value in position.items():
+            setattr(rect, name, value)
+        scene[key] = (rect, ("text", font, text, color))
     
-    def draw_ui(self):
+    def add_ui(self, scene):
         # IQ Score (main score)
-        iq_text = self.font_large.render(f"IQ: {self.ai_snake.iq}", True, WHITE)
-        self.screen.blit(iq_text, (20, 20))
+        self.add_text(scene, "iq", self.font_large, f"IQ: {self.ai_snake.iq}", WHITE, topleft=(20, 20))
         
         # High Score
         if self.high_score > 0:
-            high_text = self.font_medium.render(f"Best: {self.high_score}", True, LIGHT_GRAY)
-            self.screen.blit(high_text, (20, 70))
+            self.add_text(scene, "best", self.font_medium, f"Best: {self.high_score}", LIGHT_GRAY, topleft=(20, 70))
         
         # Current data info
         data_info = f"{self.data_point.name} (+{self.data_point.points})"
-        data_text = self.font_small.render(data_info, True, self.data_point.color)
-        self.screen.blit(data_text, (20, WINDOW_SIZE - 60))
+        self.add_text(scene, "data_info", self.font_small, data_info, self.data_point.color,
+                      topleft=(20, WINDOW_SIZE - 60))
         
         # Snake length
-        length_text = self.font_small.render(f"Neural Network Size: {len(self.ai_snake.body)}", True, GRAY)
-        self.screen.blit(length_text, (20, WINDOW_SIZE - 30))
+        self.add_text(scene, "size", self.font_small, f"Neural Network Size: {len(self.ai_snake.body)}", GRAY,
+                      topleft=(20, WINDOW_SIZE - 30))
         
         # Controls hint
-        controls_text = self.font_small.render("SPACE: Pause | Arrow Keys: Control", True, GRAY)
-        text_rect = controls_text.get_rect()
-        text_rect.topright = (WINDOW_SIZE - 20, 20)
-        self.screen.blit(controls_text, text_rect)
+        self.add_text(scene, "controls", self.font_small, "SPACE: Pause | F: Speed | P: Autopilot | Arrow Keys: Control", GRAY,
+                      topright=(WINDOW_SIZE - 20, 20))
+        
+        # Fast-forward indicator
+        if self.time_scale != 1:
+            speed = f"x{self.time_scale}" if self.time_scale else "MAX"
+            self.add_text(scene, "speed", self.font_small, f"Speed: {speed}", YELLOW,
+                          topright=(WINDOW_SIZE - 20, 45))
+        
+        # Autopilot indicator
+        if self.autopilot:
+            self.add_text(scene, "autopilot", self.font_small, f"Autopilot: {self.autopilot.name}", YELLOW,
+                          topright=(WINDOW_SIZE - 20, 70))
+    
+    def draw_item(self, rect, look):
+        """Draw one scene item"""
+        kind = look[0]
+        if kind == "segment":
+            pygame.draw.rect(self.screen, look[1], rect)
+            
+            if look[2]:  # Add glow effect to head
+                self.draw_outline(WHITE, rect, 2)
+        elif kind == "data":
+            pygame.draw.rect(self.screen, look[1], rect)
+            if look[2]:
+                self.draw_outline(WHITE, rect, 3)
+        elif kind == "text":
+            self.screen.blit(self.render_text(look[1], look[2], look[3]), rect)
+    
+    def draw_outline(self, color, rect, width):
+        """Same pixels as pygame.draw.rect(..., width), but safe under a clip rect"""
+        self.screen.fill(color, (rect.x, rect.y, rect.width, width))
+        self.screen.fill(color, (rect.x, rect.bottom - width, rect.width, width))
+        self.screen.fill(color, (rect.x, rect.y, width, rect.height))
+        self.screen.fill(color, (rect.right - width, rect.y, width, rect.height))
+    
+    def render_text(self, font, text, color):
+        """Rendered text surface, cached by (font, text, color) with least recently used eviction"""
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+            if len(self.text_cache) > TEXT_CACHE_SIZE:
+                self.text_cache.popitem(last=False)
+        else:
+            self.text_cache.move_to_end(key)
+        return surface
     
     def draw_pause_overlay(self):
         # Semi-transparent overlay
@@ -340,11 +574,11 @@ class Game:
         self.screen.blit(overlay, (0, 0))
         
         # Pause text
-        pause_text = self.font_large.render("PAUSED", True, WHITE)
+        pause_text = self.render_text(self.font_large, "PAUSED", WHITE)
         text_rect = pause_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2))
         self.screen.blit(pause_text, text_rect)
         
-        resume_text = self.font_medium.render("Press SPACE to resume", True, LIGHT_GRAY)
+        resume_text = self.render_text(self.font_medium, "Press SPACE to resume", LIGHT_GRAY)
         text_rect = resume_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 + 50))
         self.screen.blit(resume_text, text_rect)
     
@@ -353,32 +587,32 @@ class Game:
         self.screen.fill(DARK_BLUE)
         
         # Game Over text
-        game_over_text = self.font_large.render("TRAINING COMPLETE", True, WHITE)
+        game_over_text = self.render_text(self.font_large, "TRAINING MASTERED" if self.board_full else "TRAINING COMPLETE", WHITE)
         text_rect = game_over_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 - 100))
         self.screen.blit(game_over_text, text_rect)
         
         # Final IQ
-        iq_text = self.font_medium.render(f"Final IQ: {self.ai_snake.iq}", True, YELLOW)
+        iq_text = self.render_text(self.font_medium, f"Final IQ: {self.ai_snake.iq}", YELLOW)
         text_rect = iq_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 - 50))
         self.screen.blit(iq_text, text_rect)
         
         # High score message
         if self.ai_snake.iq == self.high_score and self.high_score > 0:
-            new_record_text = self.font_medium.render("NEW RECORD!", True, GREEN)
+            new_record_text = self.render_text(self.font_medium, "NEW RECORD!", GREEN)
             text_rect = new_record_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2))
             self.screen.blit(new_record_text, text_rect)
         elif self.high_score > 0:
-            best_text = self.font_medium.render(f"Best: {self.high_score}", True, LIGHT_GRAY)
+            best_text = self.render_text(self.font_medium, f"Best: {self.high_score}", LIGHT_GRAY)
             text_rect = best_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2))
             self.screen.blit(best_text, text_rect)
         
         # Restart instruction
-        restart_text = self.font_medium.render("Press SPACE or ENTER to restart", True, WHITE)
+        restart_text = self.render_text(self.font_medium, "Press SPACE or ENTER to restart", WHITE)
         text_rect = restart_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 + 80))
         self.screen.blit(restart_text, text_rect)
         
         # Neural network size
-        size_text = self.font_small.render(f"Max Neural Network Size: {len(self.ai_snake.body)}", True, GRAY)
+        size_text = self.render_text(self.font_small, f"Max Neural Network Size: {len(self.ai_snake.body)}", GRAY)
         text_rect = size_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 + 120))
         self.screen.blit(size_text, text_rect)
     
@@ -387,7 +621,8 @@ class Game:
         while running:
             running = self.handle_input()
             self.update()
-            self.draw()
+            if self.frame_due():
+                self.draw()
             self.clock.tick(FPS)
         
         pygame.quit()
@@ -396,7 +631,9 @@ class Game:
 def main():
     """Main entry point for the AI Training Snake game."""
     try:
-        game = Game()
+        # Optional seed: the same seed replays the same data spawns
+        seed = int(sys.argv[1]) if len(sys.argv) > 1 else None
+        game = Game(seed)
         game.run()
     except Exception as e:
         print(f"Game error: {e}")
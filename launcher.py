@@ -74,22 +74,22 @@ def run_game(game_file):
         print(f"\n❌ Error running game: {e}")
 
 def check_dependencies():
-    """Check if pygame is installed"""
-    try:
-        import pygame
-        print("✅ Pygame detected!")
-        return True
-    except ImportError:
-        print("❌ Pygame not found!")
-        print("\n📦 Installing pygame...")
+    """Check that pygame and numpy are installed, installing them if not"""
+    for package, name in (("pygame", "Pygame"), ("numpy", "NumPy")):
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pygame"])
-            print("✅ Pygame installed successfully!")
-            return True
-        except subprocess.CalledProcessError:
-            print("❌ Failed to install pygame automatically.")
-            print("Please run: pip install pygame")
-            return False
+            __import__(package)
+            print(f"✅ {name} detected!")
+        except ImportError:
+            print(f"❌ {name} not found!")
+            print(f"\n📦 Installing {package}...")
+            try:
+                subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+                print(f"✅ {name} installed successfully!")
+            except subprocess.CalledProcessError:
+                print(f"❌ Failed to install {package} automatically.")
+                print(f"Please run: pip install {package}")
+                return False
+    return True
 
 def main():
     """Main launcher function"""
@@ -1,6 +1,7 @@
 import pygame
 import random
 import sys
+from collections import OrderedDict, deque
 
 pygame.init()
 
@@ -10,6 +11,13 @@ GRID_SIZE = 20
 GRID_WIDTH = WINDOW_SIZE // GRID_SIZE
 GRID_HEIGHT = WINDOW_SIZE // GRID_SIZE
 
+# Fast-forward time scales (None = as fast as possible)
+TIME_SCALES = (1, 2, 10, None)
+MAX_FRAME_TIME = 250      # ms of real time banked per frame at most
+FAST_FRAME_BUDGET = 12    # ms of simulation per frame at max speed
+FAST_DRAW_INTERVAL = 100  # ms between drawn frames at max speed
+TEXT_CACHE_SIZE = 128     # rendered text surfaces kept for reuse
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -20,12 +28,47 @@ GRAY = (128, 128, 128)
 LIGHT_GRAY = (200, 200, 200)
 DARK_BLUE = (0, 50, 100)
 
+class FreeCells:
+    """Empty grid cells with O(1) add, remove and uniform random pick"""
+    
+    def __init__(self, width, height):
+        self.cells = [(x, y) for x in range(width) for y in range(height)]
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+    
+    def __len__(self):
+        return len(self.cells)
+    
+    def add(self, cell):
+        """Mark a cell as empty"""
+        if cell not in self.index:
+            self.index[cell] = len(self.cells)
+            self.cells.append(cell)
+    
+    def remove(self, cell):
+        """Mark a cell as taken (off-board cells are ignored)"""
+        i = self.index.pop(cell, None)
+        if i is None:
+            return
+        # Swap the last cell into the hole so removal stays O(1)
+        last = self.cells.pop()
+        if i < len(self.cells):
+            self.cells[i] = last
+            self.index[last] = i
+    
+    def choice(self, rng=random):
+        """Uniformly random empty cell"""
+        return self.cells[rng.randrange(len(self.cells))]
+
 class AISnake:
     def __init__(self):
         self.reset()
         
     def reset(self):
-        self.body = [(GRID_WIDTH//2, GRID_HEIGHT//2)]
+        self.body = deque([(GRID_WIDTH//2, GRID_HEIGHT//2)])
+        self.occupied = set(self.body)
+        self.hit_self = False
+        self.free_cells = FreeCells(GRID_WIDTH, GRID_HEIGHT)
+        self.free_cells.remove(self.body[0])
         self.direction = (1, 0)
         self.iq = 0
         self.growth_pending = 0
@@ -33,12 +76,19 @@ class AISnake:
     def move(self):
         head = self.body[0]
         new_head = (head[0] + self.direction[0], head[1] + self.direction[1])
-        self.body.insert(0, new_head)
         
         if self.growth_pending > 0:
             self.growth_pending -= 1
         else:
-            self.body.pop()
+            tail = self.body.pop()
+            self.occupied.discard(tail)
+            self.free_cells.add(tail)
+        
+        # Tail moves out first, so following it is not a collision
+        self.hit_self = new_head in self.occupied
+        self.occupied.add(new_head)
+        self.free_cells.remove(new_head)
+        self.body.appendleft(new_head)
         
     def grow(self, segments=1):
         self.growth_pending += segments
@@ -57,7 +107,7 @@ class AISnake:
             return True
             
         # Hit self = AI got confused
-        return head in self.body[1:]
+        return self.hit_self
     
     def get_brightness(self):
         return min(255, 50 + self.iq * 2)
@@ -66,19 +116,17 @@ class DataPoint:
     def __init__(self):
         self.respawn()
         
-    def respawn(self, avoid_positions=None):
-        if avoid_positions is None:
-            avoid_positions = []
-            
-        attempts = 0
-        while attempts < 100:
-            self.x = random.randint(0, GRID_WIDTH-1)
-            self.y = random.randint(0, GRID_HEIGHT-1)
-            if (self.x, self.y) not in avoid_positions:
-                break
-            attempts += 1
+    def respawn(self, free_cells=None, rng=random):
+        if free_cells is None:
+            self.x = rng.randint(0, GRID_WIDTH-1)
+            self.y = rng.randint(0, GRID_HEIGHT-1)
+        elif free_cells:
+            self.x, self.y = free_cells.choice(rng)
+        else:
+            # Snake fills the board - nowhere left to spawn
+            return False
             
-        rand = random.random()
+        rand = rng.random()
         if rand < 0.7:
             self.type = "basic"
             self.color = GREEN
@@ -94,9 +142,11 @@ class DataPoint:
             self.color = RED
             self.points = 10
             self.name = "Premium Data"
+            
+        return True
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed=None):
         self.screen = pygame.display.set_mode((WINDOW_SIZE, WINDOW_SIZE))
         pygame.display.set_caption("AI Training Snake - Grow Your Neural Network!")
         
@@ -108,14 +158,40 @@ class Game:
         self.high_score = self.load_high_score()
         self.paused = False
         self.game_over = False
+        self.board_full = False
         self.flash_timer = 0
-        
+        self.time_scale = TIME_SCALES[0]
+        self.last_draw_time = 0
+        self.autopilot = None
+        self.background = None
+        self.background_size = None
+        self.text_cache = OrderedDict()
+        self.gradient = []
+        self.gradient_key = None
+        self.drawn = None
+        
+        self.seed_game(seed)
         self.ai_snake = AISnake()
         self.data_point = DataPoint()
-        self.data_point.respawn(self.ai_snake.body)
-        
-        self.last_move_time = pygame.time.get_ticks()
-        
+        self.data_point.respawn(self.ai_snake.free_cells, self.rng)
+        
+        self.last_update_time = pygame.time.get_ticks()
+        self.move_accumulator = 0
+        
+    def seed_game(self, seed=None):
+        """Give this run its own gameplay RNG stream"""
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        # Gameplay stream only, so seed + input log replay the run exactly
+        seeder = random.Random(self.seed)
+        self.rng = random.Random(seeder.getrandbits(64))
+        self.input_log = []
+        self.moves = 0
+    
+    def steer(self, direction):
+        """Change direction, logging it against the move count for replays"""
+        self.input_log.append((self.moves, direction))
+        self.ai_snake.change_direction(direction)
+    
     def load_high_score(self):
         try:
             with open("high_score.txt", "r") as f:
@@ -138,20 +214,25 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if not self.game_over and not self.paused:
                     if event.key == pygame.K_UP:
-                        self.ai_snake.change_direction((0, -1))
+                        self.steer((0, -1))
                     elif event.key == pygame.K_DOWN:
-                        self.ai_snake.change_direction((0, 1))
+                        self.steer((0, 1))
                     elif event.key == pygame.K_LEFT:
-                        self.ai_snake.change_direction((-1, 0))
+                        self.steer((-1, 0))
                     elif event.key == pygame.K_RIGHT:
-                        self.ai_snake.change_direction((1, 0))
+                        self.steer((1, 0))
                     elif event.key == pygame.K_SPACE:
                         self.paused = True
+                    elif event.key == pygame.K_f:
+                        self.cycle_time_scale()
+                    elif event.key == pygame.K_p:
+                        self.toggle_autopilot()
                         
                 elif self.paused:
                     if event.key == pygame.K_SPACE:
                         self.paused = False
-                        self.last_move_time = pygame.time.get_ticks()
+                        self.last_update_time = pygame.time.get_ticks()
+                        self.move_accumulator = 0
                         
                 elif self.game_over:
                     if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
@@ -160,36 +241,89 @@ class Game:
         return True
     
     def restart_game(self):
+        self.seed_game(self.seed + 1)
         self.ai_snake.reset()
-        self.data_point.respawn(self.ai_snake.body)
+        self.data_point.respawn(self.ai_snake.free_cells, self.rng)
         self.game_over = False
+        self.board_full = False
         self.paused = False
-        self.last_move_time = pygame.time.get_ticks()
+        self.last_update_time = pygame.time.get_ticks()
+        self.move_accumulator = 0
     
     def update(self):
         if self.game_over or self.paused:
             return
             
         current_time = pygame.time.get_ticks()
+        frame_time = min(current_time - self.last_update_time, MAX_FRAME_TIME)
+        self.last_update_time = current_time
+        
+        # Fixed timestep: bank scaled real time and spend it in whole moves,
+        # so game speed no longer depends on the frame rate
+        if self.time_scale is None:
+            # As fast as possible: simulate for a slice of every frame
+            deadline = current_time + FAST_FRAME_BUDGET
+            while not self.game_over and pygame.time.get_ticks() < deadline:
+                self.tick()
+        else:
+            self.move_accumulator += frame_time * self.time_scale
+            while not self.game_over and self.move_accumulator >= self.move_interval():
+                self.move_accumulator -= self.move_interval()
+                self.tick()
         
+        self.flash_timer += 1
+    
+    def move_interval(self):
         # Speed increases with IQ
         base_speed = 150
         speed_increase = min(self.ai_snake.iq * 3, 100)
-        move_interval = max(60, base_speed - speed_increase)
-        
-        if current_time - self.last_move_time >= move_interval:
-            self.ai_snake.move()
-            self.last_move_time = current_time
-            
-            # Check data consumption
-            if self.ai_snake.body[0] == (self.data_point.x, self.data_point.y):
-                self.consume_data()
-            
-            # Check death
-            if self.ai_snake.is_dead():
-                self.handle_game_over()
-        
-        self.flash_timer += 1
+        return max(60, base_speed - speed_increase)
+    
+    def tick(self):
+        if self.autopilot:
+            direction = self.autopilot.next_direction(self.ai_snake, (self.data_point.x, self.data_point.y))
+            if direction and direction != self.ai_snake.direction:
+                self.steer(direction)
+        
+        self.ai_snake.move()
+        self.moves += 1
+        
+        # Check data consumption
+        if self.ai_snake.body[0] == (self.data_point.x, self.data_point.y):
+            self.consume_data()
+        
+        # Check death
+        if self.ai_snake.is_dead():
+            self.handle_game_over()
+    
+    def toggle_autopilot(self):
+        """Steering: you -> BFS autopilot -> Hamiltonian autopilot -> you"""
+        # Imported on first use: the autopilots need NumPy, playing by hand does not
+        from snake_autopilot import Autopilot, HamiltonianAutopilot
+        
+        if self.autopilot is None:
+            self.autopilot = Autopilot(GRID_WIDTH, GRID_HEIGHT)
+        elif isinstance(self.autopilot, Autopilot):
+            # Perfect play - the cycle is cached on disk after the first run
+            self.autopilot = HamiltonianAutopilot(GRID_WIDTH, GRID_HEIGHT)
+        else:
+            self.autopilot = None
+    
+    def cycle_time_scale(self):
+        """Fast-forward: x1 -> x2 -> x10 -> as fast as possible"""
+        i = TIME_SCALES.index(self.time_scale)
+        self.time_scale = TIME_SCALES[(i + 1) % len(TIME_SCALES)]
+        self.move_accumulator = 0
+    
+    def frame_due(self):
+        """Draw every frame, but throttle drawing while running flat out"""
+        if self.time_scale is not None or self.game_over or self.paused:
+            return True
+        current_time = pygame.time.get_ticks()
+        if current_time - self.last_draw_time >= FAST_DRAW_INTERVAL:
+            self.last_draw_time = current_time
+            return True
+        return False
     
     def consume_data(self):
         points = self.data_point.points
@@ -199,7 +333,10 @@ class Game:
         growth = 2 if points >= 10 else 1
         self.ai_snake.grow(growth)
         
-        self.data_point.respawn(self.ai_snake.body)
+        if not self.data_point.respawn(self.ai_snake.free_cells, self.rng):
+            # Neural network fills the whole board - training mastered!
+            self.board_full = True
+            self.handle_game_over()
     
     def handle_game_over(self):
         if self.ai_snake.iq > self.high_score:
@@ -207,39 +344,82 @@ class Game:
             self.save_high_score()
             print(f"🎉 NEW HIGH SCORE: {self.ai_snake.iq} IQ! 🎉")
         else:
-            print(f"Training Complete! Final IQ: {self.ai_snake.iq} (Best: {self.high_score})")
+            print(f"Training Complete! Final IQ: {self.ai_snake.iq} (Best: {self.high_score}, Seed: {self.seed})")
         
         self.game_over = True
     
     def draw(self):
-        self.screen.fill(BLACK)
-        
-        if not self.game_over:
-            self.draw_game()
-            if self.paused:
+        if self.game_over or self.paused:
+            # Pause and game over cover the board: redraw the whole screen
+            self.screen.fill(BLACK)
+            
+            if not self.game_over:
+                self.draw_game()
                 self.draw_pause_overlay()
-        else:
-            self.draw_game_over_screen()
+            else:
+                self.draw_game_over_screen()
             
-        pygame.display.flip()
+            pygame.display.flip()
+            self.drawn = None
+            return
+        
+        # Otherwise repaint and update only the regions that changed
+        scene = self.build_scene()
+        dirty = self.dirty_rects(scene)
+        items = list(scene.values())
+        rects = [rect for rect, _ in items]
+        for area in dirty:
+            self.screen.set_clip(area)
+            self.screen.blit(self.get_background(), (0, 0))
+            for i in area.collidelistall(rects):
+                self.draw_item(*items[i])
+        self.screen.set_clip(None)
+        pygame.display.update(dirty)
+        self.drawn = scene
+    
+    def dirty_rects(self, scene):
+        """Rects of items that appeared, changed or disappeared since the last frame"""
+        if self.drawn is None:
+            return [self.screen.get_rect()]
+        dirty = []
+        for key, item in scene.items():
+            old = self.drawn.get(key)
+            if old != item:
+                dirty.append(item[0])
+                if old is not None and old[0] != item[0]:
+                    dirty.append(old[0])
+        dirty += [rect for key, (rect, _) in self.drawn.items() if key not in scene]
+        return dirty
+    
+    def get_background(self):
+        """Grid prerendered once, rebuilt only if the window size changes"""
+        size = self.screen.get_size()
+        if self.background is None or self.background_size != size:
+            self.background = pygame.Surface(size).convert()
+            self.background.fill(BLACK)
+            for x in range(0, WINDOW_SIZE, GRID_SIZE):
+                pygame.draw.line(self.background, (20, 20, 20), (x, 0), (x, WINDOW_SIZE))
+            for y in range(0, WINDOW_SIZE, GRID_SIZE):
+                pygame.draw.line(self.background, (20, 20, 20), (0, y), (WINDOW_SIZE, y))
+            self.background_size = size
+        return self.background
     
     def draw_game(self):
         # Draw grid
-        for x in range(0, WINDOW_SIZE, GRID_SIZE):
-            pygame.draw.line(self.screen, (20, 20, 20), (x, 0), (x, WINDOW_SIZE))
-        for y in range(0, WINDOW_SIZE, GRID_SIZE):
-            pygame.draw.line(self.screen, (20, 20, 20), (0, y), (WINDOW_SIZE, y))
+        self.screen.blit(self.get_background(), (0, 0))
+        
+        for rect, look in self.build_scene().values():
+            self.draw_item(rect, look)
+    
+    def build_scene(self):
+        """Everything on the board and HUD as {key: (rect, look)}, in drawing order"""
+        scene = {}
         
-        # Draw snake with brightness
-        brightness = self.ai_snake.get_brightness()
+        # Snake with brightness
+        gradient = self.get_gradient(len(self.ai_snake.body))
         
         for i, segment in enumerate(self.ai_snake.body):
-            segment_brightness = max(30, brightness - (i * 3))
-            color = (
-                segment_brightness // 4,
-                segment_brightness // 2, 
-                min(255, segment_brightness)
-            )
+            color = gradient[i]
             
             rect = pygame.Rect(
                 segment[0] * GRID_SIZE + 1,
@@ -248,12 +428,9 @@ class Game:
                 GRID_SIZE - 2
             )
             
-            pygame.draw.rect(self.screen, color, rect)
-            
-            if i == 0:  # Head outline
-                pygame.draw.rect(self.screen, WHITE, rect, 2)
+            scene[segment] = (rect, ("segment", color, i == 0))
         
-        # Draw data
+        # Data
         data_rect = pygame.Rect(
             self.data_point.x * GRID_SIZE + 1,
             self.data_point.y * GRID_SIZE + 1,
@@ -261,40 +438,107 @@ class Game:
             GRID_SIZE - 2
         )
         
-        pygame.draw.rect(self.screen, self.data_point.color, data_rect)
-        
         # Flash premium data
-        if (self.data_point.points >= 10 and 
-            self.flash_timer % 30 < 15):
-            pygame.draw.rect(self.screen, WHITE, data_rect, 3)
+        flashing = self.data_point.points >= 10 and self.flash_timer % 30 < 15
+        scene["data"] = (data_rect, ("data", self.data_point.color, flashing))
         
-        self.draw_ui()
+        self.add_ui(scene)
+        return scene
+    
+    def get_gradient(self, length):
+        """Segment colors from head to tail, rebuilt only when the IQ brightness changes"""
+        key = self.ai_snake.get_brightness()
+        if self.gradient_key != key:
+            brightness = key
+            self.gradient = []
+            segment_brightness = None
+            while segment_brightness != 30:
+                segment_brightness = max(30, brightness - (len(self.gradient) * 3))
+                self.gradient.append((
+                    segment_brightness // 4,
+                    segment_brightness // 2, 
+                    min(255, segment_brightness)
+                ))
+            self.gradient_key = key
+        # Past the darkest step every segment shares the tail color
+        if len(self.gradient) < length:
+            self.gradient += [self.gradient[-1]] * (length - len(self.gradient))
+        return self.gradient
     
-    def draw_ui(self):
+    def add_text(self, scene, key, font, text, color, **position):
+        """Add a HUD string to the scene, placed like Surface.get_rect(**position)"""
+        rect = pygame.Rect((0, 0), font.size(text))
+        for name, value in position.items():
+            setattr(rect, name, value)
+        scene[key] = (rect, ("text", font, text, color))
+    
+    def add_ui(self, scene):
         # IQ score
-        iq_text = self.font_large.render(f"IQ: {self.ai_snake.iq}", True, WHITE)
-        self.screen.blit(iq_text, (20, 20))
+        self.add_text(scene, "iq", self.font_large, f"IQ: {self.ai_snake.iq}", WHITE, topleft=(20, 20))
         
         # High score
         if self.high_score > 0:
-            high_text = self.font_medium.render(f"Best: {self.high_score}", True, LIGHT_GRAY)
-            self.screen.blit(high_text, (20, 70))
+            self.add_text(scene, "best", self.font_medium, f"Best: {self.high_score}", LIGHT_GRAY, topleft=(20, 70))
         
         # Data info
         data_info = f"{self.data_point.name} (+{self.data_point.points})"
-        data_text = self.font_small.render(data_info, True, self.data_point.color)
-        self.screen.blit(data_text, (20, WINDOW_SIZE - 60))
+        self.add_text(scene, "data_info", self.font_small, data_info, self.data_point.color,
+                      topleft=(20, WINDOW_SIZE - 60))
         
         # Network size
-        size_text = self.font_small.render(f"Neural Network Size: {len(self.ai_snake.body)}", True, GRAY)
-        self.screen.blit(size_text, (20, WINDOW_SIZE - 30))
+        self.add_text(scene, "size", self.font_small, f"Neural Network Size: {len(self.ai_snake.body)}", GRAY,
+                      topleft=(20, WINDOW_SIZE - 30))
         
         # Controls
-        controls = "Arrow Keys: Move | SPACE: Pause"
-        controls_text = self.font_small.render(controls, True, GRAY)
-        text_rect = controls_text.get_rect()
-        text_rect.topright = (WINDOW_SIZE - 20, 20)
-        self.screen.blit(controls_text, text_rect)
+        controls = "Arrow Keys: Move | SPACE: Pause | F: Speed | P: Autopilot"
+        self.add_text(scene, "controls", self.font_small, controls, GRAY,
+                      topright=(WINDOW_SIZE - 20, 20))
+        
+        # Fast-forward indicator
+        if self.time_scale != 1:
+            speed = f"x{self.time_scale}" if self.time_scale else "MAX"
+            self.add_text(scene, "speed", self.font_small, f"Speed: {speed}", YELLOW,
+                          topright=(WINDOW_SIZE - 20, 45))
+        
+        # Autopilot indicator
+        if self.autopilot:
+            self.add_text(scene, "autopilot", self.font_small, f"Autopilot: {self.autopilot.name}", YELLOW,
+                          topright=(WINDOW_SIZE - 20, 70))
+    
+    def draw_item(self, rect, look):
+        """Draw one scene item"""
+        kind = look[0]
+        if kind == "segment":
+            pygame.draw.rect(self.screen, look[1], rect)
+            
+            if look[2]:  # Head outline
+                self.draw_outline(WHITE, rect, 2)
+        elif kind == "data":
+            pygame.draw.rect(self.screen, look[1], rect)
+            if look[2]:
+                self.draw_outline(WHITE, rect, 3)
+        elif kind == "text":
+            self.screen.blit(self.render_text(look[1], look[2], look[3]), rect)
+    
+    def draw_outline(self, color, rect, width):
+        """Same pixels as pygame.draw.rect(..., width), but safe under a clip rect"""
+        self.screen.fill(color, (rect.x, rect.y, rect.width, width))
+        self.screen.fill(color, (rect.x, rect.bottom - width, rect.width, width))
+        self.screen.fill(color, (rect.x, rect.y, width, rect.height))
+        self.screen.fill(color, (rect.right - width, rect.y, width, rect.height))
+    
+    def render_text(self, font, text, color):
+        """Rendered text surface, cached by (font, text, color) with least recently used eviction"""
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+            if len(self.text_cache) > TEXT_CACHE_SIZE:
+                self.text_cache.popitem(last=False)
+        else:
+            self.text_cache.move_to_end(key)
+        return surface
     
     def draw_pause_overlay(self):
         overlay = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE))
@@ -302,39 +546,39 @@ class Game:
         overlay.fill(BLACK)
         self.screen.blit(overlay, (0, 0))
         
-        pause_text = self.font_large.render("TRAINING PAUSED", True, WHITE)
+        pause_text = self.render_text(self.font_large, "TRAINING PAUSED", WHITE)
         text_rect = pause_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2))
         self.screen.blit(pause_text, text_rect)
         
-        resume_text = self.font_medium.render("Press SPACE to resume", True, LIGHT_GRAY)
+        resume_text = self.render_text(self.font_medium, "Press SPACE to resume", LIGHT_GRAY)
         text_rect = resume_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 + 50))
         self.screen.blit(resume_text, text_rect)
     
     def draw_game_over_screen(self):
         self.screen.fill(DARK_BLUE)
         
-        title_text = self.font_large.render("AI TRAINING COMPLETE", True, WHITE)
+        title_text = self.render_text(self.font_large, "AI TRAINING MASTERED" if self.board_full else "AI TRAINING COMPLETE", WHITE)
         text_rect = title_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 - 120))
         self.screen.blit(title_text, text_rect)
         
-        final_iq_text = self.font_medium.render(f"Final IQ: {self.ai_snake.iq}", True, YELLOW)
+        final_iq_text = self.render_text(self.font_medium, f"Final IQ: {self.ai_snake.iq}", YELLOW)
         text_rect = final_iq_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 - 70))
         self.screen.blit(final_iq_text, text_rect)
         
         if self.ai_snake.iq == self.high_score and self.high_score > 0:
-            record_text = self.font_medium.render("🎉 NEW RECORD! 🎉", True, GREEN)
+            record_text = self.render_text(self.font_medium, "🎉 NEW RECORD! 🎉", GREEN)
             text_rect = record_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 - 20))
             self.screen.blit(record_text, text_rect)
         elif self.high_score > 0:
-            best_text = self.font_medium.render(f"Personal Best: {self.high_score}", True, LIGHT_GRAY)
+            best_text = self.render_text(self.font_medium, f"Personal Best: {self.high_score}", LIGHT_GRAY)
             text_rect = best_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 - 20))
             self.screen.blit(best_text, text_rect)
         
-        size_text = self.font_small.render(f"Max Neural Network Size: {len(self.ai_snake.body)} neurons", True, GRAY)
+        size_text = self.render_text(self.font_small, f"Max Neural Network Size: {len(self.ai_snake.body)} neurons", GRAY)
         text_rect = size_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 + 30))
         self.screen.blit(size_text, text_rect)
         
-        restart_text = self.font_medium.render("Press SPACE or ENTER to restart training", True, WHITE)
+        restart_text = self.render_text(self.font_medium, "Press SPACE or ENTER to restart training", WHITE)
         text_rect = restart_text.get_rect(center=(WINDOW_SIZE//2, WINDOW_SIZE//2 + 80))
         self.screen.blit(restart_text, text_rect)
     
@@ -344,7 +588,8 @@ class Game:
         while running:
             running = self.handle_input()
             self.update()
-            self.draw()
+            if self.frame_due():
+                self.draw()
             self.clock.tick(60)
         
         pygame.quit()
@@ -356,6 +601,8 @@ def main():
     print("Controls:")
     print("  ⬆️⬇️⬅️➡️ Arrow Keys - Move your AI")
     print("  SPACE - Pause/Resume")
+    print("  F - Fast-forward (x2, x10, max)")
+    print("  P - Autopilot (BFS, Hamiltonian, off)")
     print("  SPACE/ENTER - Restart after game over")
     print()
     print("Data Types:")
@@ -370,7 +617,9 @@ def main():
     print()
     
     try:
-        game = Game()
+        # Optional seed: the same seed replays the same data spawns
+        seed = int(sys.argv[1]) if len(sys.argv) > 1 else None
+        game = Game(seed)
         game.run()
     except Exception as e:
         print(f"❌ Game error: {e}")
@@ -0,0 +1,355 @@
+"""
+AI Training Snake - Autopilot
+Breadth-first path planning to the data point with the planned path
+cached across ticks, and a Hamiltonian-cycle player that fills any
+board with an even side. Both drive the AISnake of any edition or a
+headless game.
+"""
+
+import os
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT, DIRECTIONS, SnakeSim
+from snake_reach import ReachabilityOracle
+
+# Hamiltonian cycles are saved here, one file per board size
+CYCLE_CACHE_DIR = "cycle_cache"
+# Only cut across the cycle while the snake is shorter than this share of it
+SHORTCUT_LIMIT = 0.5
+# Free cells kept between the head and the tail after a shortcut (plus growth)
+SHORTCUT_MARGIN = 4
+
+class Autopilot:
+    """Shortest safe path to the data point, replanned only when needed.
+
+    next_direction(snake, food) works with any edition's AISnake (body,
+    occupied, direction, growth_pending) and returns an (x, y) direction, or
+    None to keep going. An Autopilot is also a snake_rollout policy: call it
+    with a SnakeSim. Steps that the reachability oracle marks unsafe are
+    refused in favour of the move with the most room.
+    """
+
+    name = "BFS"
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        # Neighbours of every cell, built once per board size
+        self.neighbours = {}
+        for x in range(width):
+            for y in range(height):
+                self.neighbours[(x, y)] = [
+                    ((x + dx, y + dy), (dx, dy)) for dx, dy in DIRECTIONS
+                    if 0 <= x + dx < width and 0 <= y + dy < height
+                ]
+        self.path = deque()
+        self.target = None
+        self.replans = 0
+        self.reach = ReachabilityOracle(width, height)
+        # Moves since the snake last ate, to notice an endless tail chase
+        self.idle = 0
+        self.length = 0
+
+    def __call__(self, sim):
+        return self.next_direction(sim.ai_snake, sim.data_point.position)
+
+    def next_direction(self, snake, food):
+        """Direction for the next move"""
+        food = tuple(food)
+        head = snake.body[0]
+        self.reach.sync(snake)
+        length = len(snake.body) + snake.growth_pending
+        if food != self.target or length != self.length:
+            self.idle = 0
+        self.length = length
+        self.idle += 1
+        if not self._path_valid(snake, head, food):
+            self.target = food
+            self.path = self._plan(snake, food)
+            self.replans += 1
+
+        # A whole board's worth of moves without eating means the snake is
+        # going round in circles: refusing the last steps into a tight spot,
+        # or chasing its tail while the data stays walled off
+        stalled = self.idle > self.width * self.height
+        if stalled and self.path and self.path[-1][0] != food:
+            # Step off the tail chase into the most room to reshape the body
+            self.idle = 0
+            step = self.path[0][1]
+            self.path.clear()
+            return self._any_safe_move(snake, head, avoid=step)
+        if self.path and (stalled or self.reach.is_safe(snake, self.path[0][1])):
+            return self.path.popleft()[1]
+        self.path.clear()
+        return self._any_safe_move(snake, head)
+
+    def _path_valid(self, snake, head, food):
+        """Cached path still leads from the current head to the current food"""
+        if not self.path or food != self.target:
+            return False
+        cell, direction = self.path[0]
+        if (head[0] + direction[0], head[1] + direction[1]) != cell:
+            # Someone else steered - the plan no longer starts at the head
+            return False
+        # Planned cells were free when we got there, and only the head moves
+        # into new cells, so just the next step can have become blocked
+        return self._free_next_move(snake, cell)
+
+    def _free_next_move(self, snake, cell):
+        """Cell can be entered on the very next move"""
+        if cell not in snake.occupied:
+            return True
+        # The tail moves out this tick unless the snake is growing
+        return cell == snake.body[-1] and snake.growth_pending == 0
+
+    def _plan(self, snake, goal):
+        """BFS from the head to goal, as a deque of (cell, direction) steps.
+
+        A body segment i cells from the head moves out after len(body) - i
+        moves (plus any pending growth), so the search lets the head enter it
+        from that move on instead of treating the whole body as a wall. If
+        goal is walled off, the same search falls back to chasing the tail.
+        """
+        body = snake.body
+        head = body[0]
+        tail = body[-1]
+        if head not in self.neighbours:
+            return deque()
+        wait = len(body) + snake.growth_pending
+        free_at = {cell: wait - i for i, cell in enumerate(body)}
+        reverse = (-snake.direction[0], -snake.direction[1])
+
+        parents = {head: None}
+        frontier = [head]
+        moves = 0
+        while frontier:
+            moves += 1
+            next_frontier = []
+            for cell in frontier:
+                for neighbour, direction in self.neighbours[cell]:
+                    if neighbour in parents:
+                        continue
+                    if cell == head and direction == reverse:
+                        continue
+                    if free_at.get(neighbour, 0) > moves:
+                        continue
+                    parents[neighbour] = (cell, direction)
+                    if neighbour == goal:
+                        return self._walk_back(parents, goal)
+                    next_frontier.append(neighbour)
+            frontier = next_frontier
+        if tail in parents and tail != head:
+            return self._walk_back(parents, tail)
+        return deque()
+
+    def _walk_back(self, parents, goal):
+        path = deque()
+        cell = goal
+        while parents[cell] is not None:
+            previous, direction = parents[cell]
+            path.appendleft((cell, direction))
+            cell = previous
+        return path
+
+    def _any_safe_move(self, snake, head, avoid=None):
+        """No path anywhere: survive this tick, heading for the most room
+        (and away from the avoided direction if there is another safe move)"""
+        reverse = (-snake.direction[0], -snake.direction[1])
+        best, best_room = None, None
+        for cell, direction in self.neighbours.get(head, ()):
+            if direction != reverse and self._free_next_move(snake, cell):
+                safe = self.reach.is_safe(snake, direction)
+                room = (safe, safe and direction != avoid, self.reach.area(cell))
+                if best_room is None or room > best_room:
+                    best, best_room = direction, room
+        return best
+
+def hamiltonian_cycle(width, height):
+    """Cells of a closed tour over the board, plus the detour for odd boards.
+
+    Returns (cycle, detour). With an even side the tour covers every cell and
+    detour is None. An odd x odd board has no Hamiltonian cycle, so the tour
+    leaves out the corner (width - 1, 0) and detour is (corner, before, skipped,
+    after): stepping before -> corner -> after instead of before -> skipped ->
+    after picks up data on the corner without breaking the cycle order.
+    """
+    if width < 2 or height < 2:
+        raise ValueError(f"no Hamiltonian cycle on a {width}x{height} board")
+    if height % 2 == 0:
+        return _row_cycle(width, height), None
+    if width % 2 == 0:
+        return [(x, y) for y, x in _row_cycle(height, width)], None
+
+    # Odd x odd: tour all but the last column, then splice that column in
+    # two cells at a time where the tour runs up column width - 2
+    cycle = []
+    for x, y in ((x, y) for y, x in _row_cycle(height, width - 1)):
+        cycle.append((x, y))
+        if x == width - 2 and y % 2 == 0 and y > 0:
+            cycle += [(width - 1, y), (width - 1, y - 1)]
+    detour = ((width - 1, 0), (width - 1, 1), (width - 2, 1), (width - 2, 0))
+    return cycle, detour
+
+def _row_cycle(width, height):
+    """Boustrophedon rows, returning up column 0 (height must be even)"""
+    cycle = [(x, 0) for x in range(width)]
+    for y in range(1, height):
+        xs = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        cycle += [(x, y) for x in xs]
+    cycle += [(0, y) for y in range(height - 1, 0, -1)]
+    return cycle
+
+def load_cycle(width, height, cache_dir=CYCLE_CACHE_DIR):
+    """Cycle, detour and shortcut table for a board, computed once and cached.
+
+    The shortcut table has one row per cycle position holding the cycle index
+    of the neighbour in each of DIRECTIONS (-1 off the board or the cycle).
+    """
+    path = os.path.join(cache_dir, f"hamilton_{width}x{height}.npz")
+    try:
+        with np.load(path) as cached:
+            return cached["cycle"], cached["detour"], cached["shortcuts"]
+    except (OSError, KeyError, ValueError):
+        pass
+
+    cycle, detour = hamiltonian_cycle(width, height)
+    index = {cell: i for i, cell in enumerate(cycle)}
+    shortcuts = np.full((len(cycle), len(DIRECTIONS)), -1, dtype=np.int32)
+    for i, (x, y) in enumerate(cycle):
+        for d, (dx, dy) in enumerate(DIRECTIONS):
+            neighbour = index.get((x + dx, y + dy))
+            if neighbour is not None:
+                shortcuts[i, d] = neighbour
+    cycle = np.array(cycle, dtype=np.int32)
+    detour = np.array(detour if detour else (), dtype=np.int32).reshape(-1, 2)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write then rename, so parallel first runs never read half a file
+        partial = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(partial, cycle=cycle, detour=detour, shortcuts=shortcuts)
+        os.replace(partial, path)
+    except OSError:
+        print("Could not save Hamiltonian cycle cache")
+    return cycle, detour, shortcuts
+
+class HamiltonianAutopilot:
+    """Perfect play: follow a Hamiltonian cycle, cutting across it when safe.
+
+    On boards with an even side every cell lies on the cycle and the body
+    always sits in cycle order behind the head, so following the cycle can
+    never crash and eventually fills the board. While the snake is short it
+    skips ahead toward the data point, as long as the jump stays clear of
+    the tail. Same interface as Autopilot.
+
+    An odd x odd board has no Hamiltonian cycle: the cycle misses one corner,
+    which the snake only visits on a detour. It cannot fill such a board and
+    crashes on one of the last data points once it is nearly full length.
+    """
+
+    name = "Hamiltonian"
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, cache_dir=CYCLE_CACHE_DIR):
+        self.width = width
+        self.height = height
+        cycle, detour, shortcuts = load_cycle(width, height, cache_dir)
+        self.cycle = [tuple(cell) for cell in cycle.tolist()]
+        self.index = {cell: i for i, cell in enumerate(self.cycle)}
+        self.moves = [
+            [(k, direction) for k, direction in zip(row, DIRECTIONS) if k >= 0]
+            for row in shortcuts.tolist()
+        ]
+        self.detour = None
+        if len(detour):
+            corner, before, skipped, after = (tuple(cell) for cell in detour.tolist())
+            self.detour = (corner, before, skipped, after)
+            # Body segments on the corner stand in for the cell they replaced
+            self.index[corner] = self.index[skipped]
+
+    def __call__(self, sim):
+        return self.next_direction(sim.ai_snake, sim.data_point.position)
+
+    def next_direction(self, snake, food):
+        """Direction for the next move"""
+        food = tuple(food)
+        head = snake.body[0]
+        if head not in self.index:
+            return None
+        if self.detour:
+            corner, before, skipped, after = self.detour
+            if head == corner:
+                return self._step(head, after)
+            if food == corner:
+                if head == before and (skipped not in snake.occupied or
+                                       len(snake.body) >= len(self.cycle)):
+                    return self._step(head, corner)
+                # Aim for the cell next to the corner
+                food = before
+
+        n = len(self.cycle)
+        h = self.index[head]
+        to_food = (self.index.get(food, h) - h) % n
+        to_tail = (self.index[snake.body[-1]] - h) % n or n
+        shortcuts = len(snake.body) + snake.growth_pending < n * SHORTCUT_LIMIT
+        limit = to_tail - snake.growth_pending - SHORTCUT_MARGIN
+        reverse = (-snake.direction[0], -snake.direction[1])
+
+        best, best_distance = None, 0
+        for k, direction in self.moves[h]:
+            if direction == reverse:
+                continue
+            distance = (k - h) % n
+            # The next cell on the cycle is always safe; jumps must land
+            # short of the data and leave room in front of the tail
+            if distance == 1 or (shortcuts and distance <= to_food and distance < limit):
+                if distance > best_distance:
+                    best, best_distance = direction, distance
+        if best is None and len(snake.body) == 1:
+            # A lone head can't turn back onto the cycle - any cell will do
+            best = min(
+                (move for move in self.moves[h] if move[1] != reverse),
+                key=lambda move: (self.index.get(food, h) - move[0]) % n,
+            )[1]
+        return best
+
+    def _step(self, head, cell):
+        return (cell[0] - head[0], cell[1] - head[1])
+
+def main():
+    """Play seeded autopilot games and report decision times"""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else GRID_WIDTH
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else GRID_HEIGHT
+    cycle = len(sys.argv) > 4 and sys.argv[4] == "cycle"
+    autopilot = HamiltonianAutopilot(width, height) if cycle else Autopilot(width, height)
+    sim = SnakeSim(width, height)
+    ticks = 0
+    worst = 0
+    best_iq = 0
+    total_iq = 0
+    wins = 0
+
+    start = time.perf_counter()
+    for game in range(games):
+        sim.reset(seed=game)
+        while not sim.done and (cycle or sim.ticks < 50000):
+            decision_start = time.perf_counter()
+            direction = autopilot(sim)
+            worst = max(worst, time.perf_counter() - decision_start)
+            sim.step(direction)
+        ticks += sim.ticks
+        best_iq = max(best_iq, sim.ai_snake.iq)
+        total_iq += sim.ai_snake.iq
+        wins += sim.won
+    elapsed = time.perf_counter() - start
+
+    print(f"🧠 {games} {autopilot.name} autopilot games on {width}x{height}, {ticks} ticks in {elapsed:.2f}s")
+    print(f"📊 Average IQ: {total_iq / games:.1f} | Best IQ: {best_iq} | Boards filled: {wins}/{games}")
+    print(f"⚡ {elapsed / ticks * 1000:.3f} ms per move | worst decision {worst * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
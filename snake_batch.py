@@ -0,0 +1,303 @@
+"""
+AI Training Snake - Batched Simulation
+Steps N independent headless games in lockstep with NumPy arrays,
+using the same rules as snake_sim.py.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT, DIRECTIONS, RIGHT, DataType, AILevel
+
+# Direction offsets, indexed like snake_sim.DIRECTIONS (UP, RIGHT, DOWN, LEFT)
+DX = np.array([d[0] for d in DIRECTIONS], dtype=np.int64)
+DY = np.array([d[1] for d in DIRECTIONS], dtype=np.int64)
+RIGHT_INDEX = DIRECTIONS.index(RIGHT)
+
+# DataType and AILevel tables, indexed like the enums
+DATA_POINTS = np.array([data_type.value[2] for data_type in DataType], dtype=np.int64)
+DATA_CUMULATIVE = np.cumsum([data_type.value[3] for data_type in DataType])
+LEVEL_THRESHOLDS = np.array([level.value[0] for level in AILevel], dtype=np.int64)
+
+# Respawn draws pre-drawn per game at a time when every game has its own seed
+SPAWN_BLOCK = 64
+
+class BatchSnakeSim:
+    """N headless games advanced together, one array slot per game.
+
+    All games share one RNG stream seeded by `seed`, so a game's data spawns
+    depend on when the other games eat. Pass `seeds` (one per game) to give
+    every game its own stream instead: then a game plays the same spawns
+    whatever else runs in the batch.
+    """
+
+    def __init__(self, num_games, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None, auto_reset=True,
+                 seeds=None):
+        self.num_games = num_games
+        self.width = width
+        self.height = height
+        self.num_cells = width * height
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+        self.game_rngs = None
+        if seeds is not None:
+            if len(seeds) != num_games:
+                raise ValueError(f"need one seed per game, got {len(seeds)} for {num_games} games")
+            self.game_rngs = [np.random.default_rng(game_seed) for game_seed in seeds]
+            self.spawn_draws = np.zeros((num_games, SPAWN_BLOCK, 2))
+            self.spawn_next = np.full(num_games, SPAWN_BLOCK, dtype=np.int64)
+
+        n, c = num_games, self.num_cells
+        cell_dtype = np.int16 if c < 2**15 else np.int32
+
+        # Body ring buffer per game: head at head_ptr, tail lengths-1 slots behind
+        self.bodies = np.zeros((n, c), dtype=cell_dtype)
+        self.head_ptr = np.zeros(n, dtype=np.int64)
+        self.lengths = np.zeros(n, dtype=np.int64)
+
+        # Free-cell index per game (swap-remove); free_pos is -1 on snake cells
+        self.free_cells = np.zeros((n, c), dtype=cell_dtype)
+        self.free_pos = np.zeros((n, c), dtype=cell_dtype)
+        self.free_count = np.zeros(n, dtype=np.int64)
+
+        self.directions = np.zeros(n, dtype=np.int64)
+        self.food = np.zeros(n, dtype=np.int64)
+        self.food_type = np.zeros(n, dtype=np.int64)
+        self.iq = np.zeros(n, dtype=np.int64)
+        self.growth_pending = np.zeros(n, dtype=np.int64)
+        self.levels = np.zeros(n, dtype=np.int64)
+        self.data_consumed = np.zeros(n, dtype=np.int64)
+        self.premium_consumed = np.zeros(n, dtype=np.int64)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.hungry = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self.won = np.zeros(n, dtype=bool)
+
+        # Stats of each game's last finished episode (survive auto-reset)
+        self.episodes = np.zeros(n, dtype=np.int64)
+        self.final_iq = np.zeros(n, dtype=np.int64)
+        self.final_length = np.zeros(n, dtype=np.int64)
+        self.final_ticks = np.zeros(n, dtype=np.int64)
+        self.final_levels = np.zeros(n, dtype=np.int64)
+        self.final_data_consumed = np.zeros(n, dtype=np.int64)
+        self.final_premium_consumed = np.zeros(n, dtype=np.int64)
+        self.final_won = np.zeros(n, dtype=bool)
+
+        self._cell_range = np.arange(c, dtype=cell_dtype)
+        self.reset()
+
+    def _rows(self, games):
+        """Normalise None, a bool mask or indices to an index array"""
+        if games is None:
+            return np.arange(self.num_games)
+        games = np.asarray(games)
+        if games.dtype == bool:
+            return np.flatnonzero(games)
+        return games.astype(np.int64)
+
+    def reset(self, games=None):
+        """Start new games (all of them by default)"""
+        rows = self._rows(games)
+        if len(rows) == 0:
+            return
+        center = (self.height // 2) * self.width + self.width // 2
+
+        self.free_cells[rows] = self._cell_range
+        self.free_pos[rows] = self._cell_range
+        self.free_count[rows] = self.num_cells
+        self._take(rows, np.full(len(rows), center))
+
+        self.bodies[rows, 0] = center
+        self.head_ptr[rows] = 0
+        self.lengths[rows] = 1
+        self.directions[rows] = RIGHT_INDEX
+        self.iq[rows] = 0
+        self.growth_pending[rows] = 0
+        self.levels[rows] = 0
+        self.data_consumed[rows] = 0
+        self.premium_consumed[rows] = 0
+        self.ticks[rows] = 0
+        self.hungry[rows] = 0
+        self.done[rows] = False
+        self.won[rows] = False
+        self._respawn(rows)
+
+    def _take(self, rows, cells):
+        """Remove free cells from each row's index (one cell per row)"""
+        slots = self.free_pos[rows, cells].astype(np.int64)
+        last_slots = self.free_count[rows] - 1
+        last = self.free_cells[rows, last_slots]
+        self.free_cells[rows, slots] = last
+        self.free_pos[rows, last] = slots
+        self.free_pos[rows, cells] = -1
+        self.free_count[rows] = last_slots
+
+    def _release(self, rows, cells):
+        """Add cells back to each row's free index (one cell per row)"""
+        slots = self.free_count[rows]
+        self.free_cells[rows, slots] = cells
+        self.free_pos[rows, cells] = slots
+        self.free_count[rows] = slots + 1
+
+    def _respawn(self, rows):
+        """DataPoint.respawn for each row: random empty cell and data type"""
+        full = self.free_count[rows] == 0
+        if full.any():
+            # Neural network fills the whole board - training mastered!
+            self.won[rows[full]] = True
+            self.done[rows[full]] = True
+            rows = rows[~full]
+
+        cell_draws, type_draws = self._spawn_draws(rows)
+        picks = (cell_draws * self.free_count[rows]).astype(np.int64)
+        self.food[rows] = self.free_cells[rows, picks]
+        types = np.searchsorted(DATA_CUMULATIVE, type_draws, side="right")
+        self.food_type[rows] = np.minimum(types, len(DATA_POINTS) - 1)
+
+    def _spawn_draws(self, rows):
+        """Uniform draws for each row's respawn: (cell pick, data type)"""
+        if self.game_rngs is None:
+            return self.rng.random(len(rows)), self.rng.random(len(rows))
+
+        # Refill the rows that used up their block from their own stream
+        refill = rows[self.spawn_next[rows] == SPAWN_BLOCK]
+        for row in refill:
+            self.spawn_draws[row] = self.game_rngs[row].random((SPAWN_BLOCK, 2))
+        self.spawn_next[refill] = 0
+
+        draws = self.spawn_draws[rows, self.spawn_next[rows]]
+        self.spawn_next[rows] += 1
+        return draws[:, 0], draws[:, 1]
+
+    def step(self, actions=None):
+        """Advance every running game one move.
+
+        actions holds a DIRECTIONS index per game, or -1 to keep going.
+        Returns (points, ended): IQ consumed this tick and games that just finished.
+        """
+        n, w, c = self.num_games, self.width, self.num_cells
+        points = np.zeros(n, dtype=np.int64)
+        ended = np.zeros(n, dtype=bool)
+
+        alive = np.flatnonzero(~self.done)
+        if len(alive) == 0:
+            return points, ended
+
+        # Change direction, preventing reverse moves
+        if actions is not None:
+            wanted = np.asarray(actions, dtype=np.int64)[alive]
+            turn = (wanted >= 0) & (wanted != (self.directions[alive] + 2) % 4)
+            self.directions[alive[turn]] = wanted[turn]
+
+        d = self.directions[alive]
+        heads = self.bodies[alive, self.head_ptr[alive]].astype(np.int64)
+        x = heads % w + DX[d]
+        y = heads // w + DY[d]
+        inside = (x >= 0) & (x < w) & (y >= 0) & (y < self.height)
+        new_cells = np.where(inside, y * w + x, 0)
+
+        # Only remove tail if not growing
+        growing = self.growth_pending[alive] > 0
+        grow_rows = alive[growing]
+        self.growth_pending[grow_rows] -= 1
+        self.lengths[grow_rows] += 1
+        shrink_rows = alive[~growing]
+        tail_slots = (self.head_ptr[shrink_rows] - self.lengths[shrink_rows] + 1) % c
+        self._release(shrink_rows, self.bodies[shrink_rows, tail_slots])
+
+        # Tail moves out first, so following it is not a collision
+        hit_self = np.zeros(len(alive), dtype=bool)
+        hit_self[inside] = self.free_pos[alive[inside], new_cells[inside]] < 0
+        dead = ~inside | hit_self
+
+        moved = alive[~dead]
+        moved_cells = new_cells[~dead]
+        self.head_ptr[moved] = (self.head_ptr[moved] + 1) % c
+        self.bodies[moved, self.head_ptr[moved]] = moved_cells
+        self._take(moved, moved_cells)
+        self.ticks[alive] += 1
+        self.hungry[alive] += 1
+
+        # Data consumption
+        eaters = moved[moved_cells == self.food[moved]]
+        if len(eaters):
+            gained = DATA_POINTS[self.food_type[eaters]]
+            premium = gained >= 10
+            points[eaters] = gained
+            self.iq[eaters] += gained
+            self.data_consumed[eaters] += 1
+            self.premium_consumed[eaters[premium]] += 1
+            self.levels[eaters] = np.searchsorted(LEVEL_THRESHOLDS, self.iq[eaters], side="right") - 1
+            # Premium data grows more
+            self.growth_pending[eaters] += np.where(premium, 2, 1)
+            self.hungry[eaters] = 0
+            self._respawn(eaters)
+
+        self.done[alive[dead]] = True
+        finished = alive[self.done[alive]]
+        if len(finished):
+            ended[finished] = True
+            self._record_final(finished)
+            if self.auto_reset:
+                self.reset(finished)
+        return points, ended
+
+    def _record_final(self, rows):
+        """Keep the stats of episodes that just ended"""
+        self.episodes[rows] += 1
+        self.final_iq[rows] = self.iq[rows]
+        self.final_length[rows] = self.lengths[rows]
+        self.final_ticks[rows] = self.ticks[rows]
+        self.final_levels[rows] = self.levels[rows]
+        self.final_data_consumed[rows] = self.data_consumed[rows]
+        self.final_premium_consumed[rows] = self.premium_consumed[rows]
+        self.final_won[rows] = self.won[rows]
+
+    def finish(self, games):
+        """End running games early (timeouts), recording them like any other end"""
+        rows = self._rows(games)
+        rows = rows[~self.done[rows]]
+        if len(rows) == 0:
+            return
+        self.done[rows] = True
+        self._record_final(rows)
+        if self.auto_reset:
+            self.reset(rows)
+
+    def starving(self):
+        """Running games that went a whole board's worth of moves without data"""
+        return ~self.done & (self.hungry >= self.num_cells)
+
+    def heads(self):
+        """Head cell index of every game"""
+        return self.bodies[np.arange(self.num_games), self.head_ptr]
+
+    def body(self, game):
+        """(x, y) segments of one game, head first"""
+        slots = (self.head_ptr[game] - np.arange(self.lengths[game])) % self.num_cells
+        cells = self.bodies[game, slots].astype(np.int64)
+        return list(zip((cells % self.width).tolist(), (cells // self.width).tolist()))
+
+def main():
+    """Benchmark batched game steps per second"""
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    batch = BatchSnakeSim(num_games, seed=0)
+    wander = np.random.default_rng(0)
+
+    start = time.perf_counter()
+    finished = 0
+    for _ in range(steps):
+        # Keep going, occasionally turn at random
+        actions = np.where(wander.random(num_games) < 0.1, wander.integers(0, 4, num_games), -1)
+        _, ended = batch.step(actions)
+        finished += int(ended.sum())
+    elapsed = time.perf_counter() - start
+
+    print(f"🧠 {num_games} games x {steps} steps in {elapsed:.2f}s ({finished} games finished)")
+    print(f"⚡ {num_games * steps / elapsed:,.0f} game steps/sec | Best IQ: {batch.final_iq.max()}")
+
+if __name__ == "__main__":
+    main()
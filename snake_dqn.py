@@ -0,0 +1,285 @@
+"""
+AI Training Snake - Deep Q-Learning
+A CPU-only DQN in pure NumPy over SnakeEnv, with a preallocated replay
+ring buffer and a training step that reuses the same arrays every time.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT
+from snake_env import SnakeEnv, BatchSnakeEnv, run_batched
+
+REPLAY_CAPACITY = 20000
+BATCH_SIZE = 32
+HIDDEN = 128
+GAMMA = 0.95
+LEARNING_RATE = 1e-3
+WARMUP_STEPS = 1000
+TARGET_SYNC_STEPS = 1000
+EPSILON_START = 1.0
+EPSILON_END = 0.05
+EPSILON_DECAY_STEPS = 50000
+DEATH_PENALTY = 10.0
+DQN_WEIGHTS_FILE = "dqn_weights.npz"
+EVAL_GAMES = 64
+
+class ReplayBuffer:
+    """Fixed-capacity ring buffer of transitions in preallocated arrays.
+
+    Observations are stored as uint8 (the env planes are 0/1). sample()
+    fills the same batch arrays every call instead of returning new ones.
+    """
+
+    def __init__(self, capacity, obs_shape, batch_size=BATCH_SIZE, seed=None):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.size = 0
+        self.ptr = 0
+        self.rng = np.random.default_rng(seed)
+
+        obs_size = int(np.prod(obs_shape))
+        self.obs = np.zeros((capacity, obs_size), dtype=np.uint8)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_obs = np.zeros((capacity, obs_size), dtype=np.uint8)
+        self.dones = np.zeros(capacity, dtype=np.float32)
+
+        # Minibatch arrays, refilled in place by sample()
+        self.batch_obs = np.zeros((batch_size, obs_size), dtype=np.float32)
+        self.batch_actions = np.zeros(batch_size, dtype=np.int64)
+        self.batch_rewards = np.zeros(batch_size, dtype=np.float32)
+        self.batch_next_obs = np.zeros((batch_size, obs_size), dtype=np.float32)
+        self.batch_dones = np.zeros(batch_size, dtype=np.float32)
+        self._uniform = np.zeros(batch_size)
+        self._indices = np.zeros(batch_size, dtype=np.int64)
+        self._rows = np.zeros((batch_size, obs_size), dtype=np.uint8)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, obs, action, reward, next_obs, done):
+        """Copy one transition into the next slot, overwriting the oldest"""
+        i = self.ptr
+        self.obs[i] = obs.reshape(-1)
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_obs[i] = next_obs.reshape(-1)
+        self.dones[i] = done
+        self.ptr = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def sample(self):
+        """Uniform minibatch, written into the batch_* arrays"""
+        self.rng.random(out=self._uniform)
+        self._uniform *= self.size
+        np.copyto(self._indices, self._uniform, casting="unsafe")
+        np.take(self.obs, self._indices, axis=0, out=self._rows)
+        np.copyto(self.batch_obs, self._rows)
+        np.take(self.next_obs, self._indices, axis=0, out=self._rows)
+        np.copyto(self.batch_next_obs, self._rows)
+        np.take(self.actions, self._indices, out=self.batch_actions)
+        np.take(self.rewards, self._indices, out=self.batch_rewards)
+        np.take(self.dones, self._indices, out=self.batch_dones)
+
+class QNetwork:
+    """Two-layer ReLU MLP with Adam, every intermediate in a fixed buffer"""
+
+    def __init__(self, inputs, actions, hidden=HIDDEN, batch_size=BATCH_SIZE,
+                 learning_rate=LEARNING_RATE, seed=None):
+        rng = np.random.default_rng(seed)
+        self.w1 = (rng.standard_normal((inputs, hidden)) * np.sqrt(2 / inputs)).astype(np.float32)
+        self.b1 = np.zeros(hidden, dtype=np.float32)
+        self.w2 = (rng.standard_normal((hidden, actions)) * np.sqrt(1 / hidden)).astype(np.float32)
+        self.b2 = np.zeros(actions, dtype=np.float32)
+        self.params = (self.w1, self.b1, self.w2, self.b2)
+        self.target = tuple(p.copy() for p in self.params)
+
+        self.learning_rate = learning_rate
+        self.updates = 0
+        self.grads = tuple(np.zeros_like(p) for p in self.params)
+        self.m = tuple(np.zeros_like(p) for p in self.params)
+        self.v = tuple(np.zeros_like(p) for p in self.params)
+        self.scratch = tuple(np.zeros_like(p) for p in self.params)
+
+        b = batch_size
+        self.hidden = np.zeros((b, hidden), dtype=np.float32)
+        self.active = np.zeros((b, hidden), dtype=bool)
+        self.q = np.zeros((b, actions), dtype=np.float32)
+        self.next_hidden = np.zeros((b, hidden), dtype=np.float32)
+        self.next_q = np.zeros((b, actions), dtype=np.float32)
+        self.targets = np.zeros(b, dtype=np.float32)
+        self.not_done = np.zeros(b, dtype=np.float32)
+        self.q_taken = np.zeros(b, dtype=np.float32)
+        self.flat_taken = np.zeros(b, dtype=np.int64)
+        self.row_offsets = np.arange(b, dtype=np.int64) * actions
+        self.dq = np.zeros((b, actions), dtype=np.float32)
+        self.dhidden = np.zeros((b, hidden), dtype=np.float32)
+        # Single-observation buffers for acting
+        self.act_hidden = np.zeros((1, hidden), dtype=np.float32)
+        self.act_q = np.zeros((1, actions), dtype=np.float32)
+        # Transposed views, made once (the arrays behind them never move)
+        self.hidden_t = self.hidden.T
+        self.w2_t = self.w2.T
+
+    def forward(self, x, params, hidden, q):
+        w1, b1, w2, b2 = params
+        np.dot(x, w1, out=hidden)
+        hidden += b1
+        np.maximum(hidden, 0, out=hidden)
+        np.dot(hidden, w2, out=q)
+        q += b2
+        return q
+
+    def best_action(self, obs):
+        """Greedy action for one flattened (1, inputs) observation"""
+        return int(self.forward(obs, self.params, self.act_hidden, self.act_q).argmax())
+
+    def train_batch(self, replay, gamma=GAMMA):
+        """One DQN step on replay's current minibatch"""
+        x = replay.batch_obs
+        # Targets from the frozen network: r + gamma * max_a' Q(s', a') unless done
+        self.forward(replay.batch_next_obs, self.target, self.next_hidden, self.next_q)
+        self.next_q.max(axis=1, out=self.targets)
+        np.subtract(1, replay.batch_dones, out=self.not_done)
+        self.targets *= self.not_done
+        self.targets *= gamma
+        self.targets += replay.batch_rewards
+
+        # Q(s, a) for the actions taken, TD error clipped (Huber gradient)
+        self.forward(x, self.params, self.hidden, self.q)
+        np.add(self.row_offsets, replay.batch_actions, out=self.flat_taken)
+        np.take(self.q, self.flat_taken, out=self.q_taken)
+        self.q_taken -= self.targets
+        np.clip(self.q_taken, -1, 1, out=self.q_taken)
+        self.q_taken /= len(self.q_taken)
+        self.dq.fill(0)
+        np.put(self.dq, self.flat_taken, self.q_taken)
+
+        # Backprop through both layers into the preallocated grads
+        gw1, gb1, gw2, gb2 = self.grads
+        np.dot(self.hidden_t, self.dq, out=gw2)
+        self.dq.sum(axis=0, out=gb2)
+        np.dot(self.dq, self.w2_t, out=self.dhidden)
+        np.greater(self.hidden, 0, out=self.active)
+        self.dhidden *= self.active
+        np.dot(x.T, self.dhidden, out=gw1)
+        self.dhidden.sum(axis=0, out=gb1)
+        self._adam()
+
+    def _adam(self, beta1=0.9, beta2=0.999, eps=1e-8):
+        self.updates += 1
+        step = self.learning_rate * np.sqrt(1 - beta2 ** self.updates) / (1 - beta1 ** self.updates)
+        for p, g, m, v, tmp in zip(self.params, self.grads, self.m, self.v, self.scratch):
+            m *= beta1
+            np.multiply(g, 1 - beta1, out=tmp)
+            m += tmp
+            v *= beta2
+            np.multiply(g, g, out=tmp)
+            tmp *= 1 - beta2
+            v += tmp
+            np.sqrt(v, out=tmp)
+            tmp += eps
+            np.divide(m, tmp, out=tmp)
+            tmp *= step
+            p -= tmp
+
+    def sync_target(self):
+        for target, p in zip(self.target, self.params):
+            np.copyto(target, p)
+
+    def save(self, path=DQN_WEIGHTS_FILE):
+        w1, b1, w2, b2 = self.params
+        np.savez(path, w1=w1, b1=b1, w2=w2, b2=b2)
+
+class DQNController:
+    """Greedy actions for a whole BatchSnakeEnv from one batched forward pass"""
+
+    def __init__(self, network, num_games):
+        self.network = network
+        self.hidden = np.zeros((num_games, network.w1.shape[1]), dtype=np.float32)
+        self.q = np.zeros((num_games, network.w2.shape[1]), dtype=np.float32)
+        self.actions = np.zeros(num_games, dtype=np.int64)
+
+    def __call__(self, obs, active):
+        self.network.forward(obs.reshape(len(obs), -1), self.network.params, self.hidden, self.q)
+        self.q.argmax(axis=1, out=self.actions)
+        self.actions[~active] = -1
+        return self.actions
+
+def evaluate(network, games=EVAL_GAMES, width=GRID_WIDTH, height=GRID_HEIGHT, seed=0):
+    """Final IQ of greedy play on a batch of games, all stepped together"""
+    env = BatchSnakeEnv(games, width, height, seed=seed, max_ticks=width * height * 4,
+                        auto_reset=False)
+    final_iq, _ = run_batched(DQNController(network, games), env)
+    return final_iq
+
+def train(steps=200000, width=GRID_WIDTH, height=GRID_HEIGHT, seed=0,
+          capacity=REPLAY_CAPACITY, report_every=10000, weights_path=DQN_WEIGHTS_FILE):
+    """Train a DQN on SnakeEnv, printing throughput and recent IQ as it goes"""
+    env = SnakeEnv(width, height, death_penalty=DEATH_PENALTY, max_ticks=width * height * 4)
+    replay = ReplayBuffer(capacity, env.observation_shape, seed=seed)
+    network = QNetwork(replay.obs.shape[1], env.num_actions, seed=seed)
+    rng = np.random.default_rng(seed + 1)
+
+    episode = 0
+    env.reset(seed=seed)
+    # The env writes observations in place: flat view of it, and a copy of
+    # the previous one for the replay buffer
+    obs = env.obs.reshape(1, -1)
+    previous = np.zeros_like(obs)
+    episodes = total_iq = best_iq = 0
+    start = time.perf_counter()
+
+    for step in range(1, steps + 1):
+        fraction = min(step / EPSILON_DECAY_STEPS, 1.0)
+        epsilon = EPSILON_START + fraction * (EPSILON_END - EPSILON_START)
+        if rng.random() < epsilon:
+            action = int(rng.integers(env.num_actions))
+        else:
+            action = network.best_action(obs)
+
+        np.copyto(previous, obs)
+        _, reward, done, info = env.step(action)
+        # Timeouts end the episode but are not terminal states
+        replay.add(previous, action, reward, obs, done and not info["truncated"])
+
+        if len(replay) >= WARMUP_STEPS:
+            replay.sample()
+            network.train_batch(replay)
+        if step % TARGET_SYNC_STEPS == 0:
+            network.sync_target()
+
+        if done:
+            episodes += 1
+            total_iq += info["iq"]
+            best_iq = max(best_iq, info["iq"])
+            episode += 1
+            env.reset(seed=seed + episode)
+
+        if step % report_every == 0:
+            elapsed = time.perf_counter() - start
+            average_iq = total_iq / episodes if episodes else 0.0
+            print(f"🧠 Step {step:,} | ⚡ {report_every / elapsed:,.0f} steps/sec | "
+                  f"{episodes} episodes, average IQ {average_iq:.1f}, best {best_iq} | ε {epsilon:.2f}")
+            network.save(weights_path)
+            episodes = total_iq = best_iq = 0
+            start = time.perf_counter()
+
+    network.save(weights_path)
+    return network
+
+def main():
+    """Train from the command line: steps, board width, board height"""
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else GRID_WIDTH
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else GRID_HEIGHT
+    network = train(steps, width, height)
+    print(f"💾 Weights saved to {DQN_WEIGHTS_FILE}")
+    final_iq = evaluate(network, width=width, height=height)
+    print(f"📊 Greedy play over {len(final_iq)} games: average IQ {final_iq.mean():.1f}, best {final_iq.max()}")
+
+if __name__ == "__main__":
+    main()
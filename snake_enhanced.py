@@ -3,8 +3,11 @@ import random
 import sys
 import math
 import os
+from collections import OrderedDict, deque
 from enum import Enum
 
+import numpy as np
+
 # Initialize Pygame and Mixer
 pygame.init()
 pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
@@ -20,6 +23,14 @@ GRID_SIZE = 20
 GRID_WIDTH = GAME_SIZE // GRID_SIZE
 GRID_HEIGHT = GAME_SIZE // GRID_SIZE
 
+# Fast-forward time scales (None = as fast as possible)
+TIME_SCALES = (1, 2, 10, None)
+MAX_FRAME_TIME = 250      # ms of real time banked per frame at most
+FAST_FRAME_BUDGET = 12    # ms of simulation per frame at max speed
+FAST_DRAW_INTERVAL = 100  # ms between drawn frames at max speed
+TEXT_CACHE_SIZE = 128     # rendered text surfaces kept for reuse
+PARTICLE_CAPACITY = 4096  # live particles at most, oldest recycled first
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -40,27 +51,103 @@ class AILevel(Enum):
     AGI_CANDIDATE = (150, "AGI Candidate", (255, 100, 200))
     SUPER_INTELLIGENCE = (300, "Super Intelligence", (255, 255, 255))
 
-class Particle:
-    def __init__(self, x, y, color, velocity=(0, 0)):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity = velocity
-        self.life = 30
-        self.max_life = 30
-        
+class ParticlePool:
+    """Fixed-capacity particles kept as NumPy arrays (structure of arrays).
+
+    Bursts are written into dead slots, or over the most faded live ones
+    once the pool is full. Every particle moves and ages in one vectorized
+    step per frame, and draws as one blits() call of prerendered circles.
+    """
+    
+    def __init__(self, capacity=PARTICLE_CAPACITY, max_life=30):
+        self.capacity = capacity
+        self.max_life = max_life
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32)  # index into palette
+        # Spawn order, so overlapping particles draw oldest first
+        self.born = np.zeros(capacity, dtype=np.int64)
+        self.spawned = 0
+        self.steps = 0
+        self.palette = []
+        self.palette_index = {}
+        self.stamps = {}
+    
+    def __len__(self):
+        return int(np.count_nonzero(self.life))
+    
+    def emit(self, x, y, color, count, speed_range, rng):
+        """Burst of count particles from (x, y) in random directions"""
+        count = min(count, self.capacity)
+        # Angle and speed drawn per particle in turn, as the effects stream always has
+        draws = np.array([(rng.uniform(0, 2 * math.pi), rng.uniform(*speed_range)) for _ in range(count)])
+        free = np.flatnonzero(self.life == 0)
+        if len(free) >= count:
+            slots = free[:count]
+        else:
+            slots = np.argsort(self.life, kind="stable")[:count]
+        
+        color = tuple(color[:3])
+        if color not in self.palette_index:
+            self.palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        self.position[slots] = (x, y)
+        self.velocity[slots, 0] = np.cos(draws[:, 0]) * draws[:, 1]
+        self.velocity[slots, 1] = np.sin(draws[:, 0]) * draws[:, 1]
+        self.life[slots] = self.max_life
+        self.color[slots] = self.palette_index[color]
+        self.born[slots] = self.spawned + np.arange(count)
+        self.spawned += count
+    
     def update(self):
-        self.x += self.velocity[0]
-        self.y += self.velocity[1]
-        self.life -= 1
-        
-    def draw(self, screen):
-        if self.life > 0:
-            alpha = int(255 * (self.life / self.max_life))
-            size = int(5 * (self.life / self.max_life))
-            if size > 0:
-                color = (*self.color[:3], alpha)
-                pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
+        self.position += self.velocity
+        self.life -= self.life > 0
+        self.steps += 1
+    
+    def clear(self):
+        self.life[:] = 0
+    
+    def visible(self):
+        """Slots, circle centers and radii of the particles still drawn, oldest first"""
+        sizes = 5 * self.life // self.max_life
+        slots = np.flatnonzero(sizes)
+        slots = slots[np.argsort(self.born[slots])]
+        return slots, self.position[slots].astype(np.int64), sizes[slots]
+    
+    def item(self):
+        """(rect, look) covering every visible particle for the scene, or None"""
+        slots, centers, sizes = self.visible()
+        if not len(slots):
+            return None
+        left, top = (centers - sizes[:, None] - 1).min(axis=0)
+        right, bottom = (centers + sizes[:, None] + 1).max(axis=0)
+        rect = pygame.Rect(int(left), int(top), int(right - left), int(bottom - top))
+        return rect, ("particles", self.steps, self.spawned)
+    
+    def draw(self, surface, area=None):
+        """Blit every visible particle (only those touching area, if given)"""
+        slots, centers, sizes = self.visible()
+        corners = centers - sizes[:, None] - 1
+        if area is not None:
+            extent = 2 * sizes + 2
+            near = ((corners[:, 0] < area.right) & (corners[:, 0] + extent > area.x) &
+                    (corners[:, 1] < area.bottom) & (corners[:, 1] + extent > area.y))
+            slots, corners, sizes = slots[near], corners[near], sizes[near]
+        keys = (self.color[slots] * 8 + sizes).tolist()
+        for key in set(keys):
+            if key not in self.stamps:
+                self.stamps[key] = self._stamp(self.palette[key // 8], key % 8)
+        surface.blits(list(zip(map(self.stamps.__getitem__, keys), corners.tolist())), doreturn=False)
+    
+    def _stamp(self, color, size):
+        """Circle prerendered once per color and radius, transparent around it"""
+        stamp = pygame.Surface((2 * size + 2, 2 * size + 2)).convert()
+        key = (0, 0, 0) if color != (0, 0, 0) else (255, 255, 255)
+        stamp.fill(key)
+        stamp.set_colorkey(key)
+        pygame.draw.circle(stamp, color, (size + 1, size + 1), size)
+        return stamp
 
 class SoundManager:
     def __init__(self):
@@ -132,12 +219,47 @@ class Achievement:
         self.show_notification = False
         self.notification_timer = 0
 
+class FreeCells:
+    """Empty grid cells with O(1) add, remove and uniform random pick"""
+    
+    def __init__(self, width, height):
+        self.cells = [(x, y) for x in range(width) for y in range(height)]
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+    
+    def __len__(self):
+        return len(self.cells)
+    
+    def add(self, cell):
+        """Mark a cell as empty"""
+        if cell not in self.index:
+            self.index[cell] = len(self.cells)
+            self.cells.append(cell)
+    
+    def remove(self, cell):
+        """Mark a cell as taken (off-board cells are ignored)"""
+        i = self.index.pop(cell, None)
+        if i is None:
+            return
+        # Swap the last cell into the hole so removal stays O(1)
+        last = self.cells.pop()
+        if i < len(self.cells):
+            self.cells[i] = last
+            self.index[last] = i
+    
+    def choice(self, rng=random):
+        """Uniformly random empty cell"""
+        return self.cells[rng.randrange(len(self.cells))]
+
 class AISnake:
     def __init__(self):
         self.reset()
         
     def reset(self):
-        self.body = [(GRID_WIDTH//2, GRID_HEIGHT//2)]
+        self.body = deque([(GRID_WIDTH//2, GRID_HEIGHT//2)])
+        self.occupied = set(self.body)
+        self.hit_self = False
+        self.free_cells = FreeCells(GRID_WIDTH, GRID_HEIGHT)
+        self.free_cells.remove(self.body[0])
         self.direction = (1, 0)
         self.iq = 0
         self.growth_pending = 0
@@ -148,12 +270,19 @@ class AISnake:
     def move(self):
         head = self.body[0]
         new_head = (head[0] + self.direction[0], head[1] + self.direction[1])
-        self.body.insert(0, new_head)
         
         if self.growth_pending > 0:
             self.growth_pending -= 1
         else:
-            self.body.pop()
+            tail = self.body.pop()
+            self.occupied.discard(tail)
+            self.free_cells.add(tail)
+        
+        # Tail moves out first, so following it is not a collision
+        self.hit_self = new_head in self.occupied
+        self.occupied.add(new_head)
+        self.free_cells.remove(new_head)
+        self.body.appendleft(new_head)
         
     def grow(self, segments=1):
         self.growth_pending += segments
@@ -170,7 +299,7 @@ class AISnake:
             head[1] < 0 or head[1] >= GRID_HEIGHT):
             return True
             
-        return head in self.body[1:]
+        return self.hit_self
     
     def get_brightness(self):
         return min(255, 50 + self.iq * 2)
@@ -186,19 +315,17 @@ class DataPoint:
     def __init__(self):
         self.respawn()
         
-    def respawn(self, avoid_positions=None):
-        if avoid_positions is None:
-            avoid_positions = []
-            
-        attempts = 0
-        while attempts < 100:
-            self.x = random.randint(0, GRID_WIDTH-1)
-            self.y = random.randint(0, GRID_HEIGHT-1)
-            if (self.x, self.y) not in avoid_positions:
-                break
-            attempts += 1
+    def respawn(self, free_cells=None, rng=random):
+        if free_cells is None:
+            self.x = rng.randint(0, GRID_WIDTH-1)
+            self.y = rng.randint(0, GRID_HEIGHT-1)
+        elif free_cells:
+            self.x, self.y = free_cells.choice(rng)
+        else:
+            # Snake fills the board - nowhere left to spawn
+            return False
             
-        rand = random.random()
+        rand = rng.random()
         if rand < 0.7:
             self.type = "basic"
             self.color = GREEN
@@ -214,9 +341,11 @@ class DataPoint:
             self.color = RED
             self.points = 10
             self.name = "Premium Data"
+            
+        return True
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed=None):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
         pygame.display.set_caption("AI Training Snake - Grow Your Neural Network!")
         
@@ -234,23 +363,35 @@ class Game:
         self.high_score = self.load_high_score()
         self.paused = False
         self.game_over = False
+        self.board_full = False
         self.flash_timer = 0
+        self.time_scale = TIME_SCALES[0]
+        self.last_draw_time = 0
+        self.autopilot = None
+        self.background = None
+        self.background_size = None
+        self.text_cache = OrderedDict()
+        self.gradient = []
+        self.gradient_key = None
+        self.drawn = None
         self.screen_shake = 0
         
         # Effects
-        self.particles = []
+        self.particles = ParticlePool()
         self.sound_manager = SoundManager()
         
         # Achievements
         self.achievements = self.create_achievements()
         
         # Game objects
+        self.seed_game(seed)
         self.ai_snake = AISnake()
         self.data_point = DataPoint()
-        self.data_point.respawn(self.ai_snake.body)
+        self.data_point.respawn(self.ai_snake.free_cells, self.rng)
         
         # Timing
-        self.last_move_time = pygame.time.get_ticks()
+        self.last_update_time = pygame.time.get_ticks()
+        self.move_accumulator = 0
         
     def create_achievements(self):
         achievements = [
@@ -277,6 +418,22 @@ class Game:
         ]
         return achievements
         
+    def seed_game(self, seed=None):
+        """Give this run its own gameplay and cosmetic RNG streams"""
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        # Data spawns and effects get separate streams, so seed + input log
+        # replay the run exactly however many particles were drawn
+        seeder = random.Random(self.seed)
+        self.rng = random.Random(seeder.getrandbits(64))
+        self.fx_rng = random.Random(seeder.getrandbits(64))
+        self.input_log = []
+        self.moves = 0
+    
+    def steer(self, direction):
+        """Change direction, logging it against the move count for replays"""
+        self.input_log.append((self.moves, direction))
+        self.ai_snake.change_direction(direction)
+    
     def load_high_score(self):
         try:
             with open("high_score.txt", "r") as f:
@@ -302,20 +459,25 @@ class Game:
                     
                 if not self.game_over and not self.paused:
                     if event.key == pygame.K_UP or event.key == pygame.K_w:
-                        self.ai_snake.change_direction((0, -1))
+                        self.steer((0, -1))
                     elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                        self.ai_snake.change_direction((0, 1))
+                        self.steer((0, 1))
                     elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                        self.ai_snake.change_direction((-1, 0))
+                        self.steer((-1, 0))
                     elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                        self.ai_snake.change_direction((1, 0))
+                        self.steer((1, 0))
                     elif event.key == pygame.K_SPACE:
                         self.paused = True
+                    elif event.key == pygame.K_f:
+                        self.cycle_time_scale()
+                    elif event.key == pygame.K_p:
+                        self.toggle_autopilot()
                         
                 elif self.paused:
                     if event.key == pygame.K_SPACE:
                         self.paused = False
-                        self.last_move_time = pygame.time.get_ticks()
+                        self.last_update_time = pygame.time.get_ticks()
+                        self.move_accumulator = 0
                         
                 elif self.game_over:
                     if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
@@ -324,11 +486,14 @@ class Game:
         return True
     
     def restart_game(self):
+        self.seed_game(self.seed + 1)
         self.ai_snake.reset()
-        self.data_point.respawn(self.ai_snake.body)
+        self.data_point.respawn(self.ai_snake.free_cells, self.rng)
         self.game_over = False
+        self.board_full = False
         self.paused = False
-        self.last_move_time = pygame.time.get_ticks()
+        self.last_update_time = pygame.time.get_ticks()
+        self.move_accumulator = 0
         self.particles.clear()
         self.screen_shake = 0
         
@@ -339,9 +504,7 @@ class Game:
     def update(self):
         if self.game_over or self.paused:
             # Update particles even when paused/game over
-            self.particles = [p for p in self.particles if p.life > 0]
-            for particle in self.particles:
-                particle.update()
+            self.particles.update()
             
             # Update achievement notifications
             for achievement in self.achievements:
@@ -352,23 +515,21 @@ class Game:
             return
             
         current_time = pygame.time.get_ticks()
-        
-        # Calculate speed based on IQ level
-        base_speed = 150
-        speed_increase = min(self.ai_snake.iq * 3, 100)
-        move_interval = max(60, base_speed - speed_increase)
-        
-        if current_time - self.last_move_time >= move_interval:
-            self.ai_snake.move()
-            self.last_move_time = current_time
-            
-            # Check data consumption
-            if self.ai_snake.body[0] == (self.data_point.x, self.data_point.y):
-                self.consume_data()
-            
-            # Check for death
-            if self.ai_snake.is_dead():
-                self.handle_game_over()
+        frame_time = min(current_time - self.last_update_time, MAX_FRAME_TIME)
+        self.last_update_time = current_time
+        
+        # Fixed timestep: bank scaled real time and spend it in whole moves,
+        # so game speed no longer depends on the frame rate
+        if self.time_scale is None:
+            # As fast as possible: simulate for a slice of every frame
+            deadline = current_time + FAST_FRAME_BUDGET
+            while not self.game_over and pygame.time.get_ticks() < deadline:
+                self.tick()
+        else:
+            self.move_accumulator += frame_time * self.time_scale
+            while not self.game_over and self.move_accumulator >= self.move_interval():
+                self.move_accumulator -= self.move_interval()
+                self.tick()
         
         # Update effects
         self.flash_timer += 1
@@ -376,9 +537,7 @@ class Game:
             self.screen_shake -= 1
             
         # Update particles
-        self.particles = [p for p in self.particles if p.life > 0]
-        for particle in self.particles:
-            particle.update()
+        self.particles.update()
             
         # Update achievements
         self.check_achievements()
@@ -388,6 +547,57 @@ class Game:
                 if achievement.notification_timer <= 0:
                     achievement.show_notification = False
     
+    def move_interval(self):
+        # Calculate speed based on IQ level
+        base_speed = 150
+        speed_increase = min(self.ai_snake.iq * 3, 100)
+        return max(60, base_speed - speed_increase)
+    
+    def tick(self):
+        if self.autopilot:
+            direction = self.autopilot.next_direction(self.ai_snake, (self.data_point.x, self.data_point.y))
+            if direction and direction != self.ai_snake.direction:
+                self.steer(direction)
+        
+        self.ai_snake.move()
+        self.moves += 1
+        
+        # Check data consumption
+        if self.ai_snake.body[0] == (self.data_point.x, self.data_point.y):
+            self.consume_data()
+        
+        # Check for death
+        if self.ai_snake.is_dead():
+            self.handle_game_over()
+    
+    def toggle_autopilot(self):
+        # Imported on first use, so the game starts without loading the search code
+        from snake_autopilot import Autopilot, HamiltonianAutopilot
+        
+        if self.autopilot is None:
+            self.autopilot = Autopilot(GRID_WIDTH, GRID_HEIGHT)
+        elif isinstance(self.autopilot, Autopilot):
+            # Perfect play - the cycle is cached on disk after the first run
+            self.autopilot = HamiltonianAutopilot(GRID_WIDTH, GRID_HEIGHT)
+        else:
+            self.autopilot = None
+    
+    def cycle_time_scale(self):
+        """Fast-forward: x1 -> x2 -> x10 -> as fast as possible"""
+        i = TIME_SCALES.index(self.time_scale)
+        self.time_scale = TIME_SCALES[(i + 1) % len(TIME_SCALES)]
+        self.move_accumulator = 0
+    
+    def frame_due(self):
+        """Draw every frame, but throttle drawing while running flat out"""
+        if self.time_scale is not None or self.game_over or self.paused:
+            return True
+        current_time = pygame.time.get_ticks()
+        if current_time - self.last_draw_time >= FAST_DRAW_INTERVAL:
+            self.last_draw_time = current_time
+            return True
+        return False
+    
     def consume_data(self):
         points = self.data_point.points
         old_level = self.ai_snake.level
@@ -423,18 +633,17 @@ class Game:
         self.ai_snake.grow(growth)
         
         # Respawn data
-        self.data_point.respawn(self.ai_snake.body)
+        if not self.data_point.respawn(self.ai_snake.free_cells, self.rng):
+            # Neural network fills the whole board - training mastered!
+            self.board_full = True
+            self.handle_game_over()
     
     def create_consumption_particles(self):
         """Create particles when consuming data"""
         x = self.game_offset_x + self.data_point.x * GRID_SIZE + GRID_SIZE // 2
         y = self.game_offset_y + self.data_point.y * GRID_SIZE + GRID_SIZE // 2
         
-        for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            self.particles.append(Particle(x, y, self.data_point.color, velocity))
+        self.particles.emit(x, y, self.data_point.color, 8, (2, 6), self.fx_rng)
     
     def create_level_up_particles(self):
         """Create special particles for level up"""
@@ -442,12 +651,7 @@ class Game:
         x = self.game_offset_x + head[0] * GRID_SIZE + GRID_SIZE // 2
         y = self.game_offset_y + head[1] * GRID_SIZE + GRID_SIZE // 2
         
-        for _ in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 8)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            color = self.ai_snake.level.value[2]
-            self.particles.append(Particle(x, y, color, velocity))
+        self.particles.emit(x, y, self.ai_snake.level.value[2], 20, (3, 8), self.fx_rng)
     
     def check_achievements(self):
         """Check and unlock achievements"""
@@ -464,7 +668,7 @@ class Game:
             self.save_high_score()
             print(f"🎉 NEW HIGH SCORE: {self.ai_snake.iq} IQ! 🎉")
         else:
-            print(f"Training Complete! Final IQ: {self.ai_snake.iq} (Best: {self.high_score})")
+            print(f"Training Complete! Final IQ: {self.ai_snake.iq} (Best: {self.high_score}, Seed: {self.seed})")
         
         self.sound_manager.play('gameover')
         self.game_over = True
@@ -473,56 +677,89 @@ class Game:
         # Apply screen shake
         shake_x, shake_y = 0, 0
         if self.screen_shake > 0:
-            shake_x = random.randint(-self.screen_shake, self.screen_shake)
-            shake_y = random.randint(-self.screen_shake, self.screen_shake)
-        
-        self.screen.fill(BLACK)
+            shake_x = self.fx_rng.randint(-self.screen_shake, self.screen_shake)
+            shake_y = self.fx_rng.randint(-self.screen_shake, self.screen_shake)
         
-        if not self.game_over:
-            self.draw_game(shake_x, shake_y)
-            if self.paused:
-                self.draw_pause_overlay()
-        else:
-            self.draw_game_over_screen()
-        
-        # Draw achievements notifications
-        self.draw_achievement_notifications()
+        if self.game_over or self.paused or self.screen_shake > 0:
+            # Shake moves everything, pause and game over cover the board:
+            # redraw the whole screen
+            self.screen.fill(BLACK)
+            
+            if not self.game_over:
+                self.draw_game(shake_x, shake_y)
+                if self.paused:
+                    self.draw_pause_overlay()
+            else:
+                self.draw_game_over_screen()
             
-        pygame.display.flip()
+            # Draw achievements notifications
+            self.draw_achievement_notifications()
+            
+            pygame.display.flip()
+            self.drawn = None
+            return
+        
+        # Otherwise repaint and update only the regions that changed
+        scene = self.build_scene()
+        scene.update(self.notification_items())
+        dirty = self.dirty_rects(scene)
+        items = list(scene.values())
+        rects = [rect for rect, _ in items]
+        for area in dirty:
+            self.screen.set_clip(area)
+            self.screen.fill(BLACK)
+            self.screen.blit(self.get_background(), (self.game_offset_x - 2, self.game_offset_y - 2))
+            for i in area.collidelistall(rects):
+                self.draw_item(*items[i])
+        self.screen.set_clip(None)
+        pygame.display.update(dirty)
+        self.drawn = scene
+    
+    def dirty_rects(self, scene):
+        """Rects of items that appeared, changed or disappeared since the last frame"""
+        if self.drawn is None:
+            return [self.screen.get_rect()]
+        dirty = []
+        for key, item in scene.items():
+            old = self.drawn.get(key)
+            if old != item:
+                dirty.append(item[0])
+                if old is not None and old[0] != item[0]:
+                    dirty.append(old[0])
+        dirty += [rect for key, (rect, _) in self.drawn.items() if key not in scene]
+        return dirty
+    
+    def get_background(self):
+        """Border and grid prerendered once, rebuilt only if the resolution changes"""
+        size = self.screen.get_size()
+        if self.background is None or self.background_size != size:
+            self.background = pygame.Surface((GAME_SIZE + 4, GAME_SIZE + 4)).convert()
+            self.background.fill(BLACK)
+            pygame.draw.rect(self.background, WHITE, self.background.get_rect(), 2)
+            for x in range(0, GAME_SIZE, GRID_SIZE):
+                pygame.draw.line(self.background, (20, 20, 20), (x + 2, 2), (x + 2, GAME_SIZE + 2))
+            for y in range(0, GAME_SIZE, GRID_SIZE):
+                pygame.draw.line(self.background, (20, 20, 20), (2, y + 2), (GAME_SIZE + 2, y + 2))
+            self.background_size = size
+        return self.background
     
     def draw_game(self, shake_x=0, shake_y=0):
-        # Draw game border
-        border_rect = pygame.Rect(
-            self.game_offset_x - 2 + shake_x, 
-            self.game_offset_y - 2 + shake_y,
-            GAME_SIZE + 4, 
-            GAME_SIZE + 4
-        )
-        pygame.draw.rect(self.screen, WHITE, border_rect, 2)
-        
-        # Draw grid
-        for x in range(0, GAME_SIZE, GRID_SIZE):
-            pygame.draw.line(self.screen, (20, 20, 20), 
-                           (self.game_offset_x + x + shake_x, self.game_offset_y + shake_y), 
-                           (self.game_offset_x + x + shake_x, self.game_offset_y + GAME_SIZE + shake_y))
-        for y in range(0, GAME_SIZE, GRID_SIZE):
-            pygame.draw.line(self.screen, (20, 20, 20), 
-                           (self.game_offset_x + shake_x, self.game_offset_y + y + shake_y), 
-                           (self.game_offset_x + GAME_SIZE + shake_x, self.game_offset_y + y + shake_y))
-        
-        # Draw snake with level colors
-        brightness = self.ai_snake.get_brightness()
-        level_color = self.ai_snake.level.value[2]
+        # Draw game border and grid, prerendered
+        self.screen.blit(self.get_background(),
+                         (self.game_offset_x - 2 + shake_x, self.game_offset_y - 2 + shake_y))
+        
+        for rect, look in self.build_scene(shake_x, shake_y).values():
+            self.draw_item(rect, look)
+    
+    def build_scene(self, shake_x=0, shake_y=0):
+        """Everything on the board and HUD as {key: (rect, look)}, in drawing order"""
+        scene = {}
+        
+        # Snake with level colors
+        gradient = self.get_gradient(len(self.ai_snake.body))
         
         for i, segment in enumerate(self.ai_snake.body):
-            segment_brightness = max(30, brightness - (i * 3))
-            
-            # Blend level color with brightness
-            color = (
-                min(255, (level_color[0] * segment_brightness) // 255),
-                min(255, (level_color[1] * segment_brightness) // 255),
-                min(255, (level_color[2] * segment_brightness) // 255)
-            )
+            color = gradient[i]
             
             rect = pygame.Rect(
                 self.game_offset_x + segment[0] * GRID_SIZE + 1 + shake_x,
@@ -531,18 +768,9 @@ class Game:
                 GRID_SIZE - 2
             )
             
-            pygame.draw.rect(self.screen, color, rect)
-            
-            if i == 0:  # Head
-                pygame.draw.rect(self.screen, WHITE, rect, 2)
-                # Draw eyes
-                eye_size = 3
-                eye1_pos = (rect.centerx - 4, rect.centery - 2)
-                eye2_pos = (rect.centerx + 4, rect.centery - 2)
-                pygame.draw.circle(self.screen, BLACK, eye1_pos, eye_size)
-                pygame.draw.circle(self.screen, BLACK, eye2_pos, eye_size)
+            scene[segment] = (rect, ("segment", color, i == 0))
         
-        # Draw data point
+        # Data point
         data_rect = pygame.Rect(
             self.game_offset_x + self.data_point.x * GRID_SIZE + 1 + shake_x,
             self.game_offset_y + self.data_point.y * GRID_SIZE + 1 + shake_y,
@@ -550,98 +778,181 @@ class Game:
             GRID_SIZE - 2
         )
         
-        pygame.draw.rect(self.screen, self.data_point.color, data_rect)
-        
         # Flash effect for premium data
-        if (self.data_point.points >= 10 and 
-            self.flash_timer % 30 < 15):
-            pygame.draw.rect(self.screen, WHITE, data_rect, 3)
+        flashing = self.data_point.points >= 10 and self.flash_timer % 30 < 15
+        scene["data"] = (data_rect, ("data", self.data_point.color, flashing))
         
-        # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        # Particles
+        item = self.particles.item()
+        if item:
+            scene["particles"] = item
         
-        self.draw_ui()
+        self.add_ui(scene)
+        return scene
     
-    def draw_ui(self):
+    def get_gradient(self, length):
+        """Segment colors from head to tail, rebuilt only when the level or IQ brightness changes"""
+        key = (self.ai_snake.level, self.ai_snake.get_brightness())
+        if self.gradient_key != key:
+            brightness = key[1]
+            level_color = self.ai_snake.level.value[2]
+            self.gradient = []
+            segment_brightness = None
+            while segment_brightness != 30:
+                segment_brightness = max(30, brightness - (len(self.gradient) * 3))
+                # Blend level color with brightness
+                self.gradient.append((
+                    min(255, (level_color[0] * segment_brightness) // 255),
+                    min(255, (level_color[1] * segment_brightness) // 255),
+                    min(255, (level_color[2] * segment_brightness) // 255)
+                ))
+            self.gradient_key = key
+        # Past the darkest step every segment shares the tail color
+        if len(self.gradient) < length:
+            self.gradient += [self.gradient[-1]] * (length - len(self.gradient))
+        return self.gradient
+    
+    def add_text(self, scene, key, font, text, color, **position):
+        """Add a HUD string to the scene, placed like Surface.get_rect(**position)"""
+        rect = pygame.Rect((0, 0), font.size(text))
+        for name, value in position.items():
+            setattr(rect, name, value)
+        scene[key] = (rect, ("text", font, text, color))
+        return rect
+    
+    def add_ui(self, scene):
         # AI Level and IQ (top center)
-        level_text = self.font_large.render(f"{self.ai_snake.level.value[1]}", True, self.ai_snake.level.value[2])
-        level_rect = level_text.get_rect(centerx=SCREEN_WIDTH//2, y=20)
-        self.screen.blit(level_text, level_rect)
-        
-        iq_text = self.font_huge.render(f"IQ: {self.ai_snake.iq}", True, WHITE)
-        iq_rect = iq_text.get_rect(centerx=SCREEN_WIDTH//2, y=level_rect.bottom + 10)
-        self.screen.blit(iq_text, iq_rect)
+        level_rect = self.add_text(scene, "level", self.font_large, f"{self.ai_snake.level.value[1]}",
+                                   self.ai_snake.level.value[2], centerx=SCREEN_WIDTH//2, y=20)
+        self.add_text(scene, "iq", self.font_huge, f"IQ: {self.ai_snake.iq}", WHITE,
+                      centerx=SCREEN_WIDTH//2, y=level_rect.bottom + 10)
         
         # High score (top left)
         if self.high_score > 0:
-            high_text = self.font_medium.render(f"Best: {self.high_score}", True, LIGHT_GRAY)
-            self.screen.blit(high_text, (20, 20))
+            self.add_text(scene, "best", self.font_medium, f"Best: {self.high_score}", LIGHT_GRAY, topleft=(20, 20))
         
         # Current data info (bottom left)
         data_info = f"{self.data_point.name} (+{self.data_point.points})"
-        data_text = self.font_small.render(data_info, True, self.data_point.color)
-        self.screen.blit(data_text, (20, SCREEN_HEIGHT - 100))
+        self.add_text(scene, "data_info", self.font_small, data_info, self.data_point.color,
+                      topleft=(20, SCREEN_HEIGHT - 100))
         
         # Neural network size
-        size_text = self.font_small.render(f"Neural Network: {len(self.ai_snake.body)} neurons", True, GRAY)
-        self.screen.blit(size_text, (20, SCREEN_HEIGHT - 70))
+        self.add_text(scene, "size", self.font_small, f"Neural Network: {len(self.ai_snake.body)} neurons", GRAY,
+                      topleft=(20, SCREEN_HEIGHT - 70))
         
         # Data consumed
-        consumed_text = self.font_small.render(f"Data Consumed: {self.ai_snake.data_consumed}", True, GRAY)
-        self.screen.blit(consumed_text, (20, SCREEN_HEIGHT - 40))
+        self.add_text(scene, "consumed", self.font_small, f"Data Consumed: {self.ai_snake.data_consumed}", GRAY,
+                      topleft=(20, SCREEN_HEIGHT - 40))
         
         # Controls (top right)
-        controls = ["ESC: Exit", "WASD/Arrows: Move", "SPACE: Pause"]
+        controls = ["ESC: Exit", "WASD/Arrows: Move", "SPACE: Pause", "F: Fast-forward", "P: Autopilot"]
         for i, control in enumerate(controls):
-            controls_text = self.font_small.render(control, True, GRAY)
-            text_rect = controls_text.get_rect()
-            text_rect.topright = (SCREEN_WIDTH - 20, 20 + i * 25)
-            self.screen.blit(controls_text, text_rect)
+            self.add_text(scene, ("control", i), self.font_small, control, GRAY,
+                          topright=(SCREEN_WIDTH - 20, 20 + i * 25))
         
         # Achievements counter (bottom right)
         unlocked_count = sum(1 for a in self.achievements if a.unlocked)
-        achievement_text = self.font_small.render(f"Achievements: {unlocked_count}/{len(self.achievements)}", True, LIGHT_GRAY)
-        text_rect = achievement_text.get_rect()
-        text_rect.bottomright = (SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20)
-        self.screen.blit(achievement_text, text_rect)
+        self.add_text(scene, "achievements", self.font_small, f"Achievements: {unlocked_count}/{len(self.achievements)}",
+                      LIGHT_GRAY, bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20))
+        
+        # Fast-forward indicator (bottom right)
+        if self.time_scale != 1:
+            speed = f"x{self.time_scale}" if self.time_scale else "MAX"
+            self.add_text(scene, "speed", self.font_small, f"Speed: {speed}", YELLOW,
+                          bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 50))
+        
+        if self.autopilot:
+            self.add_text(scene, "autopilot", self.font_small, f"Autopilot: {self.autopilot.name}", YELLOW,
+                          bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 80))
     
-    def draw_achievement_notifications(self):
-        """Draw achievement unlock notifications"""
+    def notification_items(self):
+        """Achievement unlock notifications as scene items"""
+        items = {}
         y_offset = 0
         for achievement in self.achievements:
             if achievement.show_notification:
-                # Create notification background
                 notification_height = 60
                 notification_width = 400
                 notification_rect = pygame.Rect(
                     SCREEN_WIDTH - notification_width - 20,
-                    100 + y_offset,
+                    150 + y_offset,
                     notification_width,
                     notification_height
                 )
                 
                 # Background with fade effect
                 alpha = min(255, achievement.notification_timer * 2)
-                notification_surf = pygame.Surface((notification_width, notification_height))
-                notification_surf.set_alpha(alpha)
-                notification_surf.fill((50, 50, 50))
-                self.screen.blit(notification_surf, notification_rect)
-                
-                # Border
-                pygame.draw.rect(self.screen, YELLOW, notification_rect, 2)
-                
-                # Achievement text
-                title_text = self.font_medium.render(f"{achievement.icon} {achievement.name}", True, YELLOW)
-                desc_text = self.font_small.render(achievement.description, True, WHITE)
-                
-                title_rect = title_text.get_rect(x=notification_rect.x + 10, y=notification_rect.y + 5)
-                desc_rect = desc_text.get_rect(x=notification_rect.x + 10, y=notification_rect.y + 30)
-                
-                self.screen.blit(title_text, title_rect)
-                self.screen.blit(desc_text, desc_rect)
+                items[("notification", achievement.name)] = (notification_rect, ("notification", achievement, alpha))
                 
                 y_offset += 70
+        return items
+    
+    def draw_achievement_notifications(self):
+        """Draw achievement unlock notifications"""
+        for rect, look in self.notification_items().values():
+            self.draw_item(rect, look)
+    
+    def draw_item(self, rect, look):
+        """Draw one scene item"""
+        kind = look[0]
+        if kind == "segment":
+            pygame.draw.rect(self.screen, look[1], rect)
+            
+            if look[2]:  # Head
+                self.draw_outline(WHITE, rect, 2)
+                # Draw eyes
+                eye_size = 3
+                eye1_pos = (rect.centerx - 4, rect.centery - 2)
+                eye2_pos = (rect.centerx + 4, rect.centery - 2)
+                pygame.draw.circle(self.screen, BLACK, eye1_pos, eye_size)
+                pygame.draw.circle(self.screen, BLACK, eye2_pos, eye_size)
+        elif kind == "data":
+            pygame.draw.rect(self.screen, look[1], rect)
+            if look[2]:
+                self.draw_outline(WHITE, rect, 3)
+        elif kind == "particles":
+            self.particles.draw(self.screen, self.screen.get_clip())
+        elif kind == "text":
+            self.screen.blit(self.render_text(look[1], look[2], look[3]), rect)
+        elif kind == "notification":
+            achievement, alpha = look[1], look[2]
+            notification_surf = pygame.Surface(rect.size)
+            notification_surf.set_alpha(alpha)
+            notification_surf.fill((50, 50, 50))
+            self.screen.blit(notification_surf, rect)
+            
+            # Border
+            self.draw_outline(YELLOW, rect, 2)
+            
+            # Achievement text
+            title_text = self.render_text(self.font_medium, f"{achievement.icon} {achievement.name}", YELLOW)
+            desc_text = self.render_text(self.font_small, achievement.description, WHITE)
+            
+            title_rect = title_text.get_rect(x=rect.x + 10, y=rect.y + 5)
+            desc_rect = desc_text.get_rect(x=rect.x + 10, y=rect.y + 30)
+            
+            self.screen.blit(title_text, title_rect)
+            self.screen.blit(desc_text, desc_rect)
+    
+    def draw_outline(self, color, rect, width):
+        """Same pixels as pygame.draw.rect(..., width), but safe under a clip rect"""
+        self.screen.fill(color, (rect.x, rect.y, rect.width, width))
+        self.screen.fill(color, (rect.x, rect.bottom - width, rect.width, width))
+        self.screen.fill(color, (rect.x, rect.y, width, rect.height))
+        self.screen.fill(color, (rect.right - width, rect.y, width, rect.height))
+    
+    def render_text(self, font, text, color):
+        """Rendered text surface, cached by (font, text, color) with least recently used eviction"""
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+            if len(self.text_cache) > TEXT_CACHE_SIZE:
+                self.text_cache.popitem(last=False)
+        else:
+            self.text_cache.move_to_end(key)
+        return surface
     
     def draw_pause_overlay(self):
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -649,11 +960,11 @@ class Game:
         overlay.fill(BLACK)
         self.screen.blit(overlay, (0, 0))
         
-        pause_text = self.font_huge.render("TRAINING PAUSED", True, WHITE)
+        pause_text = self.render_text(self.font_huge, "TRAINING PAUSED", WHITE)
         text_rect = pause_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
         self.screen.blit(pause_text, text_rect)
         
-        resume_text = self.font_medium.render("Press SPACE to resume", True, LIGHT_GRAY)
+        resume_text = self.render_text(self.font_medium, "Press SPACE to resume", LIGHT_GRAY)
         text_rect = resume_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 70))
         self.screen.blit(resume_text, text_rect)
     
@@ -661,26 +972,26 @@ class Game:
         self.screen.fill(DARK_BLUE)
         
         # Title
-        title_text = self.font_huge.render("AI TRAINING COMPLETE", True, WHITE)
+        title_text = self.render_text(self.font_huge, "AI TRAINING MASTERED" if self.board_full else "AI TRAINING COMPLETE", WHITE)
         text_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 200))
         self.screen.blit(title_text, text_rect)
         
         # Final level and IQ
-        level_text = self.font_large.render(f"Final Level: {self.ai_snake.level.value[1]}", True, self.ai_snake.level.value[2])
+        level_text = self.render_text(self.font_large, f"Final Level: {self.ai_snake.level.value[1]}", self.ai_snake.level.value[2])
         text_rect = level_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 130))
         self.screen.blit(level_text, text_rect)
         
-        final_iq_text = self.font_large.render(f"Final IQ: {self.ai_snake.iq}", True, YELLOW)
+        final_iq_text = self.render_text(self.font_large, f"Final IQ: {self.ai_snake.iq}", YELLOW)
         text_rect = final_iq_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 90))
         self.screen.blit(final_iq_text, text_rect)
         
         # High score status
         if self.ai_snake.iq == self.high_score and self.high_score > 0:
-            record_text = self.font_large.render("🎉 NEW RECORD! 🎉", True, GREEN)
+            record_text = self.render_text(self.font_large, "🎉 NEW RECORD! 🎉", GREEN)
             text_rect = record_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
             self.screen.blit(record_text, text_rect)
         elif self.high_score > 0:
-            best_text = self.font_medium.render(f"Personal Best: {self.high_score}", True, LIGHT_GRAY)
+            best_text = self.render_text(self.font_medium, f"Personal Best: {self.high_score}", LIGHT_GRAY)
             text_rect = best_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
             self.screen.blit(best_text, text_rect)
         
@@ -692,22 +1003,22 @@ class Game:
         ]
         
         for i, stat in enumerate(stats):
-            stat_text = self.font_small.render(stat, True, GRAY)
+            stat_text = self.render_text(self.font_small, stat, GRAY)
             text_rect = stat_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20 + i * 30))
             self.screen.blit(stat_text, text_rect)
         
         # Achievements
         unlocked_count = sum(1 for a in self.achievements if a.unlocked)
-        achievement_text = self.font_medium.render(f"Achievements Unlocked: {unlocked_count}/{len(self.achievements)}", True, YELLOW)
+        achievement_text = self.render_text(self.font_medium, f"Achievements Unlocked: {unlocked_count}/{len(self.achievements)}", YELLOW)
         text_rect = achievement_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 120))
         self.screen.blit(achievement_text, text_rect)
         
         # Restart instruction
-        restart_text = self.font_medium.render("Press SPACE or ENTER to restart training", True, WHITE)
+        restart_text = self.render_text(self.font_medium, "Press SPACE or ENTER to restart training", WHITE)
         text_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 180))
         self.screen.blit(restart_text, text_rect)
         
-        exit_text = self.font_small.render("Press ESC to exit", True, GRAY)
+        exit_text = self.render_text(self.font_small, "Press ESC to exit", GRAY)
         text_rect = exit_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 220))
         self.screen.blit(exit_text, text_rect)
     
@@ -717,7 +1028,8 @@ class Game:
         while running:
             running = self.handle_input()
             self.update()
-            self.draw()
+            if self.frame_due():
+                self.draw()
             self.clock.tick(60)
         
         pygame.quit()
@@ -742,6 +1054,8 @@ def main():
     print("Controls:")
     print("  ⬆️⬇️⬅️➡️ Arrow Keys OR WASD - Move your AI")
     print("  SPACE - Pause/Resume")
+    print("  F - Fast-forward (x2, x10, max)")
+    print("  P - Autopilot (BFS, Hamiltonian, off)")
     print("  ESC - Exit game")
     print("  SPACE/ENTER - Restart after game over")
     print()
@@ -750,7 +1064,9 @@ def main():
     print()
     
     try:
-        game = Game()
+        # Optional seed: the same seed replays the same data spawns
+        seed = int(sys.argv[1]) if len(sys.argv) > 1 else None
+        game = Game(seed)
         game.run()
     except Exception as e:
         print(f"❌ Game error: {e}")
@@ -0,0 +1,274 @@
+"""
+AI Training Snake - Training Environment
+Gym-style reset/step wrapper around the headless game, with observations
+written into one preallocated NumPy buffer, and a batched version that
+steps N games with one vectorized controller call per tick.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT, DIRECTIONS, SnakeSim
+from snake_batch import BatchSnakeSim, DX, DY
+
+# Observation planes
+BODY, HEAD, FOOD = 0, 1, 2
+
+class SnakeEnv:
+    """reset(seed) -> obs, step(action) -> (obs, reward, done, info)
+
+    Actions index snake_sim.DIRECTIONS (UP, RIGHT, DOWN, LEFT); -1 or None
+    keeps going. The reward is the IQ consumed this step (1/3/10 by DataType).
+
+    obs is a (3, height, width) float32 view of a buffer that every step
+    updates in place - copy it if you need to keep an old observation.
+    """
+
+    num_actions = len(DIRECTIONS)
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, death_penalty=0.0, max_ticks=None):
+        self.width = width
+        self.height = height
+        self.death_penalty = death_penalty
+        self.max_ticks = max_ticks
+        self.sim = SnakeSim(width, height)
+        self._buffer = np.zeros((3, height, width), dtype=np.float32)
+        self.obs = self._buffer[:]
+        self.observation_shape = self._buffer.shape
+        self.info = {"iq": 0, "length": 1, "ticks": 0, "won": False, "truncated": False}
+
+    def reset(self, seed=None):
+        """Start a new game and return the first observation"""
+        self.sim.reset(seed)
+        self._buffer.fill(0)
+        for x, y in self.sim.ai_snake.body:
+            self._buffer[BODY, y, x] = 1
+        head = self.sim.ai_snake.body[0]
+        self._buffer[HEAD, head[1], head[0]] = 1
+        food = self.sim.data_point.position
+        self._buffer[FOOD, food[1], food[0]] = 1
+        self._update_info()
+        return self.obs
+
+    def step(self, action):
+        """Apply one action, redrawing only the cells that changed"""
+        snake = self.sim.ai_snake
+        buffer = self._buffer
+        old_head = snake.body[0]
+        old_tail = snake.body[-1]
+        old_food = self.sim.data_point.position
+        tail_moves = snake.growth_pending == 0
+
+        direction = None if action is None or action < 0 else DIRECTIONS[action]
+        points = self.sim.step(direction)
+        done = self.sim.done
+
+        # Only the old/new head, the old tail and the data point can change
+        if tail_moves:
+            buffer[BODY, old_tail[1], old_tail[0]] = 0
+        buffer[HEAD, old_head[1], old_head[0]] = 0
+        head = snake.body[0]
+        if 0 <= head[0] < self.width and 0 <= head[1] < self.height:
+            buffer[BODY, head[1], head[0]] = 1
+            buffer[HEAD, head[1], head[0]] = 1
+        food = self.sim.data_point.position
+        if food != old_food:
+            buffer[FOOD, old_food[1], old_food[0]] = 0
+            buffer[FOOD, food[1], food[0]] = 1
+
+        reward = float(points)
+        if done and not self.sim.won:
+            reward -= self.death_penalty
+
+        truncated = (not done and self.max_ticks is not None
+                     and self.sim.ticks >= self.max_ticks)
+        self._update_info(truncated)
+        return self.obs, reward, done or truncated, self.info
+
+    def _update_info(self, truncated=False):
+        """Refresh the reused info dict in place"""
+        info = self.info
+        info["iq"] = self.sim.ai_snake.iq
+        info["length"] = len(self.sim.ai_snake.body)
+        info["ticks"] = self.sim.ticks
+        info["won"] = self.sim.won
+        info["truncated"] = truncated
+
+class BatchSnakeEnv:
+    """N games as one env: reset(seed) -> obs, step(actions) -> (obs, rewards, dones, info)
+
+    obs is an (N, 3, height, width) float32 buffer updated in place, rewards
+    and dones are (N,) arrays, and the batch never changes shape. With
+    auto_reset a finished game starts over in its slot straight away (its
+    dones entry is True for that step and info["final_*"] hold the episode);
+    without it, finished games freeze and drop out of the active mask.
+
+    Controllers are callables controller(obs, active) -> actions: one
+    DIRECTIONS index per game (or -1 to keep going) for the whole batch.
+    Actions of inactive games are ignored.
+    """
+
+    num_actions = len(DIRECTIONS)
+
+    def __init__(self, num_games, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None,
+                 death_penalty=0.0, max_ticks=None, auto_reset=True):
+        self.num_games = num_games
+        self.width = width
+        self.height = height
+        self.death_penalty = death_penalty
+        self.max_ticks = max_ticks
+        self.batch = BatchSnakeSim(num_games, width, height, seed=seed, auto_reset=auto_reset)
+        batch = self.batch
+
+        self._buffer = np.zeros((num_games, 3, height, width), dtype=np.float32)
+        self.obs = self._buffer[:]
+        self.observation_shape = self._buffer.shape[1:]
+        # Flat (N, 3, cells) view for writing planes by cell index
+        self._planes = self._buffer.reshape(num_games, 3, -1)
+        self._rows = np.arange(num_games)
+
+        self.rewards = np.zeros(num_games, dtype=np.float32)
+        self.dones = np.zeros(num_games, dtype=bool)
+        self.truncated = np.zeros(num_games, dtype=bool)
+        self.active = np.ones(num_games, dtype=bool)
+        # Live views of the batch state; final_* keep the last finished episode
+        self.info = {
+            "iq": batch.iq, "length": batch.lengths, "ticks": batch.ticks,
+            "won": batch.won, "truncated": self.truncated,
+            "final_iq": batch.final_iq, "final_length": batch.final_length,
+            "final_ticks": batch.final_ticks, "final_won": batch.final_won,
+        }
+        self._draw()
+
+    def reset(self, seed=None):
+        """Start every game over and return the first observations"""
+        if seed is not None:
+            self.batch.rng = np.random.default_rng(seed)
+        self.batch.reset()
+        self.dones.fill(False)
+        self.truncated.fill(False)
+        self._draw()
+        return self.obs
+
+    def step(self, actions):
+        """Apply one action per game, redrawing only the cells that changed"""
+        batch = self.batch
+        # Only the old/new head, the old tail and the data point can change
+        rows = np.flatnonzero(~batch.done)
+        old_ptr = batch.head_ptr[rows]
+        old_heads = batch.bodies[rows, old_ptr]
+        tail_slots = (batch.head_ptr[rows] - batch.lengths[rows] + 1) % batch.num_cells
+        old_tails = batch.bodies[rows, tail_slots]
+        tail_moves = batch.growth_pending[rows] == 0
+        old_food = batch.food[rows]
+
+        points, ended = batch.step(actions)
+
+        self.truncated.fill(False)
+        if self.max_ticks is not None:
+            np.greater_equal(batch.ticks, self.max_ticks, out=self.truncated)
+            self.truncated &= ~batch.done
+            batch.finish(self.truncated)
+
+        np.copyto(self.rewards, points)
+        if self.death_penalty:
+            self.rewards[ended & ~batch.final_won] -= self.death_penalty
+        np.logical_or(ended, self.truncated, out=self.dones)
+
+        if batch.auto_reset:
+            # Games that started over in their slot get a full redraw
+            restarted = self.dones[rows]
+            self._draw(rows[restarted])
+            keep = ~restarted
+            rows, old_ptr, old_heads = rows[keep], old_ptr[keep], old_heads[keep]
+            old_tails, tail_moves, old_food = old_tails[keep], tail_moves[keep], old_food[keep]
+
+        planes = self._planes
+        planes[rows[tail_moves], BODY, old_tails[tail_moves]] = 0
+        # Games that crashed only lost their tail; the rest moved one cell
+        moved = batch.head_ptr[rows] != old_ptr
+        rows, old_heads, old_food = rows[moved], old_heads[moved], old_food[moved]
+        planes[rows, HEAD, old_heads] = 0
+        heads = batch.bodies[rows, batch.head_ptr[rows]]
+        planes[rows, BODY, heads] = 1
+        planes[rows, HEAD, heads] = 1
+        planes[rows, FOOD, old_food] = 0
+        planes[rows, FOOD, batch.food[rows]] = 1
+        np.logical_not(batch.done, out=self.active)
+        return self.obs, self.rewards, self.dones, self.info
+
+    def _draw(self, games=None):
+        """Rewrite every plane of the given games (all by default) from the batch arrays"""
+        batch, planes = self.batch, self._planes
+        rows = self._rows if games is None else games
+        planes[rows] = 0
+        planes[rows, BODY] = batch.free_pos[rows] < 0
+        planes[rows, HEAD, batch.bodies[rows, batch.head_ptr[rows]]] = 1
+        planes[rows, FOOD, batch.food[rows]] = 1
+        np.logical_not(batch.done, out=self.active)
+
+def greedy_controller(obs, active):
+    """Batched greedy controller: toward the data, never into a wall or body"""
+    n, _, height, width = obs.shape
+    planes = obs.reshape(n, 3, -1)
+    rows = np.arange(n)
+    heads = planes[:, HEAD].argmax(axis=1)
+    food = planes[:, FOOD].argmax(axis=1)
+    x, y = heads % width, heads // width
+    food_x, food_y = food % width, food // width
+
+    distances = np.empty((n, len(DX)), dtype=np.int64)
+    for d in range(len(DX)):
+        nx, ny = x + DX[d], y + DY[d]
+        inside = (nx >= 0) & (nx < width) & (ny >= 0) & (ny < height)
+        cells = np.where(inside, ny * width + nx, 0)
+        blocked = ~inside | (planes[rows, BODY, cells] > 0)
+        distances[:, d] = np.where(blocked, width + height, np.abs(nx - food_x) + np.abs(ny - food_y))
+    actions = distances.argmin(axis=1)
+    actions[~active] = -1
+    return actions
+
+def run_batched(controller, env):
+    """Play every game of a non-resetting BatchSnakeEnv to the end.
+
+    Returns (final IQ per game, steps played).
+    """
+    steps = 0
+    while env.active.any():
+        steps += int(env.active.sum())
+        env.step(controller(env.obs, env.active))
+    return env.batch.final_iq.copy(), steps
+
+def main():
+    """Same controller, called once per game per tick vs once per tick for all games"""
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else GRID_WIDTH
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else GRID_HEIGHT
+    max_ticks = width * height * 4
+
+    start = time.perf_counter()
+    env = BatchSnakeEnv(num_games, width, height, seed=0, max_ticks=max_ticks, auto_reset=False)
+    final_iq, steps = run_batched(greedy_controller, env)
+    batched = time.perf_counter() - start
+    print(f"🧮 Batched: {num_games} games, {steps} steps in {batched:.2f}s | "
+          f"⚡ {steps / batched:,.0f} steps/sec | Average IQ: {final_iq.mean():.1f}")
+
+    start = time.perf_counter()
+    env = SnakeEnv(width, height, max_ticks=max_ticks)
+    active = np.ones(1, dtype=bool)
+    single_steps = total_iq = 0
+    for game in range(num_games):
+        obs, done = env.reset(seed=game), False
+        while not done:
+            action = int(greedy_controller(obs[None], active)[0])
+            obs, _, done, info = env.step(action)
+            single_steps += 1
+        total_iq += info["iq"]
+    single = time.perf_counter() - start
+    print(f"🐢 One call per game: {num_games} games, {single_steps} steps in {single:.2f}s | "
+          f"⚡ {single_steps / single:,.0f} steps/sec | Average IQ: {total_iq / num_games:.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+AI Training Snake - Neuroevolution Trainer
+Evolves a small NumPy MLP policy on headless games, scoring every genome
+of a generation in parallel with batched forward passes.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT
+from snake_batch import BatchSnakeSim, DX, DY
+from snake_rollout import worker_config, worker_pool
+
+# Policy network: 12 features -> hidden (tanh) -> 4 action logits
+INPUTS = 12
+HIDDEN = 16
+ACTIONS = len(DX)
+GENOME_SIZE = INPUTS * HIDDEN + HIDDEN + HIDDEN * ACTIONS + ACTIONS
+
+GAMES_PER_GENOME = 8
+MAX_TICKS = 5000
+SURVIVAL_WEIGHT = 0.01  # fitness per tick survived (IQ counts 1 per point)
+ELITE_FRACTION = 0.2
+MUTATION_SCALE = 0.1
+BEST_GENOME_FILE = "best_genome.npz"
+
+def unpack(genomes):
+    """(G, GENOME_SIZE) genomes -> per-genome weights (w1, b1, w2, b2)"""
+    genomes = np.asarray(genomes, dtype=np.float32).reshape(-1, GENOME_SIZE)
+    g = len(genomes)
+    i = 0
+    w1 = genomes[:, i:i + INPUTS * HIDDEN].reshape(g, INPUTS, HIDDEN)
+    i += INPUTS * HIDDEN
+    b1 = genomes[:, i:i + HIDDEN]
+    i += HIDDEN
+    w2 = genomes[:, i:i + HIDDEN * ACTIONS].reshape(g, HIDDEN, ACTIONS)
+    i += HIDDEN * ACTIONS
+    b2 = genomes[:, i:i + ACTIONS]
+    return w1, b1, w2, b2
+
+def observe(batch):
+    """Feature rows for every game in a BatchSnakeSim, shape (N, INPUTS).
+
+    Per direction (UP, RIGHT, DOWN, LEFT): is the next cell a wall or body,
+    is the data point that way, and is the snake heading that way.
+    """
+    n, w, c = batch.num_games, batch.width, batch.num_cells
+    rows = np.arange(n)
+    heads = batch.heads().astype(np.int64)
+    x, y = heads % w, heads // w
+    tails = batch.bodies[rows, (batch.head_ptr - batch.lengths + 1) % c]
+    tail_moves = batch.growth_pending == 0
+
+    features = np.zeros((n, INPUTS), dtype=np.float32)
+    for d in range(ACTIONS):
+        nx, ny = x + DX[d], y + DY[d]
+        inside = (nx >= 0) & (nx < w) & (ny >= 0) & (ny < batch.height)
+        cells = np.where(inside, ny * w + nx, 0)
+        # The tail moves out this tick unless the snake is growing
+        body = (batch.free_pos[rows, cells] < 0) & ~((cells == tails) & tail_moves)
+        features[:, d] = ~inside | body
+
+    food_x, food_y = batch.food % w, batch.food // w
+    features[:, 4] = food_y < y
+    features[:, 5] = food_x > x
+    features[:, 6] = food_y > y
+    features[:, 7] = food_x < x
+    features[rows, 8 + batch.directions] = 1
+    return features
+
+def act(genomes, features):
+    """Batched forward pass: features (G, K, INPUTS) -> actions (G, K)"""
+    w1, b1, w2, b2 = unpack(genomes)
+    hidden = np.tanh(np.einsum("gki,gih->gkh", features, w1) + b1[:, None])
+    logits = np.einsum("gkh,gha->gka", hidden, w2) + b2[:, None]
+    return logits.argmax(axis=2)
+
+def evaluate(genomes, seed, width=GRID_WIDTH, height=GRID_HEIGHT,
+             games_per_genome=GAMES_PER_GENOME, max_ticks=MAX_TICKS):
+    """Play games_per_genome seeded games per genome, all in one batch.
+
+    Game j of every genome draws its data from its own stream seeded with
+    seed + j, so a genome scores the same whichever genomes share the batch.
+    Returns (fitness per genome, games played, steps played).
+    """
+    genomes = np.asarray(genomes, dtype=np.float32).reshape(-1, GENOME_SIZE)
+    g, k = len(genomes), games_per_genome
+    seeds = np.tile(seed + np.arange(k), g)
+    batch = BatchSnakeSim(g * k, width, height, auto_reset=False, seeds=seeds)
+    steps = 0
+
+    while not batch.done.all() and batch.ticks.max() < max_ticks:
+        features = observe(batch).reshape(g, k, INPUTS)
+        actions = act(genomes, features).reshape(-1)
+        steps += int((~batch.done).sum())
+        batch.step(actions)
+        batch.finish(batch.starving())
+
+    fitness = batch.iq + SURVIVAL_WEIGHT * batch.ticks
+    return fitness.reshape(g, k).mean(axis=1), g * k, steps
+
+def _evaluate_chunk(task):
+    genomes, seed = task
+    return evaluate(genomes, seed, **worker_config)
+
+def evolve(genomes, fitness, rng):
+    """Next generation: keep the elite, fill up with mutated elite copies"""
+    elite_count = max(1, int(len(genomes) * ELITE_FRACTION))
+    elite = genomes[np.argsort(fitness)[::-1][:elite_count]]
+    parents = elite[rng.integers(0, elite_count, len(genomes) - elite_count)]
+    children = parents + rng.normal(0, MUTATION_SCALE, parents.shape).astype(np.float32)
+    return np.concatenate([elite, children])
+
+def save_genome(path, genome, fitness, generation):
+    """Save a genome with the layer sizes needed to load it back"""
+    np.savez(path, genome=genome, fitness=fitness, generation=generation,
+             inputs=INPUTS, hidden=HIDDEN, actions=ACTIONS)
+
+def load_genome(path=BEST_GENOME_FILE):
+    """Genome saved by save_genome"""
+    with np.load(path) as saved:
+        if (saved["inputs"], saved["hidden"], saved["actions"]) != (INPUTS, HIDDEN, ACTIONS):
+            raise ValueError(f"{path} was saved for a different network shape")
+        return saved["genome"]
+
+def train(generations=50, population_size=128, processes=None, width=GRID_WIDTH,
+          height=GRID_HEIGHT, games_per_genome=GAMES_PER_GENOME, max_ticks=MAX_TICKS,
+          seed=0, best_path=BEST_GENOME_FILE):
+    """Evolve a policy, reporting throughput and keeping the best genome seen so far.
+
+    Genomes are split into one chunk per process; each worker plays its whole
+    chunk as one BatchSnakeSim, so throughput can be compared from 1 to N cores.
+    """
+    rng = np.random.default_rng(seed)
+    genomes = rng.normal(0, 1, (population_size, GENOME_SIZE)).astype(np.float32)
+    config = {"width": width, "height": height,
+              "games_per_genome": games_per_genome, "max_ticks": max_ticks}
+    processes = processes or os.cpu_count() or 1
+
+    best_fitness = -np.inf
+    pool = None
+    if processes > 1:
+        pool = worker_pool(processes, config)
+    try:
+        for generation in range(generations):
+            # Every genome of a generation plays the same seeds (see evaluate)
+            generation_seed = (seed * 1_000_003 + generation) * games_per_genome
+            chunks = [(chunk, generation_seed) for chunk in np.array_split(genomes, processes)
+                      if len(chunk)]
+
+            start = time.perf_counter()
+            if pool:
+                results = pool.map(_evaluate_chunk, chunks)
+            else:
+                results = [evaluate(chunk, generation_seed, **config) for chunk, _ in chunks]
+            elapsed = time.perf_counter() - start
+
+            fitness = np.concatenate([result[0] for result in results])
+            games = sum(result[1] for result in results)
+            steps = sum(result[2] for result in results)
+            leader = int(fitness.argmax())
+            improved = fitness[leader] > best_fitness
+            if improved:
+                best_fitness = fitness[leader]
+                save_genome(best_path, genomes[leader], best_fitness, generation)
+
+            print(f"🧬 Gen {generation:3d} | best {fitness[leader]:7.2f} | mean {fitness.mean():7.2f} | "
+                  f"⚡ {games / elapsed:,.1f} games/sec, {steps / elapsed:,.0f} steps/sec"
+                  f"{' 💾' if improved else ''}")
+            genomes = evolve(genomes, fitness, rng)
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    return load_genome(best_path)
+
+def main():
+    """Train from the command line: generations, processes, population"""
+    generations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    population_size = int(sys.argv[3]) if len(sys.argv) > 3 else 128
+
+    print(f"🧠 Evolving {population_size} genomes on {processes or os.cpu_count()} processes")
+    train(generations, population_size, processes)
+    print(f"💾 Best genome saved to {BEST_GENOME_FILE}")
+
+if __name__ == "__main__":
+    main()
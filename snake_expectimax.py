@@ -0,0 +1,286 @@
+"""
+AI Training Snake - Expectimax Lookahead
+Searches a few moves ahead under a per-move time budget, treating each
+data respawn as a chance node and caching positions in a transposition
+table keyed by an incremental (Zobrist) hash.
+"""
+
+import math
+import random
+import sys
+import time
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT, DIRECTIONS, DataType, SnakeSim
+
+TIME_BUDGET = 0.02   # seconds of search per move
+NODE_BUDGET = None   # positions searched per move (None = no limit)
+MAX_DEPTH = 16
+RESPAWN_SAMPLES = 2  # data positions tried per data type at a chance node
+DEATH_VALUE = -100.0
+TRAP_PENALTY = 50.0  # scaled by how much of the body no longer fits
+DISCOUNT = 0.95      # per move, so data now beats the same data later
+TABLE_LIMIT = 500000
+
+# Chance node outcomes: (points, probability) per DataType
+DATA_OUTCOMES = tuple((data_type.value[2], data_type.value[3]) for data_type in DataType)
+
+class _OutOfTime(Exception):
+    pass
+
+class ExpectimaxAutopilot:
+    """Depth-limited expectimax with iterative deepening.
+
+    Moves are max nodes; eating the data is a chance node over the next
+    DataType (0.7/0.2/0.1) and a few sampled free cells. Positions are keyed
+    by a Zobrist hash of body cells and links (so body order counts), head,
+    heading, growth and data, updated as moves are made and unmade, so
+    transpositions are evaluated once.
+    Same interface as the autopilots in snake_autopilot.
+    """
+
+    name = "Expectimax"
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, time_budget=TIME_BUDGET,
+                 max_depth=MAX_DEPTH, seed=0, node_budget=NODE_BUDGET):
+        self.width = width
+        self.height = height
+        # time_budget=None with a node_budget makes every move reproducible
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.max_depth = max_depth
+        cells = width * height
+        self.neighbours = [
+            [(d, (c // width + dy) * width + c % width + dx) for d, (dx, dy) in enumerate(DIRECTIONS)
+             if 0 <= c % width + dx < width and 0 <= c // width + dy < height]
+            for c in range(cells)
+        ]
+
+        rng = random.Random(seed)
+        self.body_keys = [rng.getrandbits(64) for _ in range(cells)]
+        # One key per body link (cell, direction to the next segment toward
+        # the head), so bodies over the same cells in a different order differ
+        self.link_keys = [[rng.getrandbits(64) for _ in DIRECTIONS] for _ in range(cells)]
+        self.step_direction = {dx + dy * width: d for d, (dx, dy) in enumerate(DIRECTIONS)}
+        self.head_keys = [rng.getrandbits(64) for _ in range(cells)]
+        self.heading_keys = [rng.getrandbits(64) for _ in DIRECTIONS]
+        self.growth_keys = [rng.getrandbits(64) for _ in range(8)]
+        self.food_keys = {
+            points: [rng.getrandbits(64) for _ in range(cells)] for points, _ in DATA_OUTCOMES
+        }
+        self.table = {}
+        self.nodes = 0
+        self.table_hits = 0
+        self.depth_reached = 0
+
+    def __call__(self, sim):
+        return self.next_direction(sim.ai_snake, sim.data_point.position, sim.data_point.points)
+
+    def next_direction(self, snake, food, food_points=1):
+        """Best direction found within the time (or node) budget"""
+        if len(self.table) > TABLE_LIMIT:
+            self.table.clear()
+        self._load(snake, tuple(food), food_points)
+        self.deadline = math.inf if self.time_budget is None else time.perf_counter() + self.time_budget
+        self.node_limit = math.inf if self.node_budget is None else self.nodes + self.node_budget
+
+        best = None
+        for depth in range(1, self.max_depth + 1):
+            try:
+                choice = self._root(depth)
+            except _OutOfTime:
+                break
+            best = choice
+            self.depth_reached = depth
+            if choice is None:
+                break
+        if best is None:
+            return None
+        return DIRECTIONS[best]
+
+    def _load(self, snake, food, food_points):
+        """Copy the real game into flat search state and hash it"""
+        w = self.width
+        self.body = [x + y * w for x, y in reversed(snake.body)]  # tail first
+        self.tail = 0
+        self.occupied = set(self.body)
+        self.heading = DIRECTIONS.index(tuple(snake.direction))
+        self.growth = min(snake.growth_pending, len(self.growth_keys) - 1)
+        self.food = food[0] + food[1] * w
+        self.food_points = food_points
+
+        key = self.head_keys[self.body[-1]] ^ self.heading_keys[self.heading]
+        key ^= self.growth_keys[self.growth] ^ self.food_keys[food_points][self.food]
+        for cell in self.occupied:
+            key ^= self.body_keys[cell]
+        for cell, next_cell in zip(self.body, self.body[1:]):
+            key ^= self.link_keys[cell][self.step_direction[next_cell - cell]]
+        self.key = key
+
+    def _root(self, depth):
+        best, best_value = None, None
+        for direction, value in self._moves(depth):
+            if best_value is None or value > best_value:
+                best, best_value = direction, value
+        return best
+
+    def _moves(self, depth):
+        head = self.body[-1]
+        reverse = (self.heading + 2) % 4
+        for direction, cell in self.neighbours[head]:
+            # Reversing is ignored by change_direction, so it is not a move
+            if direction == reverse:
+                continue
+            yield direction, self._after_move(direction, cell, depth)
+
+    def _search(self, depth):
+        """Value of the current position with depth moves left"""
+        self.nodes += 1
+        if self.nodes > self.node_limit:
+            raise _OutOfTime
+        if self.nodes % 64 == 0 and time.perf_counter() > self.deadline:
+            raise _OutOfTime
+        cached = self.table.get(self.key)
+        if cached is not None and cached[0] >= depth:
+            self.table_hits += 1
+            return cached[1]
+
+        if depth == 0:
+            value = self._evaluate()
+        else:
+            value = DEATH_VALUE
+            for _, move_value in self._moves(depth):
+                value = max(value, move_value)
+        self.table[self.key] = (depth, value)
+        return value
+
+    def _after_move(self, direction, cell, depth):
+        """Make a move, score what follows, then unmake it"""
+        body, occupied = self.body, self.occupied
+        old_key, old_heading, old_growth, old_tail = self.key, self.heading, self.growth, self.tail
+        key = old_key ^ self.head_keys[body[-1]] ^ self.head_keys[cell]
+        key ^= self.heading_keys[old_heading] ^ self.heading_keys[direction]
+
+        # Only remove tail if not growing
+        tail = None
+        if old_growth:
+            self.growth = old_growth - 1
+            key ^= self.growth_keys[old_growth] ^ self.growth_keys[self.growth]
+        else:
+            tail = body[self.tail]
+            self.tail += 1
+            occupied.discard(tail)
+            key ^= self.body_keys[tail]
+
+        if cell in occupied:
+            value = DEATH_VALUE
+        else:
+            occupied.add(cell)
+            key ^= self.body_keys[cell]
+            # The old head links to the new one, and the old tail's link goes
+            # (with one segment, those two are the same link and cancel out)
+            key ^= self.link_keys[body[-1]][direction]
+            body.append(cell)
+            if tail is not None:
+                key ^= self.link_keys[tail][self.step_direction[body[self.tail] - tail]]
+            self.heading = direction
+            self.key = key
+            if cell == self.food:
+                value = self._chance(depth)
+            else:
+                value = DISCOUNT * self._search(depth - 1)
+            body.pop()
+            occupied.discard(cell)
+
+        if tail is not None:
+            occupied.add(tail)
+        self.key, self.heading, self.growth, self.tail = old_key, old_heading, old_growth, old_tail
+        return value
+
+    def _chance(self, depth):
+        """Eat the data, then average over respawned DataTypes and cells"""
+        points, food, old_growth, old_key = self.food_points, self.food, self.growth, self.key
+        # Premium data grows more
+        self.growth = min(old_growth + (2 if points >= 10 else 1), len(self.growth_keys) - 1)
+        key = old_key ^ self.growth_keys[old_growth] ^ self.growth_keys[self.growth]
+        key ^= self.food_keys[points][food]
+
+        cells = self._respawn_cells(key)
+        if not cells:
+            # Neural network fills the whole board - nothing left to lose
+            value = points - DEATH_VALUE
+        else:
+            value = 0.0
+            for new_points, probability in DATA_OUTCOMES:
+                for cell in cells:
+                    self.food, self.food_points = cell, new_points
+                    self.key = key ^ self.food_keys[new_points][cell]
+                    value += probability * self._search(depth - 1) / len(cells)
+            value = points + DISCOUNT * value
+
+        self.food, self.food_points, self.key, self.growth = food, points, old_key, old_growth
+        return value
+
+    def _respawn_cells(self, key):
+        """A few free cells picked from the hash, so revisits pick the same ones"""
+        cells = []
+        total = self.width * self.height
+        if len(self.occupied) >= total:
+            return cells
+        for sample in range(RESPAWN_SAMPLES):
+            cell = (key >> (sample * 20)) % total
+            while cell in self.occupied or cell in cells:
+                cell = (cell + 1) % total
+                if len(cells) + len(self.occupied) >= total:
+                    return cells
+            cells.append(cell)
+        return cells
+
+    def _evaluate(self):
+        """Leaf value: pull toward the data, push away from dead ends"""
+        w = self.width
+        head = self.body[-1]
+        distance = abs(head % w - self.food % w) + abs(head // w - self.food // w)
+        value = self.food_points / (1 + distance)
+
+        # Flood fill until there is room for the whole body
+        length = len(self.body) - self.tail + self.growth
+        seen = {head}
+        frontier = [head]
+        while frontier and len(seen) <= length:
+            cell = frontier.pop()
+            for _, neighbour in self.neighbours[cell]:
+                if neighbour not in seen and neighbour not in self.occupied:
+                    seen.add(neighbour)
+                    frontier.append(neighbour)
+        if len(seen) <= length:
+            value -= TRAP_PENALTY * (1 - len(seen) / (length + 1))
+        return value
+
+def main():
+    """Play seeded expectimax games and report search statistics"""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else TIME_BUDGET
+    width = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    height = int(sys.argv[4]) if len(sys.argv) > 4 else 20
+    autopilot = ExpectimaxAutopilot(width, height, time_budget=budget)
+    sim = SnakeSim(width, height)
+    ticks = total_iq = best_iq = 0
+    depths = 0
+
+    start = time.perf_counter()
+    for game in range(games):
+        sim.reset(seed=game)
+        while not sim.done and sim.ticks < 5000:
+            sim.step(autopilot(sim))
+            depths += autopilot.depth_reached
+        ticks += sim.ticks
+        total_iq += sim.ai_snake.iq
+        best_iq = max(best_iq, sim.ai_snake.iq)
+    elapsed = time.perf_counter() - start
+
+    print(f"🧠 {games} expectimax games on {width}x{height}, {ticks} moves in {elapsed:.2f}s")
+    print(f"📊 Average IQ: {total_iq / games:.1f} | Best IQ: {best_iq} | average depth {depths / ticks:.1f}")
+    print(f"⚡ {autopilot.nodes / elapsed:,.0f} nodes/sec | {autopilot.table_hits:,} transposition hits")
+
+if __name__ == "__main__":
+    main()
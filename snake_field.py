@@ -0,0 +1,244 @@
+"""
+AI Training Snake - Distance-to-Data Field
+Shortest-path distance from every cell to the data point around the body,
+kept up to date as the snake moves instead of re-running BFS every tick,
+and readable as a NumPy array for feature extraction.
+"""
+
+import heapq
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT, DIRECTIONS, SnakeSim
+
+UNREACHABLE = -1
+
+class DistanceField:
+    """Distances to the data point through free cells, updated per move.
+
+    Call sync(snake, food) once per tick with any edition's AISnake. A new
+    data position re-runs the BFS; a normal move only repairs what the freed
+    tail cell shortens and what the new head cell cuts off. field is an
+    (height, width) int32 array of distances, UNREACHABLE on walled-off
+    cells and on the body itself.
+    """
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        cells = width * height
+        self.neighbours = [
+            [(c // width + dy) * width + c % width + dx for dx, dy in DIRECTIONS
+             if 0 <= c % width + dx < width and 0 <= c // width + dy < height]
+            for c in range(cells)
+        ]
+        self.infinity = cells
+        self.field = np.full((height, width), UNREACHABLE, dtype=np.int32)
+        self._flat_field = self.field.reshape(-1)
+        self.body = deque()
+        self.food = None
+        self.rebuilds = 0
+        self.repairs = 0
+
+    def sync(self, snake, food):
+        """Catch up with the snake and data after one move (or rebuild)"""
+        food = tuple(food)
+        body = snake.body
+        if food != self.food:
+            self.rebuild(body, food)
+            return
+        if self.body and body[0] == self.body[0] and len(body) == len(self.body):
+            return
+        grew = len(body) - len(self.body)
+        head = body[0]
+        if not (self.body and len(body) > 1 and body[1] == self.body[0] and grew in (0, 1)
+                and 0 <= head[0] < self.width and 0 <= head[1] < self.height):
+            self.rebuild(body, food)
+            return
+
+        self.changed = []
+        # Tail moves out first, so following it is not a collision
+        if not grew:
+            self._free(self._flat(self.body.pop()))
+        cell = self._flat(head)
+        if self.blocked[cell]:
+            self.rebuild(body, food)
+            return
+        self.body.appendleft(head)
+        self._block(cell)
+        self._publish(self.changed)
+        self.repairs += 1
+
+    def rebuild(self, body, food):
+        """BFS from the data point over the whole board"""
+        w = self.width
+        self.body = deque(body)
+        self.food = tuple(food)
+        self.blocked = bytearray(w * self.height)
+        for x, y in self.body:
+            if 0 <= x < w and 0 <= y < self.height:
+                self.blocked[y * w + x] = 1
+        dist = self.dist = [self.infinity] * (w * self.height)
+        start = self._flat(self.food)
+        dist[start] = 0
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for cell in frontier:
+                step = dist[cell] + 1
+                for neighbour in self.neighbours[cell]:
+                    if dist[neighbour] > step and not self.blocked[neighbour]:
+                        dist[neighbour] = step
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        self._flat_field[:] = dist
+        self._flat_field[self._flat_field >= self.infinity] = UNREACHABLE
+        self.rebuilds += 1
+
+    def distance(self, cell):
+        """Moves from cell to the data point (UNREACHABLE if there is no way)"""
+        if not (0 <= cell[0] < self.width and 0 <= cell[1] < self.height):
+            return UNREACHABLE
+        return int(self.field[cell[1], cell[0]])
+
+    def neighbour_distances(self, cell):
+        """Distance after one step in each of DIRECTIONS, as a feature row"""
+        return np.array([self.distance((cell[0] + dx, cell[1] + dy)) for dx, dy in DIRECTIONS],
+                        dtype=np.int32)
+
+    def _flat(self, cell):
+        return cell[1] * self.width + cell[0]
+
+    def _publish(self, cells):
+        """Copy changed distances into the NumPy field in one assignment"""
+        if cells:
+            values = np.array([self.dist[c] for c in cells], dtype=np.int32)
+            values[values >= self.infinity] = UNREACHABLE
+            self._flat_field[cells] = values
+
+    def _free(self, cell):
+        """A cell opens up: it can only shorten distances, so relax outward"""
+        dist, blocked = self.dist, self.blocked
+        blocked[cell] = 0
+        best = min((dist[n] for n in self.neighbours[cell] if not blocked[n]), default=self.infinity)
+        if best + 1 >= dist[cell]:
+            return
+        dist[cell] = best + 1
+        self.changed.append(cell)
+        queue = deque([cell])
+        while queue:
+            current = queue.popleft()
+            step = dist[current] + 1
+            for neighbour in self.neighbours[current]:
+                if dist[neighbour] > step and not blocked[neighbour]:
+                    dist[neighbour] = step
+                    self.changed.append(neighbour)
+                    queue.append(neighbour)
+
+    def _block(self, cell):
+        """A cell fills up: repair only the cells whose every shortest path used it"""
+        dist, blocked, neighbours = self.dist, self.blocked, self.neighbours
+        old = dist[cell]
+        blocked[cell] = 1
+        dist[cell] = self.infinity
+        self.changed.append(cell)
+        if old >= self.infinity:
+            return
+
+        # Level by level away from the cell: a cell is cut off when no neighbour
+        # one step closer to the data is still standing
+        lost = set()
+        level = [n for n in neighbours[cell] if dist[n] == old + 1]
+        while level:
+            next_level = []
+            for current in level:
+                if current in lost:
+                    continue
+                closer = dist[current] - 1
+                if any(dist[n] == closer and n not in lost for n in neighbours[current]):
+                    continue
+                lost.add(current)
+                next_level += [n for n in neighbours[current] if dist[n] == closer + 2]
+            level = next_level
+
+        # Re-settle the lost cells from their surviving neighbours (Dijkstra
+        # with unit steps, so a heap of (distance, cell))
+        for current in lost:
+            dist[current] = self.infinity
+        heap = []
+        for current in lost:
+            best = min((dist[n] for n in neighbours[current] if not blocked[n] and n not in lost),
+                       default=self.infinity)
+            if best < self.infinity:
+                heap.append((best + 1, current))
+        heapq.heapify(heap)
+        while heap:
+            d, current = heapq.heappop(heap)
+            if d >= dist[current]:
+                continue
+            dist[current] = d
+            for neighbour in neighbours[current]:
+                if neighbour in lost and d + 1 < dist[neighbour]:
+                    heapq.heappush(heap, (d + 1, neighbour))
+        self.changed += lost
+
+class DistanceFieldPolicy:
+    """Greedy on true path distance: step to the neighbour closest to the data
+    around the body, instead of the closest as the crow flies"""
+
+    name = "Distance field"
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.field = DistanceField(width, height)
+
+    def __call__(self, sim):
+        return self.next_direction(sim.ai_snake, sim.data_point.position)
+
+    def next_direction(self, snake, food):
+        """Direction for the next move, or None if every step is blocked"""
+        self.field.sync(snake, food)
+        reverse = (-snake.direction[0], -snake.direction[1])
+        best, best_distance = None, None
+        for direction, distance in zip(DIRECTIONS, self.field.neighbour_distances(snake.body[0])):
+            if direction == reverse or distance == UNREACHABLE:
+                continue
+            if best_distance is None or distance < best_distance:
+                best, best_distance = direction, distance
+        return best
+
+def main():
+    """Time incremental repairs against a full BFS every tick"""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else GRID_WIDTH
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else GRID_HEIGHT
+    policy = DistanceFieldPolicy(width, height)
+    check = DistanceField(width, height)
+    sim = SnakeSim(width, height)
+    ticks = total_iq = 0
+    incremental = full = 0.0
+
+    for game in range(games):
+        sim.reset(seed=game)
+        while not sim.done and sim.ticks < 20000:
+            start = time.perf_counter()
+            direction = policy(sim)
+            incremental += time.perf_counter() - start
+            start = time.perf_counter()
+            check.rebuild(sim.ai_snake.body, sim.data_point.position)
+            full += time.perf_counter() - start
+            sim.step(direction)
+            ticks += 1
+        total_iq += sim.ai_snake.iq
+
+    field = policy.field
+    print(f"🧠 {games} distance-field games on {width}x{height}, {ticks} ticks, "
+          f"average IQ {total_iq / games:.1f}")
+    print(f"⚡ Incremental: {incremental / ticks * 1e6:.1f} µs per tick "
+          f"({field.repairs} repairs, {field.rebuilds} rebuilds) | "
+          f"full BFS: {full / ticks * 1e6:.1f} µs per tick")
+
+if __name__ == "__main__":
+    main()
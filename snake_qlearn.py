@@ -0,0 +1,151 @@
+"""
+AI Training Snake - Tabular Q-Learning
+A Q-learning agent over a compact danger/data/heading state, with the
+Q-table in a memory-mapped .npy file that training processes share.
+"""
+
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT, DIRECTIONS, SnakeSim
+
+# State: 4 danger bits x 3x3 data direction x 4 headings
+DANGER_STATES = 2 ** len(DIRECTIONS)
+FOOD_STATES = 9
+STATES = DANGER_STATES * FOOD_STATES * len(DIRECTIONS)
+ACTIONS = len(DIRECTIONS)
+
+QTABLE_FILE = "qtable.npy"
+DEATH_PENALTY = 10.0
+
+def encode_state(snake, food, width=GRID_WIDTH, height=GRID_HEIGHT):
+    """State index from any edition's AISnake and the data point (x, y)"""
+    head = snake.body[0]
+    tail = snake.body[-1]
+    danger = 0
+    for bit, (dx, dy) in enumerate(DIRECTIONS):
+        cell = (head[0] + dx, head[1] + dy)
+        if not (0 <= cell[0] < width and 0 <= cell[1] < height):
+            danger |= 1 << bit
+        # The tail moves out this tick unless the snake is growing
+        elif cell in snake.occupied and (cell != tail or snake.growth_pending):
+            danger |= 1 << bit
+    food_x = (food[0] > head[0]) - (food[0] < head[0]) + 1
+    food_y = (food[1] > head[1]) - (food[1] < head[1]) + 1
+    heading = DIRECTIONS.index(tuple(snake.direction))
+    return (danger * FOOD_STATES + food_y * 3 + food_x) * len(DIRECTIONS) + heading
+
+def open_qtable(path=QTABLE_FILE):
+    """Memory-map the Q-table, creating a zeroed one on first use.
+
+    Every process that opens the same file shares its pages, so parallel
+    trainers update one table and a restart picks it up with no parsing.
+    """
+    if not os.path.exists(path):
+        table = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(STATES, ACTIONS))
+        table.flush()
+        return table
+    table = np.lib.format.open_memmap(path, mode="r+")
+    if table.shape != (STATES, ACTIONS):
+        raise ValueError(f"{path} holds a {table.shape} table, expected {(STATES, ACTIONS)}")
+    return table
+
+class QAgent:
+    """Epsilon-greedy tabular Q-learning over encode_state.
+
+    Same interface as the autopilots: next_direction(snake, food), or call
+    it with a SnakeSim to use it as a snake_rollout policy.
+    """
+
+    name = "Q-table"
+
+    def __init__(self, path=QTABLE_FILE, width=GRID_WIDTH, height=GRID_HEIGHT,
+                 alpha=0.1, gamma=0.9, epsilon=0.0, seed=None):
+        self.q = open_qtable(path)
+        self.width = width
+        self.height = height
+        self.alpha = alpha
+        self.gamma = gamma
+        self.epsilon = epsilon
+        self.rng = random.Random(seed)
+
+    def __call__(self, sim):
+        return self.next_direction(sim.ai_snake, sim.data_point.position)
+
+    def next_direction(self, snake, food):
+        """Greedy (or exploring) direction for the current position"""
+        return DIRECTIONS[self.choose(encode_state(snake, food, self.width, self.height))]
+
+    def choose(self, state):
+        if self.rng.random() < self.epsilon:
+            return self.rng.randrange(ACTIONS)
+        return int(self.q[state].argmax())
+
+    def learn(self, state, action, reward, next_state, done):
+        """One Q-learning update, written straight into the shared table"""
+        target = reward if done else reward + self.gamma * float(self.q[next_state].max())
+        self.q[state, action] += self.alpha * (target - self.q[state, action])
+
+def train_episodes(agent, episodes, seed=0, width=GRID_WIDTH, height=GRID_HEIGHT):
+    """Run training episodes, returns (episodes, ticks, total IQ, best IQ)"""
+    sim = SnakeSim(width, height)
+    ticks = total_iq = best_iq = 0
+
+    for episode in range(episodes):
+        sim.reset(seed=seed + episode)
+        snake = sim.ai_snake
+        state = encode_state(snake, sim.data_point.position, width, height)
+        # Episodes that starve are looping, not learning anything new
+        while not sim.done and not sim.starving():
+            action = agent.choose(state)
+            points = sim.step(DIRECTIONS[action])
+            reward = points - DEATH_PENALTY if sim.done and not sim.won else points
+            next_state = encode_state(snake, sim.data_point.position, width, height)
+            agent.learn(state, action, reward, next_state, sim.done)
+            state = next_state
+        ticks += sim.ticks
+        total_iq += snake.iq
+        best_iq = max(best_iq, snake.iq)
+
+    agent.q.flush()
+    return episodes, ticks, total_iq, best_iq
+
+def _train_worker(task):
+    path, episodes, seed, epsilon = task
+    agent = QAgent(path, epsilon=epsilon, seed=seed)
+    return train_episodes(agent, episodes, seed)
+
+def main():
+    """Train on every core against one shared Q-table: episodes, processes"""
+    episodes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    epsilon = 0.1
+
+    # Create the table once up front so workers only ever map it
+    open_qtable(QTABLE_FILE).flush()
+    share = -(-episodes // processes)
+    tasks = [(QTABLE_FILE, share, worker * share, epsilon) for worker in range(processes)]
+
+    start = time.perf_counter()
+    if processes == 1:
+        results = [_train_worker(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(_train_worker, tasks)
+    elapsed = time.perf_counter() - start
+
+    played = sum(result[0] for result in results)
+    ticks = sum(result[1] for result in results)
+    average_iq = sum(result[2] for result in results) / played
+    best_iq = max(result[3] for result in results)
+    print(f"🧠 {played} Q-learning episodes on {processes} processes in {elapsed:.2f}s")
+    print(f"⚡ {played / elapsed:,.1f} episodes/sec | {ticks / elapsed:,.0f} steps/sec")
+    print(f"📊 Average IQ: {average_iq:.1f} | Best IQ: {best_iq} | Q-table: {QTABLE_FILE}")
+
+if __name__ == "__main__":
+    main()
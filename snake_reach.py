@@ -0,0 +1,266 @@
+"""
+AI Training Snake - Reachability Oracle
+Connected regions of free cells, kept up to date as the snake moves, so
+controllers can ask how much room a move leaves and whether the tail can
+still be reached without flood-filling the board every tick.
+"""
+
+import sys
+import time
+from collections import deque
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT, SnakeSim
+
+# Ring around a cell in walking order (N, NE, E, SE, S, SW, W, NW): cells
+# next to each other in the ring are grid neighbours too
+RING = ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+
+class ReachabilityOracle:
+    """Free-cell regions of one snake's board, updated a head and a tail at a time.
+
+    Call sync(snake) once per tick with any edition's AISnake. A normal move
+    costs a tail merge (small region relabelled into the large one) and a
+    head cut, which only searches when the cut might split a region - and
+    then only as far as the smaller side. Anything else (restarts, several
+    ticks at once) rebuilds from scratch.
+    """
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        cells = width * height
+        self.neighbours = [[] for _ in range(cells)]
+        self.ring = [[] for _ in range(cells)]
+        for y in range(height):
+            for x in range(width):
+                cell = y * width + x
+                for dx, dy in RING:
+                    nx, ny = x + dx, y + dy
+                    inside = 0 <= nx < width and 0 <= ny < height
+                    self.ring[cell].append(ny * width + nx if inside else -1)
+                    if inside and (dx == 0 or dy == 0):
+                        self.neighbours[cell].append(ny * width + nx)
+        self.body = deque()
+        self.rebuild(())
+
+    def rebuild(self, body):
+        """Label every free region from scratch"""
+        w = self.width
+        cells = w * self.height
+        self.body = deque(body)
+        self.blocked = bytearray(cells)
+        for x, y in self.body:
+            if 0 <= x < w and 0 <= y < self.height:
+                self.blocked[y * w + x] = 1
+        self.labels = [-1] * cells
+        self.members = {}
+        self.next_label = 0
+        for cell in range(cells):
+            if not self.blocked[cell] and self.labels[cell] < 0:
+                region = self._fill(cell)
+                self._new_region(region)
+
+    def sync(self, snake):
+        """Catch up with the snake after one move (or rebuild if it did more)"""
+        body = snake.body
+        head = body[0]
+        if self.body and head == self.body[0] and len(body) == len(self.body):
+            return
+        grew = len(body) - len(self.body)
+        if not (self.body and len(body) > 1 and body[1] == self.body[0] and grew in (0, 1)
+                and self._inside(head)):
+            self.rebuild(body)
+            return
+
+        # Tail moves out first, so following it is not a collision
+        if not grew:
+            self._free(self._flat(self.body.pop()))
+        cell = self._flat(head)
+        if self.blocked[cell]:
+            self.rebuild(body)
+            return
+        self.body.appendleft(head)
+        self._occupy(cell)
+
+    def area(self, cell):
+        """Free cells reachable from cell (0 if it is a wall or body)"""
+        if not self._inside(cell):
+            return 0
+        label = self.labels[self._flat(cell)]
+        return len(self.members[label]) if label >= 0 else 0
+
+    def tail_reachable(self, cell):
+        """The tail borders the free region that holds cell"""
+        if not self._inside(cell) or not self.body:
+            return False
+        label = self.labels[self._flat(cell)]
+        if label < 0:
+            return False
+        tail = self._flat(self.body[-1])
+        return any(self.labels[n] == label for n in self.neighbours[tail])
+
+    def is_safe(self, snake, direction):
+        """Moving this way keeps room for the whole body, or a way to the tail"""
+        head = snake.body[0]
+        cell = (head[0] + direction[0], head[1] + direction[1])
+        if not self._inside(cell):
+            return False
+        if cell == snake.body[-1] and snake.growth_pending == 0:
+            # Following the tail is always safe
+            return True
+        if self.blocked[self._flat(cell)]:
+            return False
+        return self.area(cell) > len(snake.body) or self.tail_reachable(cell)
+
+    def _inside(self, cell):
+        return 0 <= cell[0] < self.width and 0 <= cell[1] < self.height
+
+    def _flat(self, cell):
+        return cell[1] * self.width + cell[0]
+
+    def _fill(self, start):
+        region = {start}
+        frontier = [start]
+        while frontier:
+            cell = frontier.pop()
+            for neighbour in self.neighbours[cell]:
+                if not self.blocked[neighbour] and neighbour not in region:
+                    region.add(neighbour)
+                    frontier.append(neighbour)
+        return region
+
+    def _new_region(self, region):
+        label = self.next_label
+        self.next_label += 1
+        for cell in region:
+            self.labels[cell] = label
+        self.members[label] = region
+        return label
+
+    def _free(self, cell):
+        """A cell opens up: join it to its neighbours, merging their regions"""
+        self.blocked[cell] = 0
+        labels = {self.labels[n] for n in self.neighbours[cell] if not self.blocked[n]}
+        if not labels:
+            self._new_region({cell})
+            return
+        # Relabel the smaller regions into the largest
+        keep = max(labels, key=lambda label: len(self.members[label]))
+        region = self.members[keep]
+        for label in labels:
+            if label != keep:
+                for other in self.members.pop(label):
+                    self.labels[other] = keep
+                    region.add(other)
+        self.labels[cell] = keep
+        region.add(cell)
+
+    def _occupy(self, cell):
+        """A cell fills up: drop it from its region, which may split in two or more"""
+        label = self.labels[cell]
+        self.blocked[cell] = 1
+        self.labels[cell] = -1
+        region = self.members[label]
+        region.discard(cell)
+        if not region:
+            del self.members[label]
+            return
+
+        starts = [n for n in self.neighbours[cell] if not self.blocked[n]]
+        if len(starts) > 1 and not self._ring_connected(cell, starts):
+            self._split(label, starts)
+
+    def _ring_connected(self, cell, starts):
+        """Free neighbours touch through free ring cells, so nothing split"""
+        ring = self.ring[cell]
+        free = [c >= 0 and not self.blocked[c] for c in ring]
+        if all(free):
+            return True
+        # Number the runs of free ring cells, starting after a blocked one
+        first = free.index(False)
+        run, runs = 0, {}
+        for i in range(first + 1, first + 1 + len(ring)):
+            i %= len(ring)
+            if not free[i]:
+                run += 1
+            else:
+                runs[ring[i]] = run
+        return len({runs[start] for start in starts}) == 1
+
+    def _split(self, label, starts):
+        """Search out from each neighbour in lockstep; searches that meet join up,
+        and a search that runs dry has found a region of its own. The last one
+        left is the big side and keeps the old label untouched."""
+        searches = [{start} for start in starts]
+        frontiers = [deque([start]) for start in starts]
+        parent = list(range(len(starts)))
+        owner = {start: i for i, start in enumerate(starts)}
+        active = set(range(len(starts)))
+
+        def find(i):
+            while parent[i] != i:
+                i = parent[i]
+            return i
+
+        while len(active) > 1:
+            for i in list(active):
+                if i not in active or len(active) == 1:
+                    continue
+                if not frontiers[i]:
+                    active.discard(i)
+                    self.members[label] -= searches[i]
+                    self._new_region(searches[i])
+                    continue
+                cell = frontiers[i].popleft()
+                for neighbour in self.neighbours[cell]:
+                    if self.blocked[neighbour]:
+                        continue
+                    other = owner.get(neighbour)
+                    if other is None:
+                        owner[neighbour] = i
+                        searches[i].add(neighbour)
+                        frontiers[i].append(neighbour)
+                        continue
+                    j = find(other)
+                    if j != i:
+                        # Two searches met: one region, keep searching as one
+                        parent[j] = i
+                        searches[i] |= searches[j]
+                        frontiers[i].extend(frontiers[j])
+                        active.discard(j)
+
+def main():
+    """Time incremental updates against rebuilding every tick on autopilot games"""
+    # Imported here: the autopilot uses this module itself
+    from snake_autopilot import Autopilot
+
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else GRID_WIDTH
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else GRID_HEIGHT
+    autopilot = Autopilot(width, height)
+    oracle = ReachabilityOracle(width, height)
+    sim = SnakeSim(width, height)
+    ticks = 0
+    synced = rebuilt = 0.0
+
+    for game in range(games):
+        sim.reset(seed=game)
+        while not sim.done and sim.ticks < 20000:
+            sim.step(autopilot(sim))
+            if sim.done:
+                break
+            start = time.perf_counter()
+            oracle.sync(sim.ai_snake)
+            synced += time.perf_counter() - start
+            if sim.ticks % 50 == 0:
+                start = time.perf_counter()
+                oracle.rebuild(sim.ai_snake.body)
+                rebuilt += (time.perf_counter() - start) * 50
+            ticks += 1
+
+    print(f"🧠 {games} autopilot games on {width}x{height}, {ticks} ticks")
+    print(f"⚡ Incremental: {synced / ticks * 1e6:.1f} µs per tick | "
+          f"full flood fill: {rebuilt / ticks * 1e6:.1f} µs per tick")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+AI Training Snake - Rollout Pool
+Plays many seeded headless games across a process pool and streams
+back one result per game as workers finish.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT, DIRECTIONS, SnakeSim
+
+MAX_TICKS = 50000
+
+def greedy_policy(sim):
+    """Head for the data point, never stepping straight into a wall or the body"""
+    snake = sim.ai_snake
+    head = snake.body[0]
+    tail = snake.body[-1]
+    food_x, food_y = sim.data_point.position
+
+    best, best_distance = None, None
+    for direction in DIRECTIONS:
+        if direction[0] == -snake.direction[0] and direction[1] == -snake.direction[1]:
+            continue
+        cell = (head[0] + direction[0], head[1] + direction[1])
+        # The tail moves out this tick unless the snake is growing
+        safe = cell in snake.free_cells.index or (cell == tail and snake.growth_pending == 0)
+        if not safe:
+            continue
+        distance = abs(cell[0] - food_x) + abs(cell[1] - food_y)
+        if best_distance is None or distance < best_distance:
+            best, best_distance = direction, distance
+    return best
+
+def play_game(seed, policy=greedy_policy, width=GRID_WIDTH, height=GRID_HEIGHT, max_ticks=MAX_TICKS):
+    """Play one seeded game to the end and summarise it"""
+    sim = SnakeSim(width, height, seed=seed)
+    while not sim.done and sim.ticks < max_ticks:
+        sim.step(policy(sim))
+
+    snake = sim.ai_snake
+    return {
+        "seed": seed,
+        "iq": snake.iq,
+        "length": len(snake.body),
+        "data_consumed": snake.data_consumed,
+        "premium_consumed": snake.premium_consumed,
+        "ticks": sim.ticks,
+        "level": snake.level.value[1],
+        "won": sim.won,
+    }
+
+# Per-worker game settings, sent once when the pool starts
+worker_config = {}
+
+def init_worker(config):
+    """Pool initializer: keep this run's settings in the worker's worker_config"""
+    worker_config.clear()
+    worker_config.update(config)
+
+def worker_pool(processes, config):
+    """Process pool whose workers find config in worker_config"""
+    return multiprocessing.Pool(processes, initializer=init_worker, initargs=(config,))
+
+def _play_seed(seed):
+    return play_game(seed, **worker_config)
+
+def run_rollouts(seeds, policy=greedy_policy, processes=None, width=GRID_WIDTH,
+                 height=GRID_HEIGHT, max_ticks=MAX_TICKS, chunksize=16):
+    """Yield play_game results in completion order.
+
+    Workers only receive seeds and return summaries - no per-tick state crosses
+    process boundaries. policy must be picklable (a module-level function).
+    """
+    config = {"policy": policy, "width": width, "height": height, "max_ticks": max_ticks}
+    processes = processes or os.cpu_count() or 1
+
+    if processes == 1:
+        for seed in seeds:
+            yield play_game(seed, **config)
+        return
+
+    with worker_pool(processes, config) as pool:
+        yield from pool.imap_unordered(_play_seed, seeds, chunksize=chunksize)
+
+def main():
+    """Run seeded greedy games on every core and report throughput"""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    start = time.perf_counter()
+    results = list(run_rollouts(range(games), processes=processes))
+    elapsed = time.perf_counter() - start
+
+    ticks = sum(result["ticks"] for result in results)
+    best = max(results, key=lambda result: result["iq"])
+    average_iq = sum(result["iq"] for result in results) / len(results)
+
+    print(f"🧠 {games} games on {processes or os.cpu_count()} processes in {elapsed:.2f}s")
+    print(f"⚡ {games / elapsed:,.1f} games/sec | {ticks / elapsed:,.0f} ticks/sec")
+    print(f"📊 Average IQ: {average_iq:.1f} | Best IQ: {best['iq']} (seed {best['seed']}, {best['level']})")
+
+if __name__ == "__main__":
+    main()
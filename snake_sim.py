@@ -0,0 +1,323 @@
+"""
+AI Training Snake - Headless Simulation Core
+The game rules without pygame: run bots, tests and batch simulations
+on machines with no display at all.
+"""
+
+import random
+import sys
+import time
+from collections import deque
+from enum import Enum
+
+# Default board (matches the 800x800 classic edition)
+GRID_WIDTH = 40
+GRID_HEIGHT = 40
+
+# Colors (plain tuples so renderers can use them directly)
+GREEN = (0, 255, 0)
+YELLOW = (255, 215, 0)
+RED = (255, 50, 50)
+
+# Directions
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+DIRECTIONS = (UP, RIGHT, DOWN, LEFT)
+
+class DataType(Enum):
+    BASIC = ("Basic Data", GREEN, 1, 0.7)
+    QUALITY = ("Quality Data", YELLOW, 3, 0.2)
+    PREMIUM = ("Premium Data", RED, 10, 0.1)
+
+class AILevel(Enum):
+    BASIC_CHATBOT = (0, "Basic Chatbot", (100, 100, 255))
+    LANGUAGE_MODEL = (25, "Language Model", (150, 100, 255))
+    MULTIMODAL_AI = (75, "Multimodal AI", (200, 100, 255))
+    AGI_CANDIDATE = (150, "AGI Candidate", (255, 100, 200))
+    SUPER_INTELLIGENCE = (300, "Super Intelligence", (255, 255, 255))
+
+def split_seed(seed):
+    """One game seed -> (gameplay, cosmetic) seeds for separate RNG streams"""
+    seeder = random.Random(seed)
+    return seeder.getrandbits(64), seeder.getrandbits(64)
+
+def move_interval(iq, base_speed=150, per_iq=3, max_bonus=100, min_interval=60):
+    """Milliseconds between moves - the AI gets faster as it learns"""
+    speed_increase = min(iq * per_iq, max_bonus)
+    return max(min_interval, base_speed - speed_increase)
+
+class FreeCells:
+    """Empty grid cells with O(1) add, remove and uniform random pick"""
+
+    def __init__(self, width, height):
+        self.cells = [(x, y) for x in range(width) for y in range(height)]
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+
+    def __len__(self):
+        return len(self.cells)
+
+    def copy(self):
+        """Independent copy (cheaper than rebuilding an empty board)"""
+        clone = FreeCells.__new__(FreeCells)
+        clone.cells = self.cells.copy()
+        clone.index = self.index.copy()
+        return clone
+
+    def add(self, cell):
+        """Mark a cell as empty"""
+        if cell not in self.index:
+            self.index[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def remove(self, cell):
+        """Mark a cell as taken (off-board cells are ignored)"""
+        i = self.index.pop(cell, None)
+        if i is None:
+            return
+        # Swap the last cell into the hole so removal stays O(1)
+        last = self.cells.pop()
+        if i < len(self.cells):
+            self.cells[i] = last
+            self.index[last] = i
+
+    def choice(self, rng=random):
+        """Uniformly random empty cell"""
+        return self.cells[rng.randrange(len(self.cells))]
+
+class AISnake:
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        self.empty_board = FreeCells(width, height)
+        self.reset()
+
+    def reset(self):
+        """Reset snake to initial state"""
+        self.body = deque([(self.width // 2, self.height // 2)])
+        self.occupied = set(self.body)
+        self.hit_self = False
+        self.free_cells = self.empty_board.copy()
+        self.free_cells.remove(self.body[0])
+        self.direction = RIGHT
+        self.iq = 0
+        self.growth_pending = 0
+        self.level = AILevel.BASIC_CHATBOT
+        self.data_consumed = 0
+        self.premium_consumed = 0
+
+    def move(self):
+        """Move snake forward"""
+        head = self.body[0]
+        new_head = (head[0] + self.direction[0], head[1] + self.direction[1])
+
+        # Only remove tail if not growing
+        if self.growth_pending > 0:
+            self.growth_pending -= 1
+        else:
+            tail = self.body.pop()
+            self.occupied.discard(tail)
+            self.free_cells.add(tail)
+
+        # Tail moves out first, so following it is not a collision
+        self.hit_self = new_head in self.occupied
+        self.occupied.add(new_head)
+        self.free_cells.remove(new_head)
+        self.body.appendleft(new_head)
+
+    def grow(self, segments=1):
+        """Add growth to snake"""
+        self.growth_pending += segments
+
+    def change_direction(self, new_direction):
+        """Change direction, preventing reverse moves"""
+        if (new_direction[0] != -self.direction[0] or
+            new_direction[1] != -self.direction[1]):
+            self.direction = new_direction
+
+    def is_dead(self):
+        """Check if snake has died"""
+        head = self.body[0]
+
+        # Hit walls = AI hallucinated
+        if (head[0] < 0 or head[0] >= self.width or
+            head[1] < 0 or head[1] >= self.height):
+            return True
+
+        # Hit self = AI got confused
+        return self.hit_self
+
+    def get_brightness(self):
+        """Calculate snake brightness based on IQ"""
+        return min(255, 50 + self.iq * 2)
+
+    def update_level(self):
+        """Advance AI level from IQ, returns True on level up"""
+        old_level = self.level
+        for level in AILevel:
+            if self.iq >= level.value[0]:
+                self.level = level
+        return old_level != self.level
+
+class DataPoint:
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, rng=random):
+        self.width = width
+        self.height = height
+        self.rng = rng
+        self.respawn()
+
+    def respawn(self, free_cells=None):
+        """Spawn data point on an empty cell, False if the board is full"""
+        if free_cells is None:
+            self.position = (self.rng.randrange(self.width), self.rng.randrange(self.height))
+        elif free_cells:
+            self.position = free_cells.choice(self.rng)
+        else:
+            # Snake fills the board - nowhere left to spawn
+            return False
+
+        # Set data type with probabilities
+        rand = self.rng.random()
+        cumulative_prob = 0
+        for data_type in DataType:
+            cumulative_prob += data_type.value[3]
+            if rand < cumulative_prob:
+                self.type = data_type
+                break
+        else:
+            self.type = DataType.BASIC
+        return True
+
+    @property
+    def x(self):
+        return self.position[0]
+
+    @property
+    def y(self):
+        return self.position[1]
+
+    @property
+    def color(self):
+        return self.type.value[1]
+
+    @property
+    def points(self):
+        return self.type.value[2]
+
+    @property
+    def name(self):
+        return self.type.value[0]
+
+class SnakeSim:
+    """One headless game: an AISnake, a DataPoint and the tick rules"""
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None):
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.rng = random.Random()
+        self.ai_snake = AISnake(width, height)
+        self.data_point = DataPoint(width, height, self.rng)
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Start a new game, reseeding the gameplay RNG if a seed is given"""
+        if seed is not None:
+            self.seed = seed
+            self.rng.seed(split_seed(seed)[0])
+        self.ai_snake.reset()
+        self.data_point.respawn(self.ai_snake.free_cells)
+        self.ticks = 0
+        self.hungry = 0
+        self.done = False
+        self.won = False
+
+    def step(self, direction=None):
+        """Advance one move, returns the IQ points consumed this tick"""
+        if self.done:
+            return 0
+        if direction is not None:
+            self.ai_snake.change_direction(direction)
+
+        self.ai_snake.move()
+        self.ticks += 1
+        self.hungry += 1
+
+        points = 0
+        if self.ai_snake.body[0] == self.data_point.position:
+            points = self.consume_data()
+            self.hungry = 0
+
+        if self.ai_snake.is_dead():
+            self.done = True
+        return points
+
+    def consume_data(self):
+        """Apply IQ, growth and counters for the current data point"""
+        points = self.data_point.points
+
+        self.ai_snake.iq += points
+        self.ai_snake.data_consumed += 1
+        if points >= 10:
+            self.ai_snake.premium_consumed += 1
+        self.ai_snake.update_level()
+
+        # Premium data grows more
+        growth = 2 if points >= 10 else 1
+        self.ai_snake.grow(growth)
+
+        if not self.data_point.respawn(self.ai_snake.free_cells):
+            # Neural network fills the whole board - training mastered!
+            self.won = True
+            self.done = True
+        return points
+
+    def starving(self):
+        """A whole board's worth of moves without data: the game is looping"""
+        return self.hungry >= self.width * self.height
+
+    def move_interval(self):
+        """Real-time milliseconds this move would take in the pygame editions"""
+        return move_interval(self.ai_snake.iq)
+
+def replay(seed, input_log, width=GRID_WIDTH, height=GRID_HEIGHT, max_ticks=None):
+    """Re-run a recorded game from its seed and (move, direction) input log.
+
+    Each entry is applied right before move number `move`, in log order, the
+    same way the pygame editions log key presses between moves.
+    """
+    sim = SnakeSim(width, height, seed=seed)
+    inputs = iter(input_log)
+    pending = next(inputs, None)
+    while not sim.done and (max_ticks is None or sim.ticks < max_ticks):
+        while pending is not None and pending[0] <= sim.ticks:
+            sim.ai_snake.change_direction(pending[1])
+            pending = next(inputs, None)
+        sim.step()
+    return sim
+
+def main():
+    """Benchmark headless ticks per second"""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    sim = SnakeSim(seed=0)
+    wander = random.Random(0)
+    ticks = 0
+    best_iq = 0
+
+    start = time.perf_counter()
+    for game in range(games):
+        sim.reset(seed=game)
+        while not sim.done:
+            # Keep going, occasionally turn at random
+            direction = wander.choice(DIRECTIONS) if wander.random() < 0.1 else None
+            sim.step(direction)
+        ticks += sim.ticks
+        best_iq = max(best_iq, sim.ai_snake.iq)
+    elapsed = time.perf_counter() - start
+
+    print(f"🧠 {games} headless games, {ticks} ticks in {elapsed:.2f}s")
+    print(f"⚡ {ticks / elapsed:,.0f} ticks/sec | Best IQ: {best_iq}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+AI Training Snake - Agent Tournament
+Plays every agent against the same seeds across a process pool, reports
+IQ, AILevel, length and survival distributions, and caches each result by
+agent version and seed so reruns only play what is new.
+"""
+
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+from snake_sim import GRID_WIDTH, GRID_HEIGHT, DIRECTIONS, AILevel
+from snake_rollout import MAX_TICKS, greedy_policy, play_game, init_worker, worker_config, worker_pool
+
+# One JSON file of results per agent version, board size and tick limit
+TOURNAMENT_CACHE_DIR = "tournament_cache"
+
+# Search budget in positions rather than seconds, so a cached result does
+# not depend on machine load
+EXPECTIMAX_NODE_BUDGET = 1000
+
+# Settings each agent is made with, hashed into its version
+AGENT_SETTINGS = {
+    "expectimax": {"time_budget": None, "node_budget": EXPECTIMAX_NODE_BUDGET},
+}
+
+# Weights an agent loads, and the script that trains them
+WEIGHT_TRAINERS = {"qtable.npy": "snake_qlearn.py"}
+
+class RandomAgent:
+    """Uniformly random direction every tick, seeded per game"""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+
+    def __call__(self, sim):
+        return self.rng.choice(DIRECTIONS)
+
+def _make_random(width, height, seed):
+    return RandomAgent(seed)
+
+def _make_greedy(width, height, seed):
+    return greedy_policy
+
+def _make_bfs(width, height, seed):
+    from snake_autopilot import Autopilot
+    return Autopilot(width, height)
+
+def _make_field(width, height, seed):
+    from snake_field import DistanceFieldPolicy
+    return DistanceFieldPolicy(width, height)
+
+def _make_hamiltonian(width, height, seed):
+    from snake_autopilot import HamiltonianAutopilot
+    return HamiltonianAutopilot(width, height)
+
+def _make_qtable(width, height, seed):
+    from snake_qlearn import QAgent
+    return QAgent(width=width, height=height, seed=seed)
+
+def _make_expectimax(width, height, seed):
+    from snake_expectimax import ExpectimaxAutopilot
+    return ExpectimaxAutopilot(width, height, **AGENT_SETTINGS["expectimax"])
+
+# name -> (factory(width, height, seed), files the agent's play depends on
+# besides the game rules and loop). Agents are made fresh for every game, so
+# a result only depends on the seed.
+AGENTS = {
+    "random": (_make_random, ("snake_tournament.py",)),
+    "greedy": (_make_greedy, ()),
+    "field": (_make_field, ("snake_field.py",)),
+    "bfs": (_make_bfs, ("snake_autopilot.py", "snake_reach.py")),
+    "hamiltonian": (_make_hamiltonian, ("snake_autopilot.py",)),
+    "qtable": (_make_qtable, ("snake_qlearn.py", "qtable.npy")),
+    "expectimax": (_make_expectimax, ("snake_expectimax.py",)),
+}
+
+def agent_version(name):
+    """Hash of the agent's code, weights and settings (and the game rules and loop)"""
+    digest = hashlib.sha1()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for filename in ("snake_sim.py", "snake_rollout.py") + AGENTS[name][1]:
+        # Code sits next to this module, weights in the working directory
+        path = os.path.join(here, filename) if filename.endswith(".py") else filename
+        if not os.path.exists(path):
+            raise ValueError(f"agent {name!r} needs {filename}, train it first with "
+                             f"{WEIGHT_TRAINERS.get(filename, 'its training script')}")
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    digest.update(json.dumps(AGENT_SETTINGS.get(name, {}), sort_keys=True).encode())
+    return digest.hexdigest()[:12]
+
+def _cache_path(name, version, width, height, max_ticks, cache_dir):
+    return os.path.join(cache_dir, f"{name}_{version}_{width}x{height}_{max_ticks}.json")
+
+def load_results(path):
+    """Cached {seed: result} for one agent version (empty if none yet)"""
+    try:
+        with open(path) as f:
+            return {int(seed): result for seed, result in json.load(f).items()}
+    except (OSError, ValueError):
+        return {}
+
+def save_results(path, results):
+    """Write cached results atomically, so an interrupted run never corrupts them"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({str(seed): result for seed, result in sorted(results.items())}, f)
+    os.replace(tmp, path)
+
+def _play_task(task):
+    name, seed = task
+    width, height = worker_config["width"], worker_config["height"]
+    policy = AGENTS[name][0](width, height, seed)
+    return name, play_game(seed, policy, width, height, worker_config["max_ticks"])
+
+def run_tournament(agents, seeds, processes=None, width=GRID_WIDTH, height=GRID_HEIGHT,
+                   max_ticks=MAX_TICKS, cache_dir=TOURNAMENT_CACHE_DIR):
+    """Results per agent ({name: [result, ...]} in seed order), playing only
+    the (agent version, seed) games that are not cached yet"""
+    seeds = list(seeds)
+    paths, cached, tasks = {}, {}, []
+    for name in agents:
+        if name not in AGENTS:
+            raise ValueError(f"unknown agent {name!r}, choose from {', '.join(AGENTS)}")
+        paths[name] = _cache_path(name, agent_version(name), width, height, max_ticks, cache_dir)
+        cached[name] = load_results(paths[name])
+        tasks += [(name, seed) for seed in seeds if seed not in cached[name]]
+
+    config = {"width": width, "height": height, "max_ticks": max_ticks}
+    processes = processes or os.cpu_count() or 1
+    if tasks:
+        if processes == 1:
+            init_worker(config)
+            played = map(_play_task, tasks)
+        else:
+            pool = worker_pool(processes, config)
+            played = pool.imap_unordered(_play_task, tasks, chunksize=4)
+        try:
+            for count, (name, result) in enumerate(played, 1):
+                cached[name][result["seed"]] = result
+                # Save as we go, so an interrupted tournament keeps its games
+                if count % 100 == 0:
+                    for agent in agents:
+                        save_results(paths[agent], cached[agent])
+        finally:
+            if processes > 1:
+                pool.close()
+                pool.join()
+            for name in agents:
+                save_results(paths[name], cached[name])
+
+    return {name: [cached[name][seed] for seed in seeds] for name in agents}, len(tasks)
+
+def summarize(results):
+    """Distribution of IQ, length and ticks, plus AILevel counts, for one agent"""
+    summary = {"games": len(results), "won": sum(result["won"] for result in results)}
+    for key in ("iq", "length", "ticks"):
+        values = np.array([result[key] for result in results])
+        summary[key] = {
+            "mean": float(values.mean()),
+            "min": int(values.min()),
+            "p10": float(np.percentile(values, 10)),
+            "median": float(np.median(values)),
+            "p90": float(np.percentile(values, 90)),
+            "max": int(values.max()),
+        }
+    summary["levels"] = Counter(result["level"] for result in results)
+    return summary
+
+def print_report(summaries):
+    """One table per metric, agents as rows"""
+    for key, title in (("iq", "🧠 IQ"), ("length", "🐍 Length"), ("ticks", "⏱️ Ticks survived")):
+        print(f"\n{title}")
+        print(f"{'agent':<12} {'mean':>9} {'min':>7} {'p10':>8} {'median':>8} {'p90':>8} {'max':>7}")
+        for name, summary in summaries.items():
+            stats = summary[key]
+            print(f"{name:<12} {stats['mean']:9.1f} {stats['min']:7d} {stats['p10']:8.1f} "
+                  f"{stats['median']:8.1f} {stats['p90']:8.1f} {stats['max']:7d}")
+
+    print("\n🏆 AILevel reached")
+    for name, summary in summaries.items():
+        levels = ", ".join(f"{level.value[1]} {summary['levels'][level.value[1]]}"
+                           for level in AILevel if summary["levels"][level.value[1]])
+        print(f"{name:<12} {levels} | boards filled: {summary['won']}/{summary['games']}")
+
+def main():
+    """Tournament from the command line: seeds, agents, processes, width, height"""
+    seeds = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    agents = sys.argv[2].split(",") if len(sys.argv) > 2 else ["random", "greedy", "bfs"]
+    processes = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    width = int(sys.argv[4]) if len(sys.argv) > 4 else GRID_WIDTH
+    height = int(sys.argv[5]) if len(sys.argv) > 5 else GRID_HEIGHT
+
+    start = time.perf_counter()
+    try:
+        results, played = run_tournament(agents, range(seeds), processes, width, height)
+    except ValueError as error:
+        print(f"❌ {error}")
+        return
+    elapsed = time.perf_counter() - start
+
+    print(f"🏟️ {len(agents)} agents x {seeds} seeds on {width}x{height}: "
+          f"{played} games played, {len(agents) * seeds - played} from cache, {elapsed:.2f}s")
+    print_report({name: summarize(agent_results) for name, agent_results in results.items()})
+
+if __name__ == "__main__":
+    main()